@@ -0,0 +1,223 @@
+# Backend/aggregates.py
+"""
+Incremental per-user rollups (models.UserDailyStats / models.UserStats)
+behind GET /leaderboard.
+
+Every write path that creates or removes shoutouts, recipients or reactions
+adds its delta here in the same transaction, as INSERT ... SELECT ...
+ON CONFLICT DO UPDATE SET col = col + excluded.col, so reads cost the same
+however long the history is. Days are the shoutout's created_at date, so a
+delete subtracts from exactly the bucket the insert added to.
+
+The *_statements builders are shared with the async routers; the record_*
+helpers execute them on a sync Session.
+
+Rebuild everything from the base tables with:
+
+    python -m Backend.aggregates
+"""
+from typing import Iterable, List
+
+from sqlalchemy import case, delete, func, literal, select, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from . import models
+from .database import SessionLocal, engine
+
+Shoutout = models.Shoutout
+
+REACTION_STATS = {
+    models.ReactionType.like: "like_received",
+    models.ReactionType.clap: "clap_received",
+    models.ReactionType.star: "star_received",
+}
+
+
+def _day(column):
+    return func.date(column)
+
+
+def _upsert_statements(db, source, columns: List[str]) -> list:
+    """
+    Add the rows of `source` - (user_id, day, *columns) - to user_daily_stats
+    and their per-user sums to user_stats.
+    """
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    src = source.subquery()
+
+    # WHERE true: SQLite needs it to parse INSERT ... SELECT ... ON CONFLICT
+    daily = insert(models.UserDailyStats).from_select(
+        ["user_id", "day", *columns],
+        select(src.c.user_id, src.c.day, *[src.c[c] for c in columns]).where(true()),
+    )
+    daily = daily.on_conflict_do_update(
+        index_elements=["user_id", "day"],
+        set_={c: getattr(models.UserDailyStats, c) + daily.excluded[c] for c in columns},
+    )
+
+    totals = insert(models.UserStats).from_select(
+        ["user_id", *columns],
+        select(src.c.user_id, *[func.sum(src.c[c]) for c in columns])
+        .where(true())
+        .group_by(src.c.user_id),
+    )
+    totals = totals.on_conflict_do_update(
+        index_elements=["user_id"],
+        set_={c: getattr(models.UserStats, c) + totals.excluded[c] for c in columns},
+    )
+    return [daily, totals]
+
+
+# -----------------------------
+# 📊 Sources (rows of deltas)
+# -----------------------------
+def _sent(sign: int, *where):
+    return (
+        select(
+            Shoutout.sender_id.label("user_id"),
+            _day(Shoutout.created_at).label("day"),
+            (func.count() * sign).label("sent_count"),
+        )
+        .where(Shoutout.sender_id.isnot(None), *where)
+        .group_by(Shoutout.sender_id, _day(Shoutout.created_at))
+    )
+
+
+def _received(sign: int, *where):
+    R = models.ShoutoutRecipient
+    return (
+        select(
+            R.recipient_id.label("user_id"),
+            _day(Shoutout.created_at).label("day"),
+            (func.count() * sign).label("received_count"),
+        )
+        .join(Shoutout, Shoutout.id == R.shoutout_id)
+        .join(models.User, models.User.id == R.recipient_id)   # skip rows orphaned where FKs aren't enforced
+        .where(*where)
+        .group_by(R.recipient_id, _day(Shoutout.created_at))
+    )
+
+
+def _reactions_on(sign: int, *where):
+    # Uses the denormalized counters on the shoutouts (see counters.py)
+    return (
+        select(
+            Shoutout.sender_id.label("user_id"),
+            _day(Shoutout.created_at).label("day"),
+            (func.sum(Shoutout.like_count) * sign).label("like_received"),
+            (func.sum(Shoutout.clap_count) * sign).label("clap_received"),
+            (func.sum(Shoutout.star_count) * sign).label("star_received"),
+        )
+        .where(Shoutout.sender_id.isnot(None), *where)
+        .group_by(Shoutout.sender_id, _day(Shoutout.created_at))
+    )
+
+
+# -----------------------------
+# ➕ Incremental Updates
+# -----------------------------
+def shoutout_statements(db, shoutout_ids: Iterable[int], sign: int = 1) -> list:
+    """
+    Deltas for shoutouts being created (sign=1, after their recipients are
+    inserted) or deleted (sign=-1, before the DELETE; also removes the
+    reactions they had received).
+    """
+    ids = list(shoutout_ids)
+    if not ids:
+        return []
+    in_ids = Shoutout.id.in_(ids)
+    statements = (
+        _upsert_statements(db, _sent(sign, in_ids), ["sent_count"])
+        + _upsert_statements(db, _received(sign, in_ids), ["received_count"])
+    )
+    if sign < 0:
+        statements += _upsert_statements(
+            db, _reactions_on(sign, in_ids), ["like_received", "clap_received", "star_received"]
+        )
+    return statements
+
+
+def reaction_statements(db, shoutout_id: int, reaction_type: models.ReactionType, delta: int) -> list:
+    """
+    Credit (or take back) a reaction to the shoutout's sender.
+    """
+    column = REACTION_STATS[reaction_type]
+    source = select(
+        Shoutout.sender_id.label("user_id"),
+        _day(Shoutout.created_at).label("day"),
+        literal(delta).label(column),
+    ).where(Shoutout.id == shoutout_id, Shoutout.sender_id.isnot(None))
+    return _upsert_statements(db, source, [column])
+
+
+def record_shoutouts(db: Session, shoutout_ids: Iterable[int], sign: int = 1) -> None:
+    for stmt in shoutout_statements(db, shoutout_ids, sign):
+        db.execute(stmt)
+
+
+def record_reaction(db: Session, shoutout_id: int, reaction_type: models.ReactionType, delta: int) -> None:
+    if delta:
+        for stmt in reaction_statements(db, shoutout_id, reaction_type, delta):
+            db.execute(stmt)
+
+
+def forget_user(db: Session, user_id: int) -> None:
+    """
+    Call before deleting a user: takes their sent shoutouts and their
+    reactions out of other users' rollups and drops their own rows.
+    """
+    sent_ids = [sid for (sid,) in db.execute(select(Shoutout.id).where(Shoutout.sender_id == user_id))]
+    record_shoutouts(db, sent_ids, -1)
+
+    R = models.Reaction
+    reactions_given = (
+        select(
+            Shoutout.sender_id.label("user_id"),
+            _day(Shoutout.created_at).label("day"),
+            *[
+                (-func.sum(case((R.type == reaction_type, 1), else_=0))).label(column)
+                for reaction_type, column in REACTION_STATS.items()
+            ],
+        )
+        .join(Shoutout, Shoutout.id == R.shoutout_id)
+        .where(R.user_id == user_id, Shoutout.sender_id != user_id)
+        .group_by(Shoutout.sender_id, _day(Shoutout.created_at))
+    )
+    for stmt in _upsert_statements(db, reactions_given, list(REACTION_STATS.values())):
+        db.execute(stmt)
+
+    # FK cascades would do this on Postgres; SQLite doesn't enforce them by default
+    db.execute(delete(models.UserDailyStats).where(models.UserDailyStats.user_id == user_id))
+    db.execute(delete(models.UserStats).where(models.UserStats.user_id == user_id))
+
+
+# -----------------------------
+# 🔁 Full Rebuild
+# -----------------------------
+def rebuild(db: Session) -> int:
+    """
+    Recompute both rollup tables from shoutouts, recipients and the
+    shoutout reaction counters. Returns the number of user_stats rows.
+    """
+    db.execute(delete(models.UserDailyStats))
+    db.execute(delete(models.UserStats))
+    for stmt in (
+        _upsert_statements(db, _sent(1), ["sent_count"])
+        + _upsert_statements(db, _received(1), ["received_count"])
+        + _upsert_statements(db, _reactions_on(1), ["like_received", "clap_received", "star_received"])
+    ):
+        db.execute(stmt)
+    return db.execute(select(func.count()).select_from(models.UserStats)).scalar()
+
+
+if __name__ == "__main__":
+    models.Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        rows = rebuild(db)
+        db.commit()
+        print(f"Rebuilt rollups for {rows} users")
+    finally:
+        db.close()
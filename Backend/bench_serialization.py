@@ -0,0 +1,121 @@
+# Backend/bench_serialization.py
+"""
+Micro-benchmark: time to turn 1,000 feed items into a JSON body.
+
+    before    pydantic ShoutoutResponse per row, re-validated against the
+              response_model, then jsonable_encoder + json.dumps (what the
+              feed did before serialization.py)
+    after     to_response() dict projection + json.dumps
+    orjson    to_response() dict projection + orjson.dumps (FAST_JSON=true)
+
+The rows are transient ORM objects, so no database is touched:
+
+    python -m Backend.bench_serialization [items] [rounds]
+"""
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from . import models, schemas
+from .routers.shoutouts import to_response
+from .serialization import orjson
+
+
+def make_rows(n: int) -> List[models.Shoutout]:
+    users = [
+        models.User(
+            id=i, name=f"User {i}", email=f"user{i}@example.com",
+            department=f"Dept {i % 7}", role=models.UserRole.employee,
+        )
+        for i in range(1, 51)
+    ]
+    start = datetime(2024, 1, 1, 9, 30, 15, 123456)
+    rows = []
+    for i in range(n):
+        s = models.Shoutout(
+            id=i + 1,
+            message=f"Thanks for the help with release {i}! " * 3,
+            created_at=start + timedelta(minutes=i),
+            comments_count=i % 5,
+            like_count=i % 11, clap_count=i % 3, star_count=i % 2,
+        )
+        s.sender = users[i % len(users)]
+        s.recipients = [
+            models.ShoutoutRecipient(recipient=users[(i + k) % len(users)])
+            for k in range(1, 4)
+        ]
+        rows.append(s)
+    return rows
+
+
+def _pydantic_item(s: models.Shoutout) -> schemas.ShoutoutResponse:
+    # The feed's per-row model construction before the dict projection
+    return schemas.ShoutoutResponse(
+        id=s.id,
+        message=s.message,
+        sender=s.sender,
+        created_at=s.created_at,
+        recipients=[
+            schemas.RecipientOut(
+                id=r.recipient.id,
+                name=r.recipient.name,
+                department=r.recipient.department,
+            ) for r in s.recipients
+        ],
+        comments_count=s.comments_count,
+        reactions=schemas.ReactionSummary(
+            like=s.like_count, clap=s.clap_count, star=s.star_count,
+        ),
+        my_reactions=[],
+    )
+
+
+_response_model = TypeAdapter(List[schemas.ShoutoutResponse])
+
+
+def before(rows) -> bytes:
+    items = [_pydantic_item(s) for s in rows]
+    validated = _response_model.validate_python(items, from_attributes=True)
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def after(rows) -> bytes:
+    return json.dumps([to_response(s) for s in rows]).encode()
+
+
+def after_orjson(rows) -> bytes:
+    return orjson.dumps([to_response(s) for s in rows])
+
+
+def _best_ms(fn, rows, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main(items: int = 1000, rounds: int = 20) -> None:
+    rows = make_rows(items)
+    assert json.loads(before(rows)) == json.loads(after(rows)), "projection differs from the schema"
+
+    cases = [("before", before), ("after", after)]
+    if orjson is not None:
+        cases.append(("orjson", after_orjson))
+
+    baseline = None
+    print(f"{items} feed items, best of {rounds} rounds")
+    for name, fn in cases:
+        ms = _best_ms(fn, rows, rounds)
+        baseline = baseline or ms
+        print(f"  {name:<8} {ms:8.2f} ms   {ms * 1000 / items:7.1f} us/item   x{baseline / ms:.1f}")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
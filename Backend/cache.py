@@ -0,0 +1,141 @@
+# Backend/cache.py
+"""
+Small key/value cache with pluggable backends.
+
+    MemoryCache  - bounded, thread-safe TTL + LRU cache (per process)
+    RedisCache   - any Redis-protocol server; needs the optional `redis` package
+
+make_cache() picks the backend from CACHE_BACKEND ("memory" | "redis") and
+REDIS_URL. Values must be JSON-serialisable so both backends behave the same.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+class CacheBackend:
+    """
+    Interface shared by all backends. Every backend counts hits and misses.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def _record(self, value):
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "name": self.name,
+            "backend": type(self).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+class MemoryCache(CacheBackend):
+    def __init__(self, name: str, max_size: int = 10000, ttl: float = 60):
+        super().__init__(name)
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()   # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._data[key]
+                entry = None
+            if entry is not None:
+                self._data.move_to_end(key)
+            return self._record(entry[1] if entry else None)
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        return {**super().stats(), "size": len(self._data), "max_size": self.max_size}
+
+
+class RedisCache(CacheBackend):
+    def __init__(self, name: str, url: str = REDIS_URL, ttl: float = 60):
+        super().__init__(name)
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package")
+        self.ttl = ttl
+        self._client = redis.Redis.from_url(url)
+        self._prefix = f"bragboard:{name}:"
+
+    def get(self, key):
+        raw = self._client.get(self._prefix + key)
+        return self._record(json.loads(raw) if raw is not None else None)
+
+    def set(self, key, value, ttl=None):
+        self._client.set(
+            self._prefix + key,
+            json.dumps(value),
+            px=int((self.ttl if ttl is None else ttl) * 1000),
+        )
+
+    def delete(self, key):
+        self._client.delete(self._prefix + key)
+
+    def clear(self):
+        for key in self._client.scan_iter(match=self._prefix + "*"):
+            self._client.delete(key)
+
+
+def make_cache(name: str, max_size: int = 10000, ttl: float = 60,
+               backend: Optional[str] = None) -> CacheBackend:
+    """
+    Build a named cache using `backend`, or the configured CACHE_BACKEND.
+    """
+    if (backend or CACHE_BACKEND) == "redis":
+        return RedisCache(name, ttl=ttl)
+    return MemoryCache(name, max_size=max_size, ttl=ttl)
@@ -0,0 +1,196 @@
+# Backend/counters.py
+"""
+Denormalized per-shoutout counters (comments, reactions by type, reports).
+
+Write paths call bump() inside their own transaction so the counter moves
+together with the row it counts. recompute() rebuilds the counters from the
+source tables. Running the module is the repair/backfill command: it adds
+missing counter (and other later-added integer) columns, moves created_at
+onto UTC defaults (ensure_utc_timestamps), removes duplicate reactions,
+creates any missing indexes and then recomputes every counter:
+
+    python -m Backend.counters
+"""
+from typing import Iterable, Optional
+
+from sqlalchemy import func, inspect, select, text, update
+from sqlalchemy.orm import Session
+
+from . import models
+from .database import SessionLocal, engine
+
+Shoutout = models.Shoutout
+
+REACTION_COUNTERS = {
+    models.ReactionType.like: Shoutout.like_count,
+    models.ReactionType.clap: Shoutout.clap_count,
+    models.ReactionType.star: Shoutout.star_count,
+}
+
+# created_at columns defaulting to models.utc_now()
+UTC_TIMESTAMP_TABLES = (
+    Shoutout.__tablename__, models.Comment.__tablename__, models.Report.__tablename__,
+)
+
+# Integer columns added to existing tables after their first release;
+# ensure_columns() adds any that an older database is missing
+ADDED_INTEGER_COLUMNS = {
+    Shoutout.__tablename__: (
+        "comments_count", "like_count", "clap_count", "star_count", "reports_count",
+    ),
+    models.User.__tablename__: ("token_version",),
+}
+
+
+# -----------------------------
+# ➕ Incremental Updates
+# -----------------------------
+def bump_statement(shoutout_id: int, column, delta: int = 1):
+    """
+    UPDATE shoutouts SET c = c + delta WHERE id = ... (atomic in the database).
+    """
+    return (
+        update(Shoutout)
+        .where(Shoutout.id == shoutout_id)
+        .values({column: column + delta})
+        .execution_options(synchronize_session=False)
+    )
+
+
+def bump(db: Session, shoutout_id: int, column, delta: int = 1) -> None:
+    """
+    Atomically add `delta` to a counter column. Does not commit; the
+    caller's commit makes it visible with its own write. Async callers
+    execute bump_statement() on their AsyncSession instead.
+    """
+    db.execute(bump_statement(shoutout_id, column, delta))
+
+
+def reaction_counter(reaction_type: models.ReactionType):
+    return REACTION_COUNTERS[models.ReactionType(reaction_type)]
+
+
+# -----------------------------
+# 🔁 Bulk Recompute / Repair
+# -----------------------------
+def _count(model, fk, *criteria):
+    return (
+        select(func.count(model.id))
+        .where(fk == Shoutout.id, *criteria)
+        .scalar_subquery()
+    )
+
+
+def recompute(db: Session, shoutout_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    Recompute every counter from the source tables in a single UPDATE.
+    Restricted to `shoutout_ids` when given. Returns the number of rows updated.
+    """
+    values = {
+        Shoutout.comments_count: _count(models.Comment, models.Comment.shoutout_id),
+        Shoutout.reports_count: _count(models.Report, models.Report.shoutout_id),
+    }
+    for reaction_type, column in REACTION_COUNTERS.items():
+        values[column] = _count(
+            models.Reaction, models.Reaction.shoutout_id,
+            models.Reaction.type == reaction_type,
+        )
+
+    query = db.query(Shoutout)
+    if shoutout_ids is not None:
+        shoutout_ids = list(shoutout_ids)
+        if not shoutout_ids:
+            return 0
+        query = query.filter(Shoutout.id.in_(shoutout_ids))
+
+    return query.update(values, synchronize_session=False)
+
+
+def ensure_columns() -> None:
+    """
+    Add any missing ADDED_INTEGER_COLUMNS to existing tables
+    (create_all only creates missing tables, not missing columns).
+    """
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table, columns in ADDED_INTEGER_COLUMNS.items():
+            existing = {c["name"] for c in inspector.get_columns(table)}
+            for name in columns:
+                if name not in existing:
+                    conn.execute(text(
+                        f"ALTER TABLE {table} "
+                        f"ADD COLUMN {name} INTEGER NOT NULL DEFAULT 0"
+                    ))
+
+
+def ensure_utc_timestamps() -> None:
+    """
+    Move a database created before models.utc_now onto UTC created_at.
+
+    Postgres: the column default changes from now() (server-local time) to
+    timezone('utc', now()). Rows already written under a non-UTC server
+    TimeZone are not touched, because nothing records which rows those
+    are; convert them once, by hand, with
+
+        UPDATE <table> SET created_at =
+            (created_at AT TIME ZONE '<old TimeZone>') AT TIME ZONE 'UTC'
+        WHERE created_at < '<time of the upgrade>';
+
+    SQLite: CURRENT_TIMESTAMP was already UTC but whole seconds; those rows
+    are rewritten in the microsecond form the keyset cursors compare with.
+    """
+    dialect = engine.dialect.name
+    with engine.begin() as conn:
+        for table in UTC_TIMESTAMP_TABLES:
+            if dialect == "postgresql":
+                conn.execute(text(
+                    f"ALTER TABLE {table} "
+                    f"ALTER COLUMN created_at SET DEFAULT timezone('utc', now())"
+                ))
+            elif dialect == "sqlite":
+                conn.execute(text(
+                    f"UPDATE {table} "
+                    f"SET created_at = strftime('%Y-%m-%d %H:%M:%f000', created_at) "
+                    f"WHERE length(created_at) = 19"
+                ))
+
+
+def dedupe_reactions(db: Session) -> int:
+    """
+    Delete duplicate (shoutout_id, user_id, type) reactions, keeping the
+    oldest row, so the unique index on reactions can be created.
+    """
+    R = models.Reaction
+    keep = (
+        select(func.min(R.id))
+        .group_by(R.shoutout_id, R.user_id, R.type)
+    )
+    return db.query(R).filter(R.id.not_in(keep)).delete(synchronize_session=False)
+
+
+def ensure_indexes() -> None:
+    """
+    Create indexes declared on the models that an existing database lacks
+    (create_all skips indexes of tables that already exist).
+    """
+    for table in models.Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+if __name__ == "__main__":
+    ensure_columns()
+    ensure_utc_timestamps()
+    db = SessionLocal()
+    try:
+        removed = dedupe_reactions(db)
+        db.commit()
+        print(f"Removed {removed} duplicate reactions")
+
+        ensure_indexes()
+
+        updated = recompute(db)
+        db.commit()
+        print(f"Recomputed counters for {updated} shoutouts")
+    finally:
+        db.close()
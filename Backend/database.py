@@ -1,19 +1,315 @@
 import os
-from sqlalchemy import create_engine
+import threading
+import time
+from fastapi import Request, Response
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import QueuePool
 from dotenv import load_dotenv
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
-engine = create_engine(DATABASE_URL)
+
+# Optional read replica: GET requests are served from it unless the
+# client wrote something in the last READ_YOUR_WRITES_SECONDS
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+READ_YOUR_WRITES_SECONDS = int(os.getenv("READ_YOUR_WRITES_SECONDS", 5))
+
+# -----------------------------
+# ⚙️ Engine / Pool Settings
+# -----------------------------
+# Size the pool to the number of threads that can hold a session at once
+# (Starlette's threadpool defaults to 40); check /metrics for waits.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))          # seconds
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", -1))            # seconds, -1 = never
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 0))  # Postgres, 0 = off
+DB_EXECUTEMANY_MODE = os.getenv("DB_EXECUTEMANY_MODE")             # psycopg2 only
+
+# Async path: serve the hot read/write endpoints from AsyncSession-based
+# routers (routers/async_*.py) over asyncpg / aiosqlite
+DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() in ("1", "true", "yes")
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+
+
+class PoolStats:
+    """
+    Checkout counters for TimedQueuePool, including time spent waiting
+    for a free connection.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def observe(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(1000 * self.wait_seconds / self.checkouts, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(1000 * self.max_wait_seconds, 3),
+            }
+
+
+pool_stats = PoolStats()
+replica_pool_stats = PoolStats()
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that records how long each checkout waited.
+    """
+
+    stats = pool_stats
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except Exception:
+            self.stats.observe(time.perf_counter() - started, timed_out=True)
+            raise
+        self.stats.observe(time.perf_counter() - started)
+        return conn
+
+
+class ReplicaTimedQueuePool(TimedQueuePool):
+    stats = replica_pool_stats
+
+
+def _engine_options(url: str, poolclass=TimedQueuePool) -> dict:
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+
+    # In-memory SQLite keeps a single connection per thread; pool settings don't apply
+    if backend == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+
+    options = {
+        "poolclass": poolclass,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    if backend == "postgresql":
+        if DB_STATEMENT_TIMEOUT_MS:
+            options["connect_args"] = {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"}
+        if DB_EXECUTEMANY_MODE and parsed.get_driver_name() == "psycopg2":
+            options["executemany_mode"] = DB_EXECUTEMANY_MODE
+    return options
+
+
+def _enforce_foreign_keys(bind) -> None:
+    """
+    SQLite leaves foreign keys (and ON DELETE CASCADE) unenforced unless
+    every connection turns them on. No-op for other backends.
+    """
+    if bind.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(bind, "connect")
+    def _foreign_keys_on(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+engine = create_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
+_enforce_foreign_keys(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
+
+# -----------------------------
+# 📖 Read Replica (optional)
+# -----------------------------
+replica_engine = None
+ReplicaSessionLocal = None
+
+if DATABASE_REPLICA_URL:
+    replica_engine = create_engine(
+        DATABASE_REPLICA_URL,
+        **_engine_options(DATABASE_REPLICA_URL, poolclass=ReplicaTimedQueuePool),
+    )
+    _enforce_foreign_keys(replica_engine)
+    ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+
+
+# Read-your-writes: every write response sets a cookie holding the time
+# until which the client's reads stay on the primary, plus an
+# X-Read-Primary header with the window in seconds. Clients that don't
+# keep cookies send X-Read-Primary back on reads within that window.
+STICKY_PRIMARY_COOKIE = "bb_primary_until"
+STICKY_PRIMARY_HEADER = "X-Read-Primary"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def _sticky_primary(request: Request) -> bool:
+    if STICKY_PRIMARY_HEADER in request.headers:
+        return True
+    try:
+        return float(request.cookies.get(STICKY_PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def _mark_write(response: Response):
+    until = time.time() + READ_YOUR_WRITES_SECONDS
+    response.set_cookie(
+        STICKY_PRIMARY_COOKIE, f"{until:.3f}",
+        max_age=READ_YOUR_WRITES_SECONDS, httponly=True, samesite="lax",
+    )
+    response.headers[STICKY_PRIMARY_HEADER] = str(READ_YOUR_WRITES_SECONDS)
+
+
+def use_replica(request: Request, response: Response) -> bool:
+    """
+    True if this request may read from the replica: it is a GET/HEAD,
+    a replica is configured and the client has no recent write.
+    Marks write requests so the client's next reads go to the primary.
+    """
+    if request.method not in SAFE_METHODS:
+        if READ_YOUR_WRITES_SECONDS > 0:
+            _mark_write(response)
+        return False
+    return not _sticky_primary(request)
+
+
+# -----------------------------
+# ⚡ Async Engine (optional)
+# -----------------------------
+# Only the backends the rest of the app supports (the rollup upserts and
+# search are Postgres/SQLite-specific); anything else fails at startup
+# rather than falling back to the sync routers.
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def _async_url(url: str) -> str:
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise RuntimeError(
+            f"DB_ASYNC is not supported for {parsed.get_backend_name()} "
+            f"(supported: {', '.join(ASYNC_DRIVERS)}); set ASYNC_DATABASE_URL or unset DB_ASYNC"
+        )
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def _async_engine_options(url: str) -> dict:
+    options = _engine_options(url)
+    options.pop("poolclass", None)   # async engines use AsyncAdaptedQueuePool
+    options.pop("executemany_mode", None)
+    if "connect_args" in options:
+        # asyncpg takes server settings instead of a libpq options string
+        options["connect_args"] = {
+            "server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+        }
+    return options
+
+
+async_engine = None
+AsyncSessionLocal = None
+async_replica_engine = None
+AsyncReplicaSessionLocal = None
+
+if DB_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    ASYNC_DATABASE_URL = ASYNC_DATABASE_URL or _async_url(DATABASE_URL)
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL, **_async_engine_options(ASYNC_DATABASE_URL)
+    )
+    _enforce_foreign_keys(async_engine.sync_engine)
+    # expire_on_commit=False: attribute access after commit must not do implicit IO
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
+    if DATABASE_REPLICA_URL:
+        async_replica_url = _async_url(DATABASE_REPLICA_URL)
+        async_replica_engine = create_async_engine(
+            async_replica_url, **_async_engine_options(async_replica_url)
+        )
+        _enforce_foreign_keys(async_replica_engine.sync_engine)
+        AsyncReplicaSessionLocal = async_sessionmaker(
+            async_replica_engine, autoflush=False, expire_on_commit=False
+        )
+
+
+def _pool_snapshot(pool) -> dict:
+    stats = {"pool_class": type(pool).__name__}
+    if isinstance(pool, TimedQueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": DB_MAX_OVERFLOW,
+            **pool.stats.snapshot(),
+        })
+    return stats
+
+
+def _async_pool_snapshot(pool) -> dict:
+    return {"pool_class": type(pool).__name__, "status": pool.status()}
+
+
+def get_pool_stats() -> dict:
+    stats = _pool_snapshot(engine.pool)
+    if replica_engine is not None:
+        stats["replica"] = _pool_snapshot(replica_engine.pool)
+    if async_engine is not None:
+        stats["async"] = _async_pool_snapshot(async_engine.pool)
+    if async_replica_engine is not None:
+        stats["async_replica"] = _async_pool_snapshot(async_replica_engine.pool)
+    return stats
+
+
+def read_from_replica(request: Request) -> bool:
+    """
+    True if get_db/get_async_db handed this request a replica session.
+    Data read there may lag the primary, so it must not be cached.
+    """
+    return getattr(request.state, "read_replica", False)
+
+
+def get_db(request: Request, response: Response):
+    """
+    Session on the replica for reads (see use_replica), else the primary.
+    """
+    request.state.read_replica = ReplicaSessionLocal is not None and use_replica(request, response)
+    db = ReplicaSessionLocal() if request.state.read_replica else SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db(request: Request, response: Response):
+    request.state.read_replica = AsyncReplicaSessionLocal is not None and use_replica(request, response)
+    session_factory = AsyncReplicaSessionLocal if request.state.read_replica else AsyncSessionLocal
+    async with session_factory() as db:
+        yield db
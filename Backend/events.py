@@ -0,0 +1,167 @@
+# Backend/events.py
+"""
+Publish/subscribe hub for live feed events (GET /stream).
+
+    InProcessHub - fans events out to the subscribers of this process
+    RedisHub     - relays through Redis pub/sub so every worker process
+                   sees every event; needs the optional `redis` package
+
+make_hub() picks the backend from EVENT_BACKEND ("memory" | "redis").
+Write handlers call publish() after committing; payloads are passed
+through jsonable_encoder so both backends carry the same JSON.
+
+Event types:
+    shoutout.created   full ShoutoutResponse (my_reactions empty)
+    shoutout.deleted   {id}
+    comment.created    {shoutout_id, comments_count, comment}
+    comment.deleted    {id, shoutout_id}
+    reaction.updated   {shoutout_id, type, count, user_id, active}
+    feed.invalidated   {} - too much changed for a delta; refetch
+"""
+import asyncio
+import itertools
+import json
+import os
+import threading
+from typing import Optional
+
+from dotenv import load_dotenv
+from fastapi.encoders import jsonable_encoder
+
+load_dotenv()
+
+EVENT_BACKEND = os.getenv("EVENT_BACKEND", "memory")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", 256))
+
+
+class Subscription:
+    """
+    One connected client. Events are queued on the client's event loop;
+    a client that falls STREAM_QUEUE_SIZE events behind is closed so it
+    reconnects and refetches instead of silently missing deltas.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue_size: int):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.closed = False
+
+    def offer(self, event: dict) -> bool:
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.closed = True
+            return False
+
+    async def get(self, timeout: float) -> Optional[dict]:
+        """
+        Next event, or None after `timeout` seconds or once closed.
+        """
+        if self.closed:
+            return None
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class InProcessHub:
+    def __init__(self, queue_size: int = STREAM_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.published = 0
+        self.dropped = 0
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def publish(self, event_type: str, data: dict) -> None:
+        self._deliver({"id": next(self._ids), "type": event_type, "data": jsonable_encoder(data)})
+
+    def _deliver(self, event: dict) -> None:
+        # Safe to call from any thread: sync handlers run in the threadpool
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self.published += 1
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(self._offer, subscription, event)
+            except RuntimeError:   # loop already closed
+                self.unsubscribe(subscription)
+
+    def _offer(self, subscription: Subscription, event: dict) -> None:
+        if not subscription.offer(event):
+            self.dropped += 1
+
+    def stats(self) -> dict:
+        return {
+            "backend": type(self).__name__,
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "dropped_subscribers": self.dropped,
+        }
+
+
+class RedisHub(InProcessHub):
+    """
+    Publishes to a Redis channel; one listener thread per process relays
+    the channel to this process's subscribers.
+    """
+
+    def __init__(self, url: str = REDIS_URL, channel: str = "bragboard:events", **kwargs):
+        super().__init__(**kwargs)
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("EVENT_BACKEND=redis requires the 'redis' package")
+        self._client = redis.Redis.from_url(url)
+        self._channel = channel
+        self._listener = None
+
+    def subscribe(self) -> Subscription:
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, daemon=True)
+                self._listener.start()
+        return super().subscribe()
+
+    def has_subscribers(self) -> bool:
+        return True   # other processes may be listening
+
+    def publish(self, event_type: str, data: dict) -> None:
+        self._client.publish(self._channel, json.dumps({
+            "id": next(self._ids), "type": event_type, "data": jsonable_encoder(data),
+        }))
+
+    def _listen(self):
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self._channel)
+        for message in pubsub.listen():
+            self._deliver(json.loads(message["data"]))
+
+
+def make_hub():
+    if EVENT_BACKEND == "redis":
+        return RedisHub()
+    return InProcessHub()
+
+
+hub = make_hub()
+
+
+def publish(event_type: str, data: Optional[dict] = None) -> None:
+    hub.publish(event_type, data or {})
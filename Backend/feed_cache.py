@@ -0,0 +1,142 @@
+# Backend/feed_cache.py
+"""
+Response cache for feed pages (GET /shoutouts/).
+
+Pages are cached per query string under the current feed *generation*.
+Every write that changes what the feed shows calls invalidate_feed(), which
+starts a new generation: older pages are never read again and age out via
+the cache's TTL/LRU. Only pages read from the primary are cached (see
+database.read_from_replica).
+
+The ETag is a hash of the body actually sent: the page content plus the
+caller's my_reactions. A stale page can never revalidate a newer one, and
+a write that changes nothing on the page keeps clients on 304. A polling
+client with a cache hit costs one my_reactions lookup and no serialization.
+
+my_reactions is per user and is not cached; it is looked up on every request.
+
+The generation must be shared by every worker process, or a write seen by
+one worker leaves the others serving their old pages. It lives in Redis
+whenever Redis is configured (CACHE_BACKEND or EVENT_BACKEND=redis); with
+the in-memory store, startup fails if WEB_CONCURRENCY > 1.
+"""
+import hashlib
+import json
+import os
+import uuid
+from typing import List, Optional
+
+from dotenv import load_dotenv
+from fastapi import Request, Response
+
+from .cache import CACHE_BACKEND, MemoryCache, make_cache
+from .pagination import NEXT_CURSOR_HEADER
+from .serialization import render
+
+load_dotenv()
+
+FEED_CACHE_TTL_SECONDS = int(os.getenv("FEED_CACHE_TTL_SECONDS", 30))
+FEED_CACHE_MAX_SIZE = int(os.getenv("FEED_CACHE_MAX_SIZE", 1000))
+
+# Worker processes, as gunicorn and uvicorn read it
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 1))
+
+feed_cache = make_cache("feed", max_size=FEED_CACHE_MAX_SIZE, ttl=FEED_CACHE_TTL_SECONDS)
+
+# Kept apart from the pages so LRU pressure never evicts it. If it expires
+# a fresh generation is started, which only costs one round of misses.
+GENERATION_BACKEND = "redis" if "redis" in (CACHE_BACKEND, os.getenv("EVENT_BACKEND")) else "memory"
+feed_generation_cache = make_cache(
+    "feed_generation", max_size=1, ttl=24 * 3600, backend=GENERATION_BACKEND
+)
+_GENERATION_KEY = "current"
+
+
+def _check_shared_generation(cache, workers: int) -> None:
+    if workers > 1 and isinstance(cache, MemoryCache):
+        raise RuntimeError(
+            f"WEB_CONCURRENCY={workers} needs a shared feed generation: "
+            "set CACHE_BACKEND=redis (and REDIS_URL) or run a single worker"
+        )
+
+
+_check_shared_generation(feed_generation_cache, WEB_CONCURRENCY)
+
+
+def current_generation() -> str:
+    generation = feed_generation_cache.get(_GENERATION_KEY)
+    if generation is None:
+        generation = uuid.uuid4().hex
+        feed_generation_cache.set(_GENERATION_KEY, generation)
+    return generation
+
+
+def invalidate_feed() -> None:
+    """
+    Call after committing a write that changes feed content.
+    """
+    feed_generation_cache.set(_GENERATION_KEY, uuid.uuid4().hex)
+
+
+def page_key(generation: str, params) -> str:
+    query = json.dumps(vars(params), sort_keys=True, default=str)
+    return f"{generation}:{hashlib.sha1(query.encode()).hexdigest()}"
+
+
+def page_digest(items: List[dict], next_cursor: Optional[str]) -> str:
+    """
+    Content hash of a page without my_reactions; stored with the page.
+    """
+    content = json.dumps([items, next_cursor], sort_keys=True, default=str)
+    return hashlib.sha1(content.encode()).hexdigest()
+
+
+def etag_for(page: dict, my_reactions: dict) -> str:
+    mine = sorted(
+        [shoutout_id, sorted(t.value for t in types)]
+        for shoutout_id, types in my_reactions.items() if types
+    )
+    content = page.get("digest") or page_digest(page["items"], page.get("next_cursor"))
+    digest = hashlib.sha1(f"{content}:{json.dumps(mine)}".encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+def not_modified_response(etag: str, response: Response) -> Response:
+    """
+    304 for `etag`, keeping headers and cookies set on the endpoint's `response`.
+    """
+    response.headers.update(_cache_headers(etag))
+    not_modified_304 = Response(status_code=304)
+    not_modified_304.raw_headers.extend(response.raw_headers)
+    return not_modified_304
+
+
+def page_response(page: dict, my_reactions: dict, etag: str, response: Response) -> Response:
+    """
+    Build the 200 response from a cached page plus the caller's reactions,
+    keeping headers and cookies set on the endpoint's `response`.
+    """
+    items: List[dict] = [
+        {**item, "my_reactions": [t.value for t in my_reactions.get(item["id"], [])]}
+        for item in page["items"]
+    ]
+    response.headers.update(_cache_headers(etag))
+    if page.get("next_cursor"):
+        response.headers[NEXT_CURSOR_HEADER] = page["next_cursor"]
+    return render(items, response)
+
+
+def _cache_headers(etag: str) -> dict:
+    return {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",   # always revalidate
+        "Vary": "Authorization",
+    }
@@ -0,0 +1,168 @@
+# Backend/fulltext.py
+"""
+Full-text search over shoutouts.message and comments.content.
+
+    Postgres  generated tsvector column `search_vector` + GIN index per table
+              (kept current by the database on every INSERT/UPDATE)
+    SQLite    external-content FTS5 tables <table>_fts, kept in sync by
+              AFTER INSERT/UPDATE/DELETE triggers
+
+ensure_search_index() creates whatever is missing; main.py runs it at
+startup after create_all. search_statement() builds the ranked UNION ALL
+query behind GET /search. Neither path scans the Text columns.
+"""
+import os
+import re
+from typing import List
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from sqlalchemy import column, func, literal, literal_column, select, table, text, union_all
+
+from . import models
+from .database import engine
+
+load_dotenv()
+
+SEARCH_LANGUAGE = os.getenv("SEARCH_LANGUAGE", "english")   # Postgres text search config
+MAX_SEARCH_TERMS = 8
+
+# (table, text column) pairs that get an index
+INDEXED = (
+    (models.Shoutout.__tablename__, "message"),
+    (models.Comment.__tablename__, "content"),
+)
+
+
+# -----------------------------
+# 🏗️ Index Setup
+# -----------------------------
+def ensure_search_index(bind=engine) -> None:
+    dialect = bind.dialect.name
+    with bind.begin() as conn:
+        if dialect == "postgresql":
+            _ensure_postgres(conn)
+        elif dialect == "sqlite":
+            _ensure_sqlite(conn)
+
+
+def _ensure_postgres(conn):
+    for table_name, column_name in INDEXED:
+        conn.execute(text(
+            f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS (to_tsvector('{SEARCH_LANGUAGE}', coalesce({column_name}, ''))) STORED"
+        ))
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_{table_name}_search_vector "
+            f"ON {table_name} USING GIN (search_vector)"
+        ))
+
+
+def _ensure_sqlite(conn):
+    for table_name, column_name in INDEXED:
+        fts = f"{table_name}_fts"
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": fts},
+        ).first()
+        if exists:
+            continue
+
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5("
+            f"{column_name}, content='{table_name}', content_rowid='id')"
+        ))
+        insert_row = f"INSERT INTO {fts}(rowid, {column_name}) VALUES (new.id, new.{column_name});"
+        delete_row = (
+            f"INSERT INTO {fts}({fts}, rowid, {column_name}) "
+            f"VALUES ('delete', old.id, old.{column_name});"
+        )
+        conn.execute(text(f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table_name} BEGIN {insert_row} END"))
+        conn.execute(text(f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table_name} BEGIN {delete_row} END"))
+        conn.execute(text(
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {column_name} ON {table_name} "
+            f"BEGIN {delete_row} {insert_row} END"
+        ))
+        # Index the rows that existed before the FTS table
+        conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+
+# -----------------------------
+# 🔍 Query
+# -----------------------------
+def search_terms(q: str) -> List[str]:
+    """
+    Words of the query. Every term must match; the last may be a prefix
+    of a word, so results follow the user as they type. Operators are
+    dropped so user input can never be a syntax error in either engine.
+    """
+    return re.findall(r"\w+", q.lower())[:MAX_SEARCH_TERMS]
+
+
+def _postgres_match(model, terms: List[str]):
+    query = func.to_tsquery(SEARCH_LANGUAGE, " & ".join(terms[:-1] + [terms[-1] + ":*"]))
+    vector = literal_column(f"{model.__tablename__}.search_vector")
+    return model.__table__, vector.op("@@")(query), func.ts_rank(vector, query)
+
+
+def _sqlite_match(model, terms: List[str]):
+    fts_name = f"{model.__tablename__}_fts"
+    fts = table(fts_name, column("rowid"))
+    query = " ".join([f'"{t}"' for t in terms[:-1]] + [f'"{terms[-1]}"*'])
+    fts_column = literal_column(fts_name)
+    # bm25() is lower-is-better; negate so both engines sort rank DESC
+    return (
+        fts.join(model.__table__, fts.c.rowid == model.id),
+        fts_column.op("MATCH")(query),
+        -func.bm25(fts_column),
+    )
+
+
+MATCHERS = {"postgresql": _postgres_match, "sqlite": _sqlite_match}
+
+
+def search_statement(db, terms: List[str], limit: int, offset: int = 0):
+    """
+    Ranked matches across shoutouts and comments: best first, then newest.
+    Columns: kind, id, shoutout_id, text, created_at, user_id, user_name, rank.
+    """
+    dialect = db.get_bind().dialect.name
+    matcher = MATCHERS.get(dialect)
+    if matcher is None:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail=f"Search is not available on {dialect}",
+        )
+
+    S, C, U = models.Shoutout, models.Comment, models.User
+    sources = (
+        ("shoutout", S, S.message, S.id, S.sender_id),
+        ("comment", C, C.content, C.shoutout_id, C.user_id),
+    )
+
+    selects = []
+    for kind, model, text_col, shoutout_id, author_id in sources:
+        source, match, rank = matcher(model, terms)
+        selects.append(
+            select(
+                literal(kind).label("kind"),
+                model.id.label("id"),
+                shoutout_id.label("shoutout_id"),
+                text_col.label("text"),
+                model.created_at.label("created_at"),
+                U.id.label("user_id"),
+                U.name.label("user_name"),
+                rank.label("rank"),
+            )
+            .select_from(source)
+            .outerjoin(U, U.id == author_id)
+            .where(match)
+        )
+
+    hits = union_all(*selects).subquery()
+    return (
+        select(hits)
+        .order_by(hits.c.rank.desc(), hits.c.created_at.desc(), hits.c.id.desc())
+        .limit(limit)
+        .offset(offset)
+    )
@@ -0,0 +1,240 @@
+# Backend/hashing.py
+"""
+Argon2 password hashing: the single place that hashes and verifies passwords.
+
+Argon2 is deliberately slow and memory-hard. Running it inline in a sync
+endpoint pins one of Starlette's shared threadpool workers for the whole
+hash, so a login burst starves every other sync endpoint. Instead, hashes run
+on their own small thread pool (argon2-cffi releases the GIL, so threads hash
+in parallel). At most PASSWORD_HASH_WORKERS + PASSWORD_HASH_MAX_QUEUE hashes
+can be in flight; beyond that, callers get 503 with Retry-After instead of
+queueing without bound.
+
+Hashes made with older parameters are upgraded transparently on the next
+successful login (verify_and_update_async), so changing the parameters
+migrates users lazily.
+
+Tuning (env):
+    ARGON2_TIME_COST, ARGON2_MEMORY_COST (KiB), ARGON2_PARALLELISM
+    PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE
+
+Pick parameters for this machine with the benchmark:
+
+    python -m Backend.hashing --target-ms 250
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from passlib.hash import argon2
+
+load_dotenv()
+
+
+def _env_int(name: str):
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+# -----------------------------
+# ⚙️ Argon2 Parameters
+# -----------------------------
+ARGON2_PARAMS = {
+    key: value
+    for key, value in {
+        "time_cost": _env_int("ARGON2_TIME_COST"),
+        "memory_cost": _env_int("ARGON2_MEMORY_COST"),
+        "parallelism": _env_int("ARGON2_PARALLELISM"),
+    }.items()
+    if value is not None
+}
+
+# passlib defaults for anything not configured
+hasher = CryptContext(
+    schemes=["argon2"],
+    **{f"argon2__{key}": value for key, value in ARGON2_PARAMS.items()},
+)
+_configured = argon2.using(**ARGON2_PARAMS)
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", 32))
+
+
+# -----------------------------
+# 📈 Metrics
+# -----------------------------
+class HashMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def reject(self):
+        with self._lock:
+            self.rejected += 1
+
+    def add_in_flight(self, delta: int):
+        with self._lock:
+            self.in_flight += delta
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self.completed += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "workers": PASSWORD_HASH_WORKERS,
+                "max_queue": PASSWORD_HASH_MAX_QUEUE,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_ms": round(1000 * self.total_seconds / self.completed, 2) if self.completed else 0.0,
+                "max_ms": round(1000 * self.max_seconds, 2),
+                "params": {
+                    "time_cost": _configured.default_rounds,
+                    "memory_cost": _configured.memory_cost,
+                    "parallelism": _configured.parallelism,
+                },
+            }
+
+
+metrics = HashMetrics()
+
+
+# -----------------------------
+# 🧵 Bounded Worker Pool
+# -----------------------------
+_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="argon2"
+)
+_slots = threading.BoundedSemaphore(PASSWORD_HASH_WORKERS + PASSWORD_HASH_MAX_QUEUE)
+
+
+def _timed(fn, *args):
+    started = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        metrics.observe(time.perf_counter() - started)
+
+
+# -----------------------------
+# 🔐 Hash / Verify
+# -----------------------------
+def hash_password(password: str) -> str:
+    return hasher.hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return hasher.verify(plain_password, hashed_password)
+    except Exception:
+        # Catches verification failures (mismatch, invalid hash format)
+        return False
+
+
+def verify_and_update(plain_password: str, hashed_password: str):
+    """
+    Returns (valid, new_hash). new_hash is set only when the password is
+    valid and the stored hash uses outdated parameters.
+    """
+    try:
+        return hasher.verify_and_update(plain_password, hashed_password)
+    except (ValueError, TypeError):
+        # Malformed or unrecognised stored hash
+        return False, None
+
+
+async def _run(fn, *args):
+    if not _slots.acquire(blocking=False):
+        metrics.reject()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent sign-ins, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+    metrics.add_in_flight(1)
+    try:
+        return await asyncio.wrap_future(_executor.submit(_timed, fn, *args))
+    finally:
+        metrics.add_in_flight(-1)
+        _slots.release()
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password on the hashing pool. Raises 503 when the pool is saturated.
+    """
+    return await _run(hash_password, password)
+
+
+async def verify_and_update_async(plain_password: str, hashed_password: str):
+    """
+    verify_and_update() on the hashing pool. Raises 503 when the pool is saturated.
+    """
+    return await _run(verify_and_update, plain_password, hashed_password)
+
+
+# -----------------------------
+# ⏱️ Cost Benchmark
+# -----------------------------
+def benchmark(time_costs, memory_costs, parallelisms, samples=5):
+    """
+    Median hash latency (ms) for every parameter combination, fastest first.
+    """
+    results = []
+    for t, m, p in itertools.product(time_costs, memory_costs, parallelisms):
+        candidate = argon2.using(time_cost=t, memory_cost=m, parallelism=p)
+        candidate.hash("warm-up")
+        timings = []
+        for _ in range(samples):
+            started = time.perf_counter()
+            candidate.hash("benchmark-password")
+            timings.append(1000 * (time.perf_counter() - started))
+        results.append({
+            "time_cost": t,
+            "memory_cost": m,
+            "parallelism": p,
+            "median_ms": round(statistics.median(timings), 1),
+        })
+    return sorted(results, key=lambda r: r["median_ms"])
+
+
+def _int_list(value: str):
+    return [int(v) for v in value.split(",")]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure Argon2 hash latency for candidate parameters on this machine."
+    )
+    parser.add_argument("--time-cost", type=_int_list, default=[1, 2, 3, 4])
+    parser.add_argument("--memory-cost", type=_int_list, default=[19456, 47104, 65536, 102400],
+                        help="KiB, comma separated")
+    parser.add_argument("--parallelism", type=_int_list, default=[1, 2, 4])
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--target-ms", type=float, default=None,
+                        help="mark combinations at or under this latency")
+    args = parser.parse_args()
+
+    current = (_configured.default_rounds, _configured.memory_cost, _configured.parallelism)
+    print(f"Current: time_cost={current[0]} memory_cost={current[1]} parallelism={current[2]}")
+    print(f"{'time':>5} {'memory':>8} {'par':>4} {'median ms':>10}")
+    for r in benchmark(args.time_cost, args.memory_cost, args.parallelism, args.samples):
+        within = args.target_ms is not None and r["median_ms"] <= args.target_ms
+        marker = "  <= target" if within else ""
+        print(f"{r['time_cost']:>5} {r['memory_cost']:>8} {r['parallelism']:>4} {r['median_ms']:>10}{marker}")
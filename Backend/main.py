@@ -2,14 +2,15 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from . import models
-from .database import engine
-from .routers import auth, shoutouts, comments, reactions, reports, admin
+from . import models, fulltext
+from .database import engine, DB_ASYNC
+from .routers import auth, shoutouts, comments, reactions, reports, admin, metrics, stream, leaderboard, users, search, exports
 
 # --------------------------------------
 # CREATE DATABASE TABLES
 # --------------------------------------
 models.Base.metadata.create_all(bind=engine)
+fulltext.ensure_search_index(engine)   # tsvector + GIN (Postgres) / FTS5 (SQLite)
 
 # --------------------------------------
 # INIT APP
@@ -32,8 +33,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],       # Allow all HTTP methods
     allow_headers=["*"],       # ⭐ REQUIRED so Authorization header is NOT blocked
+    expose_headers=["X-Next-Cursor", "X-Read-Primary", "ETag"],  # Feed cursor, read-your-writes window, feed ETag
 )
 
+# --------------------------------------
+# ASYNC ROUTERS (DB_ASYNC=true)
+# Registered first so their routes take precedence over the sync
+# versions of the same paths; everything else falls through below.
+# --------------------------------------
+if DB_ASYNC:
+    from .routers import async_shoutouts, async_comments, async_reactions
+
+    app.include_router(async_shoutouts.router)   # Feed reads
+    app.include_router(async_comments.router)    # Add / list comments
+    app.include_router(async_reactions.router)   # Reactions
+
 # --------------------------------------
 # REGISTER ROUTERS (ORDER DOES NOT MATTER)
 # --------------------------------------
@@ -43,6 +57,12 @@ app.include_router(comments.router)     # Comments CRUD
 app.include_router(reactions.router)    # Reactions
 app.include_router(reports.router)      # Reporting shoutouts
 app.include_router(admin.router)        # Admin-level moderation
+app.include_router(metrics.router)      # Pool / cache / hashing counters
+app.include_router(stream.router)       # Live feed events (SSE)
+app.include_router(leaderboard.router)  # Top users / departments
+app.include_router(users.router)        # Profile stats & shoutouts
+app.include_router(search.router)       # Full-text search
+app.include_router(exports.router)      # Streaming admin exports (NDJSON / CSV)
 
 # --------------------------------------
 # ROOT ENDPOINT
@@ -84,6 +104,24 @@ def read_root():
                 "/admin/comments/flagged",
                 "/admin/comments/{id}",
                 "/admin/reports",
+                "/admin/export/{shoutouts|comments|reactions}?format=ndjson|csv",
+            ],
+            "Metrics": [
+                "/metrics",
+            ],
+            "Stream": [
+                "/stream",
+            ],
+            "Leaderboard": [
+                "/leaderboard?window=week|month|all",
+            ],
+            "Users": [
+                "/users/?q=",
+                "/users/{id}/stats",
+                "/users/{id}/shoutouts?direction=sent|received",
+            ],
+            "Search": [
+                "/search?q=",
             ]
         }
     }
@@ -1,13 +1,42 @@
 import enum
+from datetime import datetime
 from sqlalchemy import (
     Column, Integer, String, TIMESTAMP, Enum as SAEnum,
-    Text, ForeignKey, Boolean, DateTime
+    Text, ForeignKey, Boolean, DateTime, Date, Index
 )
-from sqlalchemy.sql import func
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import func, text
+from sqlalchemy.sql.functions import FunctionElement
 from sqlalchemy.orm import relationship
 from .database import Base
 
 
+class utc_now(FunctionElement):
+    """
+    Server-side current time in UTC, for created_at defaults. Matches the
+    ORM default (datetime.utcnow), so rows inserted either way share one
+    time base; on SQLite it also matches the text format SQLAlchemy binds
+    (microseconds), which the keyset cursors compare against.
+    """
+    type = TIMESTAMP()
+    inherit_cache = True
+
+
+@compiles(utc_now)
+def _utc_now(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utc_now, "postgresql")
+def _utc_now_postgresql(element, compiler, **kw):
+    return "timezone('utc', now())"
+
+
+@compiles(utc_now, "sqlite")
+def _utc_now_sqlite(element, compiler, **kw):
+    return "(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"
+
+
 class UserRole(str, enum.Enum):
     employee = "employee"
     admin = "admin"
@@ -25,18 +54,25 @@ class ReactionType(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Backs the user directory ordered by (name, id)
+        Index("ix_users_name_id", "name", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
     email = Column(String(100), unique=True, index=True, nullable=False)
     hashed_password = Column(String(200), nullable=False)
-    department = Column(String(100))
+    department = Column(String(100), index=True)
     role = Column(SAEnum(UserRole, name="user_role"), nullable=False)
     joined_at = Column(TIMESTAMP, server_default=func.now())
 
     is_active = Column(Boolean, default=True)
     is_blocked = Column(Boolean, default=False)
 
+    # Embedded in access tokens ("ver"); bumping it revokes issued tokens
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
+
     # Sent shoutouts
     sent_shoutouts = relationship(
         "Shoutout",
@@ -81,19 +117,52 @@ class User(Base):
     )
 
 
+# Case-insensitive prefix search of the user directory (routers/users.py):
+# lower(col) LIKE 'q%'. text_pattern_ops lets Postgres use the index for
+# LIKE whatever the database collation.
+def _prefix_index(column):
+    label = f"lower_{column.key}"
+    return Index(
+        f"ix_users_{label}",
+        func.lower(column).label(label),
+        postgresql_ops={label: "text_pattern_ops"},
+    )
+
+
+_prefix_index(User.name)
+_prefix_index(User.email)
+_prefix_index(User.department)
+
+
 # ============================
 # -------- SHOUTOUTS ---------
 # ============================
 
 class Shoutout(Base):
     __tablename__ = "shoutouts"
+    __table_args__ = (
+        # Backs keyset pagination of the feed ordered by (created_at, id)
+        Index("ix_shoutouts_created_at_id", "created_at", "id"),
+        # Backs the feed filtered by sender
+        Index("ix_shoutouts_sender_created_at_id", "sender_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     sender_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     message = Column(Text, nullable=False)
-    created_at = Column(TIMESTAMP, server_default=func.now())
+    # UTC either way (see utc_now); `python -m Backend.counters` moves
+    # existing databases onto the UTC server default
+    created_at = Column(TIMESTAMP, default=datetime.utcnow, server_default=utc_now())
     is_hidden = Column(Boolean, default=False)
 
+    # Denormalized counters, maintained by the write paths in routers/
+    # (see counters.py; `python -m Backend.counters` recomputes them)
+    comments_count = Column(Integer, nullable=False, default=0, server_default="0")
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")
+    clap_count = Column(Integer, nullable=False, default=0, server_default="0")
+    star_count = Column(Integer, nullable=False, default=0, server_default="0")
+    reports_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     sender = relationship("User", back_populates="sent_shoutouts")
 
     recipients = relationship(
@@ -124,9 +193,13 @@ class Shoutout(Base):
 
 class ShoutoutRecipient(Base):
     __tablename__ = "shoutout_recipients"
+    __table_args__ = (
+        # Backs the feed filtered by recipient
+        Index("ix_shoutout_recipients_recipient_shoutout", "recipient_id", "shoutout_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    shoutout_id = Column(Integer, ForeignKey("shoutouts.id", ondelete="CASCADE"))
+    shoutout_id = Column(Integer, ForeignKey("shoutouts.id", ondelete="CASCADE"), index=True)
     recipient_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
 
     shoutout = relationship("Shoutout", back_populates="recipients")
@@ -139,6 +212,20 @@ class ShoutoutRecipient(Base):
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        # Backs the admin comment listing ordered by (created_at, id)
+        Index("ix_comments_created_at_id", "created_at", "id"),
+        # Backs a shoutout's comment thread: one range scan per page
+        Index("ix_comments_shoutout_created_at_id", "shoutout_id", "created_at", "id"),
+        # Moderation queue: only flagged rows are indexed, so it stays
+        # small however many comments there are
+        Index(
+            "ix_comments_flagged_created_at_id",
+            "created_at", "id",
+            postgresql_where=text("is_flagged"),
+            sqlite_where=text("is_flagged"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -146,7 +233,7 @@ class Comment(Base):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
 
     content = Column(Text, nullable=False)
-    created_at = Column(TIMESTAMP, server_default=func.now())
+    created_at = Column(TIMESTAMP, default=datetime.utcnow, server_default=utc_now())
 
     # Flagging system
     flag_reason = Column(Text, nullable=True)
@@ -180,6 +267,15 @@ class Comment(Base):
 
 class Reaction(Base):
     __tablename__ = "reactions"
+    __table_args__ = (
+        # One reaction of each type per user per shoutout; also the
+        # ON CONFLICT target of the toggle in routers/reactions.py
+        Index(
+            "uq_reactions_shoutout_user_type",
+            "shoutout_id", "user_id", "type",
+            unique=True,
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     shoutout_id = Column(Integer, ForeignKey("shoutouts.id", ondelete="CASCADE"))
@@ -196,12 +292,16 @@ class Reaction(Base):
 
 class Report(Base):
     __tablename__ = "reports"
+    __table_args__ = (
+        # Backs the admin report listing ordered by (created_at, id)
+        Index("ix_reports_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     shoutout_id = Column(Integer, ForeignKey("shoutouts.id", ondelete="CASCADE"))
     reported_by = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     reason = Column(Text, nullable=False)
-    created_at = Column(TIMESTAMP, server_default=func.now())
+    created_at = Column(TIMESTAMP, default=datetime.utcnow, server_default=utc_now())
 
     shoutout = relationship("Shoutout", back_populates="reports")
     reporter = relationship("User", back_populates="reports")
@@ -222,3 +322,41 @@ class AdminLog(Base):
     timestamp = Column(TIMESTAMP, server_default=func.now())
 
     admin = relationship("User", back_populates="admin_logs")
+
+
+# ============================
+# ------- AGGREGATES ---------
+# ============================
+# Per-user rollups maintained incrementally by aggregates.py whenever
+# shoutouts, recipients or reactions are written; rebuilt from scratch by
+# `python -m Backend.aggregates`. Reactions are credited to the sender.
+
+class StatsColumns:
+    sent_count = Column(Integer, nullable=False, default=0, server_default="0")
+    received_count = Column(Integer, nullable=False, default=0, server_default="0")
+    like_received = Column(Integer, nullable=False, default=0, server_default="0")
+    clap_received = Column(Integer, nullable=False, default=0, server_default="0")
+    star_received = Column(Integer, nullable=False, default=0, server_default="0")
+
+
+class UserDailyStats(StatsColumns, Base):
+    """
+    One row per user per day (the shoutout's created_at date); backs the
+    week/month leaderboard windows.
+    """
+    __tablename__ = "user_daily_stats"
+    __table_args__ = (
+        Index("ix_user_daily_stats_day", "day"),
+    )
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+
+
+class UserStats(StatsColumns, Base):
+    """
+    All-time totals per user.
+    """
+    __tablename__ = "user_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
@@ -0,0 +1,119 @@
+# Backend/pagination.py
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import tuple_
+
+# Response header carrying the opaque cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+# -----------------------------
+# 🔖 Keyset Cursor Helpers
+# -----------------------------
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Encode the (created_at, id) of the last row on a page into an opaque,
+    URL-safe cursor string.
+    """
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor back into (created_at, id).
+    Raises 400 if the cursor was tampered with or is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def encode_name_cursor(name: str, row_id: int) -> str:
+    """
+    Cursor for listings ordered alphabetically by (name, id).
+    """
+    raw = json.dumps(["n", name, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_name_cursor(cursor: str) -> Tuple[str, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        kind, name, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if kind != "n" or not isinstance(name, str):
+            raise ValueError(cursor)
+        return name, int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+# -----------------------------
+# 🔖 Offset Cursor Helpers
+# -----------------------------
+# For ranked results (e.g. /search) where there is no stable sort key to
+# resume from; the offset is wrapped so clients treat it as opaque too.
+MAX_OFFSET = 1000
+
+
+def encode_offset_cursor(offset: int) -> str:
+    raw = json.dumps(["o", offset], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_offset_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        kind, offset = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if kind != "o" or not 0 <= int(offset) <= MAX_OFFSET:
+            raise ValueError(cursor)
+        return int(offset)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+# -----------------------------
+# 📄 Keyset Page Helpers
+# -----------------------------
+def keyset_page(stmt, model, cursor: Optional[str], limit: int, oldest_first: bool = False):
+    """
+    Page of `model` ordered by (created_at, id), newest first unless
+    `oldest_first`, resuming after `cursor`. Selects one look-ahead row
+    for trim_page().
+    """
+    key = tuple_(model.created_at, model.id)
+    if cursor:
+        after = tuple_(*decode_cursor(cursor))
+        stmt = stmt.where(key > after if oldest_first else key < after)
+    if oldest_first:
+        return stmt.order_by(model.created_at.asc(), model.id.asc()).limit(limit + 1)
+    return stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+
+
+def trim_page(rows: list, limit: int, response: Response) -> list:
+    """
+    Drop the look-ahead row and, if there was one, set X-Next-Cursor.
+    """
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].created_at, rows[-1].id)
+    return rows
@@ -1,11 +1,18 @@
 # routers/admin.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload
 from pydantic import BaseModel
 from typing import Optional, List
-
-from .. import models, database
-from ..security import get_current_user
+from datetime import datetime
+
+from .. import models, schemas, database, counters, hashing, feed_cache, events, aggregates
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page, trim_page
+from ..serialization import iso, render
+from .users import directory_statement, trim_directory
+from ..security import (
+    get_current_principal, invalidate_cached_user, token_version_cache, user_cache,
+)
 
 router = APIRouter(
     prefix="/admin",
@@ -20,51 +27,79 @@ class RoleUpdate(BaseModel):
     role: models.UserRole
 
 
+# -----------------------------
+# LISTING HELPERS
+# -----------------------------
+
+def _created_between(query, model, since: Optional[datetime], until: Optional[datetime]):
+    if since is not None:
+        query = query.filter(model.created_at >= since)
+    if until is not None:
+        query = query.filter(model.created_at < until)
+    return query
+
+
+def _user_summary(user: Optional[models.User], with_email: bool = False) -> Optional[dict]:
+    if user is None:
+        return None
+    summary = {"id": user.id, "name": user.name, "department": user.department}
+    if with_email:
+        summary["email"] = user.email
+    return summary
+
+
 # =============================================================
-# ✅ GET ALL REPORTS WITH FULL JOIN DATA (NO CHANGE)
+# ✅ GET REPORTS (PAGINATED, WITH SHOUTOUT + REPORTER)
 # =============================================================
 @router.get("/reports")
 def get_all_reports(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    reported_by: Optional[int] = None,
+    shoutout_id: Optional[int] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
     db: Session = Depends(database.get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: schemas.Principal = Depends(get_current_principal)
 ):
+    """
+    Newest first; the cursor for the next page is sent in X-Next-Cursor.
+    Shoutout, sender and reporter are joined into the page query, so a
+    page costs one query however long it is.
+    """
     if current_user.role != models.UserRole.admin:
         raise HTTPException(status_code=403, detail="Access forbidden")
 
-    reports = (
-        db.query(models.Report)
-        .join(models.Shoutout, models.Shoutout.id == models.Report.shoutout_id)
-        .join(models.User, models.User.id == models.Report.reported_by)
-        .add_entity(models.Shoutout)
-        .add_entity(models.User)
-        .all()
+    query = db.query(models.Report).options(
+        joinedload(models.Report.shoutout, innerjoin=True)
+            .joinedload(models.Shoutout.sender),
+        joinedload(models.Report.reporter, innerjoin=True),
     )
+    if reported_by is not None:
+        query = query.filter(models.Report.reported_by == reported_by)
+    if shoutout_id is not None:
+        query = query.filter(models.Report.shoutout_id == shoutout_id)
+    query = _created_between(query, models.Report, since, until)
 
-    output = []
-    for report, shoutout, reporter in reports:
-        output.append({
+    reports = trim_page(keyset_page(query, models.Report, cursor, limit).all(), limit, response)
+
+    return render([
+        {
             "id": report.id,
             "reason": report.reason,
-            "created_at": report.created_at,
+            "created_at": iso(report.created_at),
 
             "shoutout": {
-                "id": shoutout.id,
-                "message": shoutout.message,
-                "sender": {
-                    "id": shoutout.sender.id,
-                    "name": shoutout.sender.name,
-                    "department": shoutout.sender.department
-                }
+                "id": report.shoutout.id,
+                "message": report.shoutout.message,
+                "sender": _user_summary(report.shoutout.sender),
             },
 
-            "reported_by": {
-                "id": reporter.id,
-                "name": reporter.name,
-                "department": reporter.department
-            }
-        })
-
-    return output
+            "reported_by": _user_summary(report.reporter),
+        }
+        for report in reports
+    ], response)
 
 
 # =============================================================
@@ -74,7 +109,7 @@ def get_all_reports(
 def delete_report(
     report_id: int,
     db: Session = Depends(database.get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: schemas.Principal = Depends(get_current_principal)
 ):
     if current_user.role != models.UserRole.admin:
         raise HTTPException(status_code=403, detail="Access forbidden")
@@ -84,6 +119,7 @@ def delete_report(
         raise HTTPException(status_code=404, detail="Report not found")
 
     db.delete(report)
+    counters.bump(db, report.shoutout_id, models.Shoutout.reports_count, -1)
     db.commit()
 
     return {"message": "Report resolved (deleted)"}
@@ -92,15 +128,38 @@ def delete_report(
 # =============================================================
 # USERS LIST
 # =============================================================
-@router.get("/users")
+@router.get("/users", response_model=List[schemas.UserAdmin])
 def get_all_users(
+    response: Response,
+    q: Optional[str] = Query(None, max_length=100),
+    department: Optional[str] = None,
+    role: Optional[models.UserRole] = None,
+    is_active: Optional[bool] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: Session = Depends(database.get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: schemas.Principal = Depends(get_current_principal)
 ):
+    """
+    Alphabetical, paginated (X-Next-Cursor). `q` is a name/email/department
+    prefix. Only the UserAdmin columns are selected.
+    """
     if current_user.role != models.UserRole.admin:
         raise HTTPException(status_code=403, detail="Access forbidden")
 
-    return db.query(models.User).all()
+    User = models.User
+    stmt = directory_statement(
+        [User.id, User.name, User.email, User.department, User.role, User.is_active, User.is_blocked],
+        q, cursor, limit,
+    )
+    if department:
+        stmt = stmt.where(User.department == department)
+    if role is not None:
+        stmt = stmt.where(User.role == role)
+    if is_active is not None:
+        stmt = stmt.where(User.is_active == is_active)
+
+    return render(trim_directory(db.execute(stmt).all(), limit, response), response)
 
 
 # =============================================================
@@ -111,7 +170,7 @@ def update_user_role(
     user_id: int,
     payload: RoleUpdate,
     db: Session = Depends(database.get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: schemas.Principal = Depends(get_current_principal)
 ):
     if current_user.role != models.UserRole.admin:
         raise HTTPException(status_code=403, detail="Access forbidden")
@@ -121,7 +180,11 @@ def update_user_role(
         raise HTTPException(status_code=404, detail="User not found")
 
     user.role = payload.role
+    user.token_version += 1   # revoke outstanding access tokens
     db.commit()
+    invalidate_cached_user(user.email, user.id)
+    feed_cache.invalidate_feed()   # sender role is part of the feed
+    events.publish("feed.invalidated")
 
     return {"message": "User role updated"}
 
@@ -133,7 +196,7 @@ def update_user_role(
 def toggle_user_active(
     user_id: int,
     db: Session = Depends(database.get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: schemas.Principal = Depends(get_current_principal)
 ):
     if current_user.role != models.UserRole.admin:
         raise HTTPException(status_code=403, detail="Access forbidden")
@@ -143,7 +206,9 @@ def toggle_user_active(
         raise HTTPException(status_code=404, detail="User not found")
 
     user.is_active = not user.is_active
+    user.token_version += 1   # revoke outstanding access tokens
     db.commit()
+    invalidate_cached_user(user.email, user.id)
 
     return {"message": "User active status toggled"}
 
@@ -155,7 +220,7 @@ def toggle_user_active(
 def delete_user(
     user_id: int,
     db: Session = Depends(database.get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: schemas.Principal = Depends(get_current_principal)
 ):
     if current_user.role != models.UserRole.admin:
         raise HTTPException(status_code=403, detail="Access forbidden")
@@ -164,8 +229,27 @@ def delete_user(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
+    # Other users' shoutouts lose this user's comments/reactions/reports
+    # in the cascade, so their counters are recomputed in the same transaction
+    touched_ids = set()
+    for model, fk in (
+        (models.Comment, models.Comment.user_id),
+        (models.Reaction, models.Reaction.user_id),
+        (models.Report, models.Report.reported_by),
+    ):
+        touched_ids.update(
+            sid for (sid,) in db.query(model.shoutout_id).filter(fk == user_id).distinct()
+        )
+
+    email = user.email
+    aggregates.forget_user(db, user_id)
     db.delete(user)
+    db.flush()
+    counters.recompute(db, touched_ids)
     db.commit()
+    invalidate_cached_user(email, user_id)
+    feed_cache.invalidate_feed()
+    events.publish("feed.invalidated")   # their shoutouts, comments and reactions are gone
 
     return {"message": "User deleted successfully"}
 
@@ -177,7 +261,7 @@ def delete_user(
 def delete_shoutout(
     shoutout_id: int,
     db: Session = Depends(database.get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: schemas.Principal = Depends(get_current_principal)
 ):
     if current_user.role != models.UserRole.admin:
         raise HTTPException(status_code=403, detail="Access forbidden")
@@ -186,85 +270,109 @@ def delete_shoutout(
     if not shoutout:
         raise HTTPException(status_code=404, detail="Shoutout not found")
 
+    aggregates.record_shoutouts(db, [shoutout_id], -1)
     db.delete(shoutout)
     db.commit()
+    feed_cache.invalidate_feed()
+    events.publish("shoutout.deleted", {"id": shoutout_id})
 
     return {"message": "Shoutout deleted successfully"}
 
 
 # =============================================================
-# ✅ UPDATED: ADMIN GET ALL COMMENTS (NOW RETURNS USER INFO)
+# ✅ ADMIN GET COMMENTS (PAGINATED, FILTERABLE)
 # =============================================================
 @router.get("/comments")
 def admin_get_all_comments(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    flagged: Optional[bool] = None,
+    user_id: Optional[int] = None,
+    shoutout_id: Optional[int] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
     db: Session = Depends(database.get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: schemas.Principal = Depends(get_current_principal)
 ):
+    """
+    Newest first; the cursor for the next page is sent in X-Next-Cursor.
+    """
     if current_user.role != models.UserRole.admin:
         raise HTTPException(status_code=403, detail="Access forbidden")
 
-    comments = (
-        db.query(models.Comment)
-        .order_by(models.Comment.created_at.desc())
-        .all()
-    )
+    query = db.query(models.Comment).options(joinedload(models.Comment.user))
+    if flagged is not None:
+        # The bare column is what the partial index predicate says
+        query = query.filter(models.Comment.is_flagged if flagged else ~models.Comment.is_flagged)
+    if user_id is not None:
+        query = query.filter(models.Comment.user_id == user_id)
+    if shoutout_id is not None:
+        query = query.filter(models.Comment.shoutout_id == shoutout_id)
+    query = _created_between(query, models.Comment, since, until)
 
-    result = []
-    for c in comments:
-        result.append({
+    comments = trim_page(keyset_page(query, models.Comment, cursor, limit).all(), limit, response)
+
+    return render([
+        {
             "id": c.id,
             "content": c.content,
-            "created_at": c.created_at,
+            "created_at": iso(c.created_at),
 
-            "user": {
-                "id": c.user.id,
-                "name": c.user.name,
-                "email": c.user.email,
-                "department": c.user.department
-            } if c.user else None,
+            "user": _user_summary(c.user, with_email=True),
 
             "is_flagged": c.is_flagged,
             "flag_reason": c.flag_reason
-        })
-
-    return result
+        }
+        for c in comments
+    ], response)
 
 
 # =============================================================
-# ✅ UPDATED: GET FLAGGED COMMENTS (FULL USER + FLAGGER INFO)
+# ✅ GET FLAGGED COMMENTS (PAGINATED, USER + FLAGGER INFO)
 # =============================================================
 @router.get("/comments/flagged")
 def admin_get_flagged_comments(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    user_id: Optional[int] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
     db: Session = Depends(database.get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: schemas.Principal = Depends(get_current_principal)
 ):
+    """
+    The moderation queue, newest first. Reads only the partial index
+    ix_comments_flagged_created_at_id; author and flagger are joined in.
+    """
     if current_user.role != models.UserRole.admin:
         raise HTTPException(status_code=403, detail="Access forbidden")
 
-    comments = db.query(models.Comment).filter(models.Comment.is_flagged == True).all()
+    query = (
+        db.query(models.Comment)
+        .options(joinedload(models.Comment.user), joinedload(models.Comment.flagger))
+        .filter(models.Comment.is_flagged)   # matches the index's WHERE is_flagged
+    )
+    if user_id is not None:
+        query = query.filter(models.Comment.user_id == user_id)
+    query = _created_between(query, models.Comment, since, until)
+
+    comments = trim_page(keyset_page(query, models.Comment, cursor, limit).all(), limit, response)
 
-    result = []
-    for c in comments:
-        result.append({
+    return render([
+        {
             "id": c.id,
             "content": c.content,
             "flag_reason": c.flag_reason,
-            "created_at": c.created_at,
-
-            "user": {
-                "id": c.user.id,
-                "name": c.user.name,
-                "department": c.user.department
-            } if c.user else None,
+            "created_at": iso(c.created_at),
 
-            "flagged_by": {
-                "id": c.flagger.id,
-                "name": c.flagger.name,
-                "department": c.flagger.department
-            } if c.flagger else None
-        })
+            "user": _user_summary(c.user),
 
-    return result
+            "flagged_by": _user_summary(c.flagger),
+        }
+        for c in comments
+    ], response)
 
 
 # =============================================================
@@ -274,7 +382,7 @@ def admin_get_flagged_comments(
 def delete_comment(
     comment_id: int,
     db: Session = Depends(database.get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: schemas.Principal = Depends(get_current_principal)
 ):
     if current_user.role != models.UserRole.admin:
         raise HTTPException(status_code=403, detail="Access forbidden")
@@ -283,8 +391,12 @@ def delete_comment(
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
 
+    shoutout_id = comment.shoutout_id
     db.delete(comment)
+    counters.bump(db, shoutout_id, models.Shoutout.comments_count, -1)
     db.commit()
+    feed_cache.invalidate_feed()
+    events.publish("comment.deleted", {"id": comment_id, "shoutout_id": shoutout_id})
 
     return {"message": "Comment deleted successfully"}
 
@@ -296,7 +408,7 @@ def delete_comment(
 def block_user(
     user_id: int,
     db: Session = Depends(database.get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: schemas.Principal = Depends(get_current_principal)
 ):
     if current_user.role != models.UserRole.admin:
         raise HTTPException(status_code=403, detail="Access forbidden")
@@ -306,6 +418,65 @@ def block_user(
         raise HTTPException(status_code=404, detail="User not found")
 
     user.is_active = False
+    user.token_version += 1   # revoke outstanding access tokens
     db.commit()
+    invalidate_cached_user(user.email, user.id)
 
     return {"message": "User blocked"}
+
+
+# =============================================================
+# AUTHENTICATED-USER CACHE STATS
+# =============================================================
+@router.get("/cache/stats")
+def get_cache_stats(
+    current_user: schemas.Principal = Depends(get_current_principal)
+):
+    if current_user.role != models.UserRole.admin:
+        raise HTTPException(status_code=403, detail="Access forbidden")
+
+    return {
+        "users": user_cache.stats(),
+        "token_versions": token_version_cache.stats(),
+        "feed": feed_cache.feed_cache.stats(),
+    }
+
+
+# =============================================================
+# PASSWORD HASHING POOL STATS
+# =============================================================
+@router.get("/hashing/stats")
+def get_hashing_stats(
+    current_user: schemas.Principal = Depends(get_current_principal)
+):
+    if current_user.role != models.UserRole.admin:
+        raise HTTPException(status_code=403, detail="Access forbidden")
+
+    return hashing.metrics.snapshot()
+
+
+# =============================================================
+# DASHBOARD TOTALS
+# =============================================================
+@router.get("/stats", response_model=schemas.AdminStats)
+def get_admin_stats(
+    db: Session = Depends(database.get_db),
+    current_user: schemas.Principal = Depends(get_current_principal)
+):
+    """
+    Site-wide totals for the dashboard cards, in one round trip. Reactions
+    are summed from the per-shoutout counters rather than counted.
+    """
+    if current_user.role != models.UserRole.admin:
+        raise HTTPException(status_code=403, detail="Access forbidden")
+
+    Shoutout = models.Shoutout
+    totals = db.execute(select(
+        select(func.count()).select_from(models.User).scalar_subquery().label("users"),
+        select(func.count()).select_from(Shoutout).scalar_subquery().label("shoutouts"),
+        select(func.count()).select_from(models.Comment).scalar_subquery().label("comments"),
+        select(
+            func.coalesce(func.sum(Shoutout.like_count + Shoutout.clap_count + Shoutout.star_count), 0)
+        ).scalar_subquery().label("reactions"),
+    )).one()
+    return schemas.AdminStats(**totals._mapping)
@@ -0,0 +1,90 @@
+# Backend/routers/async_comments.py
+# AsyncSession versions of the comment endpoints, mounted ahead of
+# routers/comments.py when DB_ASYNC=true (see main.py).
+from datetime import datetime
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import models, schemas, security, counters, feed_cache, events
+from ..database import get_async_db
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, trim_page
+from ..serialization import render
+from .comments import comment_to_response, shoutout_exists_statement, thread_statement
+
+router = APIRouter(prefix="/comments", tags=["Comments"])
+
+
+# -----------------------------------
+#        ADD COMMENT
+# -----------------------------------
+@router.post("/{shoutout_id}", status_code=status.HTTP_201_CREATED, response_model=schemas.CommentResponse)
+async def add_comment(
+    shoutout_id: int,
+    comment: schemas.CommentCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(security.get_current_user_async),
+):
+    shoutout = await db.get(models.Shoutout, shoutout_id)
+    if not shoutout:
+        raise HTTPException(status_code=404, detail="Shoutout not found")
+
+    new_comment = models.Comment(
+        content=comment.content.strip(),
+        user_id=current_user.id,
+        shoutout_id=shoutout_id,
+        created_at=datetime.utcnow(),
+    )
+
+    db.add(new_comment)
+    await db.execute(counters.bump_statement(shoutout_id, models.Shoutout.comments_count))
+    await db.commit()
+    feed_cache.invalidate_feed()
+
+    comment_count = (await db.execute(
+        select(models.Shoutout.comments_count).where(models.Shoutout.id == shoutout_id)
+    )).scalar()
+
+    created = {
+        "id": new_comment.id,
+        "content": new_comment.content,
+        "created_at": new_comment.created_at,
+        "comment_count": comment_count,
+        "user": {
+            "id": current_user.id,
+            "name": current_user.name,
+            "email": current_user.email,
+        },
+    }
+    events.publish("comment.created", {
+        "shoutout_id": shoutout_id,
+        "comments_count": comment_count,
+        "comment": created,
+    })
+
+    return created
+
+
+# -----------------------------------
+#        GET COMMENTS FOR A SHOUTOUT
+# -----------------------------------
+@router.get("/{shoutout_id}", response_model=list[schemas.CommentResponse])
+async def get_comments_for_shoutout(
+    shoutout_id: int,
+    response: Response,
+    order: Literal["oldest", "newest"] = "oldest",
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: schemas.Principal = Depends(security.get_current_principal_async),
+):
+    # Authors are joined in by thread_statement: AsyncSession cannot lazy-load c.user
+    comments = (await db.execute(thread_statement(shoutout_id, order, cursor, limit))).scalars().all()
+    if not comments and not (await db.execute(shoutout_exists_statement(shoutout_id))).scalar():
+        raise HTTPException(status_code=404, detail="Shoutout not found")
+
+    comments = trim_page(comments, limit, response)
+
+    return render([comment_to_response(c) for c in comments], response)
@@ -0,0 +1,106 @@
+# Backend/routers/async_reactions.py
+# AsyncSession versions of the reaction endpoints, mounted ahead of
+# routers/reactions.py when DB_ASYNC=true (see main.py).
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import models, schemas, security, counters, feed_cache, events, aggregates
+from ..database import get_async_db
+from .reactions import (
+    count_statement, dialect_name, insert_ignore, same_reaction, toggle_statement,
+)
+
+router = APIRouter(prefix="/reactions", tags=["Reactions"])
+
+
+async def _toggle_fallback(db: AsyncSession, values: dict, column):
+    removed = (await db.execute(delete(models.Reaction).where(*same_reaction(values)))).rowcount
+    added = 0 if removed else (await db.execute(insert_ignore(db, values))).rowcount
+
+    await db.execute(counters.bump_statement(values["shoutout_id"], column, added - removed))
+    count = (await db.execute(count_statement(values["shoutout_id"], column))).scalar()
+    return bool(added), count
+
+
+@router.post("/{shoutout_id}", status_code=status.HTTP_201_CREATED)
+async def add_reaction(
+    shoutout_id: int,
+    reaction: schemas.ReactionCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: schemas.Principal = Depends(security.get_current_principal_async)
+):
+    shoutout = await db.get(models.Shoutout, shoutout_id)
+    if not shoutout:
+        raise HTTPException(status_code=404, detail="Shoutout not found")
+
+    inserted = (await db.execute(insert_ignore(db, {
+        "shoutout_id": shoutout_id,
+        "user_id": current_user.id,
+        "type": reaction.type,
+    }))).rowcount
+
+    column = counters.reaction_counter(reaction.type)
+    if inserted:
+        await db.execute(counters.bump_statement(shoutout_id, column))
+        for stmt in aggregates.reaction_statements(db, shoutout_id, reaction.type, 1):
+            await db.execute(stmt)
+        count = (await db.execute(count_statement(shoutout_id, column))).scalar()
+    await db.commit()
+    if inserted:
+        feed_cache.invalidate_feed()
+        events.publish("reaction.updated", {
+            "shoutout_id": shoutout_id,
+            "type": reaction.type,
+            "count": count,
+            "user_id": current_user.id,
+            "active": True,
+        })
+
+    return {"message": f"Reaction '{reaction.type}' added successfully"}
+
+
+@router.post("/{shoutout_id}/toggle", response_model=schemas.ReactionToggleResponse)
+async def toggle_reaction(
+    shoutout_id: int,
+    reaction: schemas.ReactionCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: schemas.Principal = Depends(security.get_current_principal_async)
+):
+    values = {
+        "shoutout_id": shoutout_id,
+        "user_id": current_user.id,
+        "type": reaction.type,
+    }
+    column = counters.reaction_counter(reaction.type)
+
+    try:
+        if dialect_name(db) == "postgresql":
+            row = (await db.execute(toggle_statement(db, values, column))).one()
+            active, count = bool(row.added), row.count
+        else:
+            active, count = await _toggle_fallback(db, values, column)
+    except IntegrityError:
+        # Foreign key violation: the shoutout does not exist
+        await db.rollback()
+        raise HTTPException(status_code=404, detail="Shoutout not found")
+
+    if count is None:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail="Shoutout not found")
+
+    for stmt in aggregates.reaction_statements(db, shoutout_id, reaction.type, 1 if active else -1):
+        await db.execute(stmt)
+    await db.commit()
+    feed_cache.invalidate_feed()
+
+    result = {
+        "shoutout_id": shoutout_id,
+        "type": reaction.type,
+        "active": active,
+        "count": count,
+    }
+    events.publish("reaction.updated", {**result, "user_id": current_user.id})
+
+    return result
@@ -0,0 +1,87 @@
+# Backend/routers/async_shoutouts.py
+# AsyncSession versions of the feed reads, mounted ahead of routers/shoutouts.py
+# when DB_ASYNC=true (see main.py). Writes stay on the sync router.
+from collections import defaultdict
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import schemas, security, feed_cache
+from ..database import get_async_db, read_from_replica
+from .shoutouts import (
+    FeedParams, cache_page, comment_previews_statement, feed_statement,
+    group_comment_previews, group_my_reactions, group_recipients,
+    my_reactions_statement, page_items, recipients_statement,
+    shoutout_statement, to_response, trim_page,
+)
+
+router = APIRouter(prefix="/shoutouts", tags=["Shoutouts"])
+
+
+async def _my_reactions(db: AsyncSession, user: Optional[schemas.Principal], shoutout_ids: List[int]):
+    if user is None or not shoutout_ids:
+        return defaultdict(list)
+    return group_my_reactions(await db.execute(my_reactions_statement(user, shoutout_ids)))
+
+
+async def _page_items(db: AsyncSession, rows: list) -> List[dict]:
+    if not rows:
+        return []
+    recipients = group_recipients(await db.execute(recipients_statement([r.id for r in rows])))
+    return page_items(rows, recipients)
+
+
+async def _comment_previews(db: AsyncSession, params: FeedParams, shoutouts: list) -> Optional[dict]:
+    if not params.comments:
+        return None
+    if not shoutouts:
+        return {}
+    stmt = comment_previews_statement([s.id for s in shoutouts], params.comments)
+    return group_comment_previews((await db.execute(stmt)).scalars())
+
+
+# -----------------------------
+# GET ALL SHOUTOUTS (KEYSET PAGINATED)
+# -----------------------------
+@router.get("/", response_model=List[schemas.FeedItem])
+async def get_all_shoutouts(
+    request: Request,
+    response: Response,
+    params: FeedParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[schemas.Principal] = Depends(security.get_current_principal_optional_async),
+):
+    key = feed_cache.page_key(feed_cache.current_generation(), params)
+    page = feed_cache.feed_cache.get(key)
+    if page is None:
+        rows = trim_page((await db.execute(feed_statement(params))).all(), params, response)
+        items = await _page_items(db, rows)
+        previews = await _comment_previews(db, params, rows)
+        page = cache_page(key, items, response, previews, store=not read_from_replica(request))
+
+    mine = await _my_reactions(db, current_user, [item["id"] for item in page["items"]])
+
+    etag = feed_cache.etag_for(page, mine)
+    if feed_cache.not_modified(request, etag):
+        return feed_cache.not_modified_response(etag, response)
+    return feed_cache.page_response(page, mine, etag, response)
+
+
+# -----------------------------
+# GET SINGLE SHOUTOUT
+# -----------------------------
+@router.get("/{shoutout_id}", response_model=schemas.ShoutoutResponse)
+async def get_shoutout(
+    shoutout_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[schemas.Principal] = Depends(security.get_current_principal_optional_async),
+):
+    s = (await db.execute(shoutout_statement(shoutout_id))).scalars().first()
+
+    if not s:
+        raise HTTPException(status_code=404, detail="Shoutout not found")
+
+    mine = await _my_reactions(db, current_user, [s.id])
+
+    return to_response(s, mine[s.id])
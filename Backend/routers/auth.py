@@ -2,8 +2,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordBearer
-from passlib.hash import argon2 # Make sure argon2-cffi is installed
+from starlette.concurrency import run_in_threadpool
 from .. import models, schemas, security
+from ..hashing import hash_password_async, verify_and_update_async
 from ..database import get_db
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -11,40 +12,35 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-# --- Helper functions using Argon2 ---
+# --- Routes ---
 
-def hash_password(password: str) -> str:
-    """
-    Hashes the password using Argon2.
-    """
-    return argon2.hash(password)
+# register/login are async so that Argon2 runs on the dedicated hashing pool
+# (see hashing.py) without holding a shared threadpool worker; their short
+# DB calls are pushed to the threadpool explicitly.
 
+def _find_user_by_email(db: Session, email: str):
+    return db.query(models.User).filter(models.User.email == email).first()
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """
-    Verifies a password against its Argon2 hash.
-    """
-    try:
-        return argon2.verify(plain_password, hashed_password)
-    except Exception:
-        # Catches verification failures (mismatch, invalid hash format)
-        return False
 
+def _save_user(db: Session, new_user: models.User):
+    # Also used to persist a rehashed password on login
+    db.add(new_user)
+    db.commit()
+    db.refresh(new_user)
 
-# --- Routes ---
 
 @router.post("/register", status_code=status.HTTP_201_CREATED) # Added status code
-def register_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
+async def register_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
     """
     Registers a new user. Hashes the password using Argon2.
     Returns a success message.
     """
     # Check if user already exists
-    existing_user = db.query(models.User).filter(models.User.email == user.email).first()
+    existing_user = await run_in_threadpool(_find_user_by_email, db, user.email)
     if existing_user:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
 
-    hashed_pw = hash_password(user.password)
+    hashed_pw = await hash_password_async(user.password)
     new_user = models.User(
         name=user.name,
         email=user.email,
@@ -52,29 +48,37 @@ def register_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
         department=user.department,
         role=user.role
     )
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await run_in_threadpool(_save_user, db, new_user)
     # Changed response to be more informative, consider returning user data (schemas.User)
     return {"message": f"User '{new_user.email}' registered successfully"}
 
 
 @router.post("/login", response_model=schemas.Token)
-def login_user(user: schemas.UserLogin, db: Session = Depends(get_db)):
+async def login_user(user: schemas.UserLogin, db: Session = Depends(get_db)):
     """
     Logs in a user, verifies credentials, and returns access + refresh tokens.
     """
-    db_user = db.query(models.User).filter(models.User.email == user.email).first()
-    if not db_user or not verify_password(user.password, db_user.hashed_password):
+    db_user = await run_in_threadpool(_find_user_by_email, db, user.email)
+    valid, new_hash = (
+        await verify_and_update_async(user.password, db_user.hashed_password)
+        if db_user else (False, None)
+    )
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
             headers={"WWW-Authenticate": "Bearer"}, # Standard header for auth errors
         )
+    security.check_active(db_user)
+
+    # Transparently upgrade hashes made with outdated Argon2 parameters
+    if new_hash:
+        db_user.hashed_password = new_hash
+        await run_in_threadpool(_save_user, db, db_user)
 
     # Use functions from security.py to create tokens
-    access_token = security.create_access_token({"sub": db_user.email})
-    refresh_token = security.create_refresh_token({"sub": db_user.email})
+    access_token = security.create_access_token(security.user_token_claims(db_user))
+    refresh_token = security.create_refresh_token(security.refresh_token_claims(db_user))
 
     return {
         "access_token": access_token,
@@ -93,31 +97,30 @@ async def read_users_me(current_user: models.User = Depends(security.get_current
 # -----------------------------
 
 
-# --- Optional Refresh Token Endpoint ---
-# Ensure security.py has decode_token and create_access_token
-# Also consider adding refresh token rotation and storage
+# --- Refresh Token Endpoint ---
 @router.post("/refresh", response_model=schemas.Token)
-def refresh_access_token(refresh_token_data: schemas.RefreshTokenRequest, db: Session = Depends(get_db)): # Assuming a schema RefreshTokenRequest exists
+def refresh_access_token(refresh_token_data: schemas.RefreshTokenRequest, db: Session = Depends(get_db)):
     """
     Issues a new access token based on a valid refresh token.
-    (Requires further implementation in security.py and potentially storing refresh tokens)
+    Refused once the user is deactivated/blocked or their token version
+    has moved on (role change, block).
     """
-    payload = security.decode_refresh_token(refresh_token_data.refresh_token) # Assuming decode_refresh_token exists
+    payload = security.decode_refresh_token(refresh_token_data.refresh_token)
     if not payload:
-         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
-
-    # Optional: Check if refresh token is revoked/valid in DB if you implement storage
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
 
     email = payload.get("sub")
     user = db.query(models.User).filter(models.User.email == email).first()
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    if payload.get("ver", 0) != (user.token_version or 0):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token revoked")
+    security.check_active(user)
+
+    new_access_token = security.create_access_token(security.user_token_claims(user))
 
-    new_access_token = security.create_access_token({"sub": email})
-    # Optional: Implement refresh token rotation here
-    
     return {
         "access_token": new_access_token,
-        "refresh_token": refresh_token_data.refresh_token, # Or new rotated token
+        "refresh_token": refresh_token_data.refresh_token,
         "token_type": "bearer"
-    }
\ No newline at end of file
+    }
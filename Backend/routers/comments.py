@@ -1,9 +1,13 @@
 # routers/comments.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import exists, select
+from sqlalchemy.orm import Session, joinedload
 from datetime import datetime
-from .. import models, schemas, security
+from typing import Literal, Optional
+from .. import models, schemas, security, counters, feed_cache, events
 from ..database import get_db
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page, trim_page
+from ..serialization import iso, render
 
 router = APIRouter(prefix="/comments", tags=["Comments"])
 
@@ -30,17 +34,15 @@ def add_comment(
     )
 
     db.add(new_comment)
+    counters.bump(db, shoutout_id, models.Shoutout.comments_count)
     db.commit()
     db.refresh(new_comment)
+    feed_cache.invalidate_feed()
 
-    # 🔥 NEW: Count comments after adding
-    comment_count = (
-        db.query(models.Comment)
-        .filter(models.Comment.shoutout_id == shoutout_id)
-        .count()
-    )
+    # 🔥 Denormalized count, reloaded with the committed shoutout row
+    comment_count = shoutout.comments_count
 
-    return {
+    created = {
         "id": new_comment.id,
         "content": new_comment.content,
         "created_at": new_comment.created_at,
@@ -51,6 +53,51 @@ def add_comment(
             "email": current_user.email,
         },
     }
+    events.publish("comment.created", {
+        "shoutout_id": shoutout_id,
+        "comments_count": comment_count,
+        "comment": created,
+    })
+
+    return created
+
+
+# -----------------------------------
+#   READ HELPERS (shared with async_comments.py)
+# -----------------------------------
+def thread_statement(shoutout_id: int, order: str, cursor: Optional[str], limit: int):
+    """
+    SELECT for one page of a shoutout's comments (plus one look-ahead
+    row) with their authors joined in. Served by
+    ix_comments_shoutout_created_at_id.
+    """
+    stmt = (
+        select(models.Comment)
+        .options(joinedload(models.Comment.user))
+        .where(models.Comment.shoutout_id == shoutout_id)
+    )
+    return keyset_page(stmt, models.Comment, cursor, limit, oldest_first=(order == "oldest"))
+
+
+def shoutout_exists_statement(shoutout_id: int):
+    return select(exists().where(models.Shoutout.id == shoutout_id))
+
+
+def comment_to_response(c: models.Comment) -> dict:
+    """
+    JSON-ready schemas.CommentResponse dict (see serialization.py).
+    """
+    return {
+        "id": c.id,
+        "user": {
+            "id": c.user.id,
+            "name": c.user.name,
+            "email": c.user.email,
+            "department": c.user.department,
+        },
+        "content": c.content,
+        "created_at": iso(c.created_at),
+    }
 
 
 # -----------------------------------
@@ -59,33 +106,25 @@ def add_comment(
 @router.get("/{shoutout_id}", response_model=list[schemas.CommentResponse])
 def get_comments_for_shoutout(
     shoutout_id: int,
+    response: Response,
+    order: Literal["oldest", "newest"] = "oldest",
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_user),
+    current_user: schemas.Principal = Depends(security.get_current_principal),
 ):
-    shoutout = db.query(models.Shoutout).filter(models.Shoutout.id == shoutout_id).first()
-    if not shoutout:
+    """
+    One page of the thread in a single query; the cursor for the next
+    page is sent in X-Next-Cursor. The shoutout is only looked up when
+    the page comes back empty, to tell "no comments" from 404.
+    """
+    comments = db.execute(thread_statement(shoutout_id, order, cursor, limit)).scalars().all()
+    if not comments and not db.execute(shoutout_exists_statement(shoutout_id)).scalar():
         raise HTTPException(status_code=404, detail="Shoutout not found")
 
-    comments = (
-        db.query(models.Comment)
-        .filter(models.Comment.shoutout_id == shoutout_id)
-        .order_by(models.Comment.created_at.asc())
-        .all()
-    )
+    comments = trim_page(comments, limit, response)
 
-    return [
-        {
-            "id": c.id,
-            "content": c.content,
-            "created_at": c.created_at,
-            "user": {
-                "id": c.user.id,
-                "name": c.user.name,
-                "email": c.user.email,
-            },
-        }
-        for c in comments
-    ]
+    return render([comment_to_response(c) for c in comments], response)
 
 
 # -----------------------------------
@@ -96,7 +135,7 @@ def flag_comment(
     comment_id: int,
     payload: dict,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_user)
+    current_user: schemas.Principal = Depends(security.get_current_principal)
 ):
     comment = db.query(models.Comment).filter(models.Comment.id == comment_id).first()
 
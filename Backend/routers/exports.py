@@ -0,0 +1,175 @@
+# Backend/routers/exports.py
+"""
+Streaming admin exports for analytics: NDJSON (default) or CSV.
+
+Rows are read in id order through a server-side cursor (stream_results +
+yield_per) and written out one batch at a time by a generator, so memory
+stays flat however many rows match and the first bytes leave as soon as
+the first batch is read. Exports run on the read replica when one is
+configured.
+
+Incremental pulls: pass the largest id already received as since_id.
+"""
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from typing import Iterator, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from .. import models, schemas, security
+from ..database import engine, replica_engine
+from ..serialization import iso
+
+router = APIRouter(prefix="/admin/export", tags=["Admin"])
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+# -----------------------------
+# 📄 Export Definitions
+# -----------------------------
+def _shoutouts_statement():
+    S, U = models.Shoutout, models.User
+    return (
+        select(
+            S.id, S.created_at, S.sender_id,
+            U.name.label("sender_name"), U.department.label("sender_department"),
+            S.message, S.comments_count, S.like_count, S.clap_count, S.star_count,
+        )
+        .outerjoin(U, U.id == S.sender_id)
+    )
+
+
+def _comments_statement():
+    C, U = models.Comment, models.User
+    return (
+        select(
+            C.id, C.shoutout_id, C.created_at, C.user_id,
+            U.name.label("user_name"), C.content, C.is_flagged, C.flag_reason,
+        )
+        .outerjoin(U, U.id == C.user_id)
+    )
+
+
+def _reactions_statement():
+    R = models.Reaction
+    return select(R.id, R.shoutout_id, R.user_id, R.type)
+
+
+# kind: (model, statement builder, has created_at)
+EXPORTS = {
+    "shoutouts": (models.Shoutout, _shoutouts_statement, True),
+    "comments": (models.Comment, _comments_statement, True),
+    "reactions": (models.Reaction, _reactions_statement, False),
+}
+
+
+def _recipients(conn, shoutout_ids) -> dict:
+    R = models.ShoutoutRecipient
+    recipients = {sid: [] for sid in shoutout_ids}
+    rows = conn.execute(
+        select(R.shoutout_id, R.recipient_id)
+        .where(R.shoutout_id.in_(shoutout_ids))
+        .order_by(R.shoutout_id, R.id)
+    )
+    for shoutout_id, recipient_id in rows:
+        recipients[shoutout_id].append(recipient_id)
+    return recipients
+
+
+def _plain(value):
+    if isinstance(value, datetime):
+        return iso(value)
+    return getattr(value, "value", value)   # enums to str
+
+
+# -----------------------------
+# 🚰 Streaming
+# -----------------------------
+def _batches(kind: str, stmt) -> Iterator[list]:
+    """
+    Lists of row dicts, EXPORT_BATCH_SIZE at a time, from a server-side
+    cursor. The connection is held only while the export streams.
+    """
+    bind = replica_engine if replica_engine is not None else engine
+    with bind.connect() as conn:
+        result = conn.execution_options(
+            stream_results=True, yield_per=EXPORT_BATCH_SIZE,
+        ).execute(stmt)
+        for partition in result.mappings().partitions():
+            batch = [{key: _plain(value) for key, value in row.items()} for row in partition]
+            if kind == "shoutouts":
+                recipients = _recipients(conn, [row["id"] for row in batch])
+                for row in batch:
+                    row["recipient_ids"] = recipients[row["id"]]
+            yield batch
+
+
+def _ndjson(batches) -> Iterator[str]:
+    for batch in batches:
+        yield "".join(json.dumps(row) + "\n" for row in batch)
+
+
+def _csv(batches) -> Iterator[str]:
+    header_written = False
+    for batch in batches:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in batch:
+            if not header_written:
+                writer.writerow(row.keys())
+                header_written = True
+            writer.writerow(
+                ";".join(map(str, value)) if isinstance(value, list) else value
+                for value in row.values()
+            )
+        yield buffer.getvalue()
+
+
+# -----------------------------
+# 📤 Export Endpoint
+# -----------------------------
+@router.get("/{kind}")
+def export(
+    kind: Literal["shoutouts", "comments", "reactions"],
+    format: Literal["ndjson", "csv"] = "ndjson",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    since_id: Optional[int] = None,
+    current_user: schemas.Principal = Depends(security.get_current_admin_user),
+):
+    """
+    Stream every matching row in id order. since/until filter created_at
+    (inclusive/exclusive); since_id returns only rows with a larger id.
+    Shoutout rows carry recipient_ids (";"-joined in CSV).
+    """
+    model, build_statement, has_created_at = EXPORTS[kind]
+    stmt = build_statement()
+
+    if since is not None or until is not None:
+        if not has_created_at:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{kind} have no timestamp; use since_id for incremental exports",
+            )
+        if since is not None:
+            stmt = stmt.where(model.created_at >= since)
+        if until is not None:
+            stmt = stmt.where(model.created_at < until)
+    if since_id is not None:
+        stmt = stmt.where(model.id > since_id)
+    stmt = stmt.order_by(model.id)
+
+    write = _csv if format == "csv" else _ndjson
+    return StreamingResponse(
+        write(_batches(kind, stmt)),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{kind}.{format}"'},
+    )
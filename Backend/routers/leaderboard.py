@@ -0,0 +1,114 @@
+# Backend/routers/leaderboard.py
+from datetime import date, datetime, timedelta
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from .. import models, schemas, security
+from ..database import get_db
+
+router = APIRouter(prefix="/leaderboard", tags=["Leaderboard"])
+
+# Days per window; None = all-time (served from user_stats)
+WINDOWS = {"week": 7, "month": 30, "all": None}
+
+# Same weights the dashboard used when it scored the feed client-side
+SENT_POINTS = 5
+RECEIVED_POINTS = 2
+
+
+def _since(window: str) -> Optional[date]:
+    days = WINDOWS[window]
+    if days is None:
+        return None
+    return datetime.utcnow().date() - timedelta(days=days - 1)
+
+
+def _per_user(since: Optional[date]):
+    """
+    (user_id, sent, received) per user since the given day, from the rollups.
+    """
+    if since is None:
+        S = models.UserStats
+        return select(
+            S.user_id,
+            S.sent_count.label("sent"),
+            S.received_count.label("received"),
+        ).subquery()
+
+    D = models.UserDailyStats
+    return (
+        select(
+            D.user_id,
+            func.sum(D.sent_count).label("sent"),
+            func.sum(D.received_count).label("received"),
+        )
+        .where(D.day >= since)
+        .group_by(D.user_id)
+        .subquery()
+    )
+
+
+def _top_users(db: Session, per_user, rank_by: str, limit: int):
+    columns = {
+        "sent": per_user.c.sent,
+        "received": per_user.c.received,
+        "points": per_user.c.sent * SENT_POINTS + per_user.c.received * RECEIVED_POINTS,
+    }
+    rank = columns[rank_by]
+    rows = db.execute(
+        select(
+            per_user.c.user_id, models.User.name, models.User.department,
+            per_user.c.sent, per_user.c.received, columns["points"].label("points"),
+        )
+        .join(models.User, models.User.id == per_user.c.user_id)
+        .where(rank > 0)
+        .order_by(rank.desc(), per_user.c.user_id)
+        .limit(limit)
+    ).all()
+    return [schemas.LeaderboardUser(**row._mapping) for row in rows]
+
+
+def _top_departments(db: Session, per_user, limit: int):
+    sent = func.sum(per_user.c.sent)
+    received = func.sum(per_user.c.received)
+    points = sent * SENT_POINTS + received * RECEIVED_POINTS
+    rows = db.execute(
+        select(
+            models.User.department,
+            sent.label("sent"), received.label("received"), points.label("points"),
+        )
+        .join(models.User, models.User.id == per_user.c.user_id)
+        .group_by(models.User.department)
+        .having(points > 0)
+        .order_by(points.desc(), models.User.department)
+        .limit(limit)
+    ).all()
+    return [schemas.LeaderboardDepartment(**row._mapping) for row in rows]
+
+
+@router.get("/", response_model=schemas.Leaderboard)
+def get_leaderboard(
+    window: Literal["week", "month", "all"] = "week",
+    limit: int = Query(5, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: schemas.Principal = Depends(security.get_current_principal),
+):
+    """
+    Top users (points = 5 per shoutout sent + 2 per shoutout received),
+    senders, recipients and departments for the window. Reads only the
+    per-user rollups kept by aggregates.py, never the shoutouts themselves.
+    """
+    since = _since(window)
+    per_user = _per_user(since)
+
+    return schemas.Leaderboard(
+        window=window,
+        since=since,
+        top_users=_top_users(db, per_user, "points", limit),
+        top_senders=_top_users(db, per_user, "sent", limit),
+        top_recipients=_top_users(db, per_user, "received", limit),
+        top_departments=_top_departments(db, per_user, limit),
+    )
@@ -0,0 +1,28 @@
+# Backend/routers/metrics.py
+from fastapi import APIRouter, Depends
+
+from .. import events, feed_cache, hashing, schemas, security
+from ..database import get_pool_stats
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics")
+def get_metrics(
+    current_user: schemas.Principal = Depends(security.get_current_admin_user),
+):
+    """
+    Runtime counters for capacity planning: DB connection pool usage and
+    checkout wait time, cache hit ratios and password-hashing latency.
+    Admins only.
+    """
+    return {
+        "db_pool": get_pool_stats(),
+        "caches": {
+            "users": security.user_cache.stats(),
+            "token_versions": security.token_version_cache.stats(),
+            "feed": feed_cache.feed_cache.stats(),
+        },
+        "password_hashing": hashing.metrics.snapshot(),
+        "stream": events.hub.stats(),
+    }
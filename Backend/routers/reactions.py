@@ -1,35 +1,176 @@
 # Backend/routers/reactions.py
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from .. import models, schemas, security
+from .. import models, schemas, security, counters, feed_cache, events, aggregates
 from ..database import get_db
 
 router = APIRouter(prefix="/reactions", tags=["Reactions"])
 
+REACTION_KEY = ["shoutout_id", "user_id", "type"]
+
+
+# Statement builders below are shared with async_reactions.py
+# (both Session and AsyncSession provide get_bind()).
+
+def dialect_name(db) -> str:
+    return db.get_bind().dialect.name
+
+
+def same_reaction(values: dict) -> list:
+    return [getattr(models.Reaction, key) == values[key] for key in REACTION_KEY]
+
+
+def insert_ignore(db, values: dict):
+    """
+    INSERT ... ON CONFLICT (shoutout_id, user_id, type) DO NOTHING
+    for the current dialect.
+    """
+    insert = pg_insert if dialect_name(db) == "postgresql" else sqlite_insert
+    return (
+        insert(models.Reaction)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=REACTION_KEY)
+    )
+
+
+def toggle_statement(db, values: dict, column):
+    """
+    Postgres: insert-or-delete plus counter update in ONE statement using
+    data-modifying CTEs. Selects (added, count).
+    """
+    R = models.Reaction
+
+    ins = insert_ignore(db, values).returning(R.id).cte("ins")
+    added = select(func.count()).select_from(ins).scalar_subquery()
+
+    removed_rows = (
+        delete(R)
+        .where(*same_reaction(values), ~exists(select(ins.c.id)))
+        .returning(R.id)
+        .cte("del")
+    )
+    removed = select(func.count()).select_from(removed_rows).scalar_subquery()
+
+    upd = (
+        update(models.Shoutout)
+        .where(models.Shoutout.id == values["shoutout_id"])
+        .values({column: column + added - removed})
+        .returning(column.label("count"))
+        .cte("upd")
+    )
+
+    return select(added.label("added"), select(upd.c["count"]).scalar_subquery().label("count"))
+
+
+def count_statement(shoutout_id: int, column):
+    return select(column).where(models.Shoutout.id == shoutout_id)
+
+
+def _toggle_postgres(db: Session, values: dict, column):
+    row = db.execute(toggle_statement(db, values, column)).one()
+    return bool(row.added), row.count
+
+
+def _toggle_fallback(db: Session, values: dict, column):
+    """
+    SQLite/dev path: DELETE, and INSERT only if nothing was deleted.
+    Same result as the Postgres path, in a single transaction.
+    """
+    removed = db.execute(delete(models.Reaction).where(*same_reaction(values))).rowcount
+    added = 0 if removed else db.execute(insert_ignore(db, values)).rowcount
+
+    counters.bump(db, values["shoutout_id"], column, added - removed)
+    count = db.execute(count_statement(values["shoutout_id"], column)).scalar()
+    return bool(added), count
+
+
 @router.post("/{shoutout_id}", status_code=status.HTTP_201_CREATED)
 def add_reaction(
     shoutout_id: int,
     reaction: schemas.ReactionCreate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_user)
+    current_user: schemas.Principal = Depends(security.get_current_principal)
 ):
     """
     Add a reaction (like, clap, star) to a shoutout.
+    Idempotent: reacting twice with the same type keeps a single reaction.
     """
     # Ensure the shoutout exists
     shoutout = db.query(models.Shoutout).filter(models.Shoutout.id == shoutout_id).first()
     if not shoutout:
         raise HTTPException(status_code=404, detail="Shoutout not found")
 
-    # Create reaction
-    new_reaction = models.Reaction(
-        shoutout_id=shoutout_id,
-        user_id=current_user.id,
-        type=reaction.type
-    )
+    inserted = db.execute(insert_ignore(db, {
+        "shoutout_id": shoutout_id,
+        "user_id": current_user.id,
+        "type": reaction.type,
+    })).rowcount
 
-    db.add(new_reaction)
+    column = counters.reaction_counter(reaction.type)
+    if inserted:
+        counters.bump(db, shoutout_id, column)
+        aggregates.record_reaction(db, shoutout_id, reaction.type, 1)
+        count = db.execute(count_statement(shoutout_id, column)).scalar()
     db.commit()
-    db.refresh(new_reaction)
+    if inserted:
+        feed_cache.invalidate_feed()
+        events.publish("reaction.updated", {
+            "shoutout_id": shoutout_id,
+            "type": reaction.type,
+            "count": count,
+            "user_id": current_user.id,
+            "active": True,
+        })
 
     return {"message": f"Reaction '{reaction.type}' added successfully"}
+
+
+@router.post("/{shoutout_id}/toggle", response_model=schemas.ReactionToggleResponse)
+def toggle_reaction(
+    shoutout_id: int,
+    reaction: schemas.ReactionCreate,
+    db: Session = Depends(get_db),
+    current_user: schemas.Principal = Depends(security.get_current_principal)
+):
+    """
+    Toggle the caller's reaction of the given type on a shoutout and
+    return the new total for that type in the same round trip.
+    """
+    values = {
+        "shoutout_id": shoutout_id,
+        "user_id": current_user.id,
+        "type": reaction.type,
+    }
+    column = counters.reaction_counter(reaction.type)
+
+    try:
+        if dialect_name(db) == "postgresql":
+            active, count = _toggle_postgres(db, values, column)
+        else:
+            active, count = _toggle_fallback(db, values, column)
+    except IntegrityError:
+        # Foreign key violation: the shoutout does not exist
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Shoutout not found")
+
+    if count is None:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Shoutout not found")
+
+    aggregates.record_reaction(db, shoutout_id, reaction.type, 1 if active else -1)
+    db.commit()
+    feed_cache.invalidate_feed()
+
+    result = {
+        "shoutout_id": shoutout_id,
+        "type": reaction.type,
+        "active": active,
+        "count": count,
+    }
+    events.publish("reaction.updated", {**result, "user_id": current_user.id})
+
+    return result
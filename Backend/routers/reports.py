@@ -2,8 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
-from .. import models, database
-from ..security import get_current_user
+from .. import models, schemas, database, counters
+from ..security import get_current_principal
 
 router = APIRouter(
     prefix="/reports",
@@ -20,7 +20,7 @@ def report_shoutout(
     shoutout_id: int,
     payload: ReportCreate,
     db: Session = Depends(database.get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: schemas.Principal = Depends(get_current_principal)
 ):
 
     shoutout = db.query(models.Shoutout).filter(
@@ -40,6 +40,7 @@ def report_shoutout(
     )
 
     db.add(report)
+    counters.bump(db, shoutout_id, models.Shoutout.reports_count)
     db.commit()
 
     return {"message": "Shoutout reported successfully"}
@@ -0,0 +1,43 @@
+# Backend/routers/search.py
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.orm import Session
+
+from .. import fulltext, schemas, security
+from ..database import get_db
+from ..pagination import (
+    DEFAULT_PAGE_SIZE, MAX_OFFSET, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER,
+    decode_offset_cursor, encode_offset_cursor,
+)
+
+router = APIRouter(tags=["Search"])
+
+
+@router.get("/search", response_model=List[schemas.SearchHit])
+def search(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: schemas.Principal = Depends(security.get_current_principal),
+):
+    """
+    Ranked full-text search over shoutout messages and comments (see
+    fulltext.py). All words must match; the last one may be a prefix.
+    The cursor for the next page is sent in the X-Next-Cursor header.
+    """
+    terms = fulltext.search_terms(q)
+    if not terms:
+        return []
+
+    offset = decode_offset_cursor(cursor) if cursor else 0
+    rows = db.execute(fulltext.search_statement(db, terms, limit + 1, offset)).all()
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if offset + limit <= MAX_OFFSET:
+            response.headers[NEXT_CURSOR_HEADER] = encode_offset_cursor(offset + limit)
+
+    return [schemas.SearchHit(**row._mapping) for row in rows]
@@ -1,13 +1,99 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
-from typing import List
-from .. import models, schemas, security
-from ..database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError
+from typing import List, Optional
+from datetime import datetime
+from collections import defaultdict
+from .. import models, schemas, security, feed_cache, events, aggregates
+from ..serialization import iso
+from ..database import get_db, read_from_replica
+from .. import pagination
+from .comments import comment_to_response
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+
+# Upper bound for ?comments=N on the feed
+MAX_COMMENT_PREVIEWS = 10
 
 router = APIRouter(prefix="/shoutouts", tags=["Shoutouts"])
 
 
+# -----------------------------
+# CREATE HELPERS
+# -----------------------------
+def _check_user_ids(db: Session, items: List[tuple]):
+    """
+    400 unless every sender and recipient id names an existing user
+    (one query for the whole batch).
+    """
+    user_ids = {sender_id for sender_id, _ in items}
+    user_ids.update(r_id for _, shoutout in items for r_id in shoutout.recipient_ids)
+    known = set(db.execute(
+        select(models.User.id).where(models.User.id.in_(user_ids))
+    ).scalars())
+    unknown = sorted(user_ids - known)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown sender or recipient id: {', '.join(map(str, unknown))}",
+        )
+
+
+def _insert_shoutouts(db: Session, items: List[tuple]) -> List[int]:
+    """
+    Insert (sender_id, ShoutoutCreate) pairs in the caller's transaction:
+    one flush for the shoutouts, then all recipients in a single
+    executemany INSERT, then the leaderboard rollups. Returns the new
+    shoutout ids. Does not commit.
+    """
+    _check_user_ids(db, items)
+
+    new_shoutouts = [
+        models.Shoutout(sender_id=sender_id, message=shoutout.message)
+        for sender_id, shoutout in items
+    ]
+    try:
+        db.add_all(new_shoutouts)
+        db.flush()
+
+        recipient_rows = [
+            {"shoutout_id": new_shoutout.id, "recipient_id": r_id}
+            for new_shoutout, (_, shoutout) in zip(new_shoutouts, items)
+            for r_id in dict.fromkeys(shoutout.recipient_ids)   # de-duplicated, order kept
+        ]
+        if recipient_rows:
+            db.execute(insert(models.ShoutoutRecipient), recipient_rows)
+    except IntegrityError:
+        # A user deleted since _check_user_ids
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Unknown sender or recipient id")
+
+    new_ids = [new_shoutout.id for new_shoutout in new_shoutouts]
+    aggregates.record_shoutouts(db, new_ids)
+    return new_ids
+
+
+def _publish_created(db: Session, new_ids: List[int]):
+    # Skip reloading the rows when nobody is listening on /stream
+    if not events.hub.has_subscribers():
+        return
+    stmt = (
+        _with_relations(select(models.Shoutout))
+        .where(models.Shoutout.id.in_(new_ids))
+        .order_by(models.Shoutout.id)
+    )
+    for s in db.execute(stmt).scalars():
+        events.publish("shoutout.created", to_response(s))
+
+
+def _commit_or_400(db: Session):
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Unknown sender or recipient id")
+
+
 # -----------------------------
 # CREATE SHOUTOUT
 # -----------------------------
@@ -15,115 +101,389 @@ router = APIRouter(prefix="/shoutouts", tags=["Shoutouts"])
 def create_shoutout(
     shoutout: schemas.ShoutoutCreate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_user),
+    current_user: schemas.Principal = Depends(security.get_current_principal),
 ):
-    new_shoutout = models.Shoutout(
-        sender_id=current_user.id,
-        message=shoutout.message,
-    )
-    db.add(new_shoutout)
-    db.commit()
-    db.refresh(new_shoutout)
+    [new_id] = _insert_shoutouts(db, [(current_user.id, shoutout)])
+    _commit_or_400(db)
+    feed_cache.invalidate_feed()
+    _publish_created(db, [new_id])
 
-    for r_id in shoutout.recipient_ids:
-        db.add(models.ShoutoutRecipient(
-            shoutout_id=new_shoutout.id,
-            recipient_id=r_id,
-        ))
+    return {"message": "Shoutout created successfully", "id": new_id}
 
-    db.commit()
 
-    return {"message": "Shoutout created successfully", "id": new_shoutout.id}
+# -----------------------------
+# BULK CREATE SHOUTOUTS (ADMIN / HR IMPORT)
+# -----------------------------
+@router.post("/bulk", status_code=status.HTTP_201_CREATED)
+def create_shoutouts_bulk(
+    payload: schemas.ShoutoutBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: schemas.Principal = Depends(security.get_current_admin_user),
+):
+    """
+    Creates many shoutouts in a single transaction. Each item may set
+    sender_id to post on behalf of another user. All or nothing.
+    """
+    new_ids = _insert_shoutouts(db, [
+        (item.sender_id or current_user.id, item) for item in payload.shoutouts
+    ])
+    _commit_or_400(db)
+    feed_cache.invalidate_feed()
+    _publish_created(db, new_ids)
+
+    return {"message": f"{len(new_ids)} shoutouts created successfully", "ids": new_ids}
 
 
 # -----------------------------
-# GET ALL SHOUTOUTS
+# READ HELPERS (shared with async_shoutouts.py)
 # -----------------------------
-@router.get("/", response_model=List[schemas.ShoutoutResponse])
-def get_all_shoutouts(db: Session = Depends(get_db)):
-
-    shoutouts = (
-        db.query(models.Shoutout)
-        .options(
-            joinedload(models.Shoutout.sender),
-            joinedload(models.Shoutout.recipients)
-                .joinedload(models.ShoutoutRecipient.recipient),
+class FeedParams:
+    """
+    Query parameters of the feed.
+
+    Optional filters: sender's department, sender_id, recipient_id,
+    since/until (created_at range, inclusive/exclusive) and q (message text).
+    comments=N embeds each shoutout's latest N comments.
+    """
+
+    def __init__(
+        self,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = None,
+        department: Optional[str] = None,
+        sender_id: Optional[int] = None,
+        recipient_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        q: Optional[str] = Query(None, max_length=200),
+        comments: int = Query(0, ge=0, le=MAX_COMMENT_PREVIEWS),
+    ):
+        self.limit = limit
+        self.cursor = cursor
+        self.department = department
+        self.sender_id = sender_id
+        self.recipient_id = recipient_id
+        self.since = since
+        self.until = until
+        self.q = q
+        self.comments = comments
+
+
+def _with_relations(stmt):
+    return stmt.options(
+        joinedload(models.Shoutout.sender),
+        selectinload(models.Shoutout.recipients)
+            .joinedload(models.ShoutoutRecipient.recipient),
+    )
+
+
+# Columns of a feed row: the shoutout plus its sender, flattened. Selected
+# as plain Core rows, so no ORM objects are built or tracked per item.
+FEED_COLUMNS = (
+    models.Shoutout.id,
+    models.Shoutout.message,
+    models.Shoutout.created_at,
+    models.Shoutout.comments_count,
+    models.Shoutout.like_count,
+    models.Shoutout.clap_count,
+    models.Shoutout.star_count,
+    models.User.id.label("sender_id"),
+    models.User.name.label("sender_name"),
+    models.User.email.label("sender_email"),
+    models.User.department.label("sender_department"),
+    models.User.role.label("sender_role"),
+)
+
+
+def feed_statement(params: FeedParams):
+    """
+    SELECT of FEED_COLUMNS for one feed page (plus one look-ahead row),
+    newest first, ordered by (created_at, id). Recipients are loaded
+    separately for the page (recipients_statement).
+    """
+    stmt = select(*FEED_COLUMNS).join(models.User, models.User.id == models.Shoutout.sender_id)
+
+    # 🔍 Filters (pushed down into SQL)
+    if params.department:
+        stmt = stmt.where(models.User.department == params.department)
+    if params.sender_id is not None:
+        stmt = stmt.where(models.Shoutout.sender_id == params.sender_id)
+    if params.recipient_id is not None:
+        stmt = stmt.where(
+            models.Shoutout.recipients.any(
+                models.ShoutoutRecipient.recipient_id == params.recipient_id
+            )
         )
-        .order_by(models.Shoutout.created_at.desc())
-        .all()
+    if params.since is not None:
+        stmt = stmt.where(models.Shoutout.created_at >= params.since)
+    if params.until is not None:
+        stmt = stmt.where(models.Shoutout.created_at < params.until)
+    if params.q and params.q.strip():
+        # autoescape: % and _ in the query match literally
+        stmt = stmt.where(models.Shoutout.message.icontains(params.q.strip(), autoescape=True))
+
+    return pagination.keyset_page(stmt, models.Shoutout, params.cursor, params.limit)
+
+
+def trim_page(shoutouts: list, params: FeedParams, response: Response) -> list:
+    """
+    Drop the look-ahead row and, if there was one, set X-Next-Cursor.
+    """
+    return pagination.trim_page(shoutouts, params.limit, response)
+
+
+def comment_previews_statement(shoutout_ids: List[int], per_shoutout: int):
+    """
+    The latest `per_shoutout` comments of every shoutout on a page, with
+    authors, in one query: ROW_NUMBER() over each shoutout's comments,
+    newest first, keeps the first N. Rows come back oldest first per
+    shoutout, the order threads are shown in.
+    """
+    C = models.Comment
+    ranked = (
+        select(
+            C.id,
+            func.row_number().over(
+                partition_by=C.shoutout_id,
+                order_by=(C.created_at.desc(), C.id.desc()),
+            ).label("rn"),
+        )
+        .where(C.shoutout_id.in_(shoutout_ids))
+        .subquery()
+    )
+    return (
+        select(C)
+        .options(joinedload(C.user))
+        .join(ranked, ranked.c.id == C.id)
+        .where(ranked.c.rn <= per_shoutout)
+        .order_by(C.shoutout_id, C.created_at, C.id)
     )
 
-    # 🔥 Precompute comment counts
-    comment_counts_raw = (
-        db.query(models.Comment.shoutout_id, func.count(models.Comment.id))
-        .group_by(models.Comment.shoutout_id)
-        .all()
+
+def group_comment_previews(comments) -> dict:
+    """
+    {shoutout_id: [comment dict, ...]} from comment_previews_statement rows.
+    """
+    previews = defaultdict(list)
+    for c in comments:
+        previews[c.shoutout_id].append(comment_to_response(c))
+    return previews
+
+
+def fetch_comment_previews(db: Session, params: FeedParams, shoutouts: list) -> Optional[dict]:
+    if not params.comments:
+        return None
+    if not shoutouts:
+        return {}
+    stmt = comment_previews_statement([s.id for s in shoutouts], params.comments)
+    return group_comment_previews(db.execute(stmt).scalars())
+
+
+def recipients_statement(shoutout_ids: List[int]):
+    R = models.ShoutoutRecipient
+    return (
+        select(R.shoutout_id, models.User.id, models.User.name, models.User.department)
+        .join(models.User, models.User.id == R.recipient_id)
+        .where(R.shoutout_id.in_(shoutout_ids))
+        .order_by(R.shoutout_id, R.id)
     )
-    comment_counts = {sid: cnt for sid, cnt in comment_counts_raw}
-
-    result = []
-    for s in shoutouts:
-        result.append(
-            schemas.ShoutoutResponse(
-                id=s.id,
-                message=s.message,
-                sender=s.sender,
-                created_at=s.created_at,
-                recipients=[
-                    schemas.RecipientOut(
-                        id=r.recipient.id,
-                        name=r.recipient.name,
-                        department=r.recipient.department,
-                    ) for r in s.recipients
-                ],
-                comments_count=comment_counts.get(s.id, 0),  # ✅ WORKING COUNT
-            )
+
+
+def group_recipients(rows) -> dict:
+    """
+    {shoutout_id: [RecipientOut dict, ...]} from recipients_statement rows.
+    """
+    recipients = defaultdict(list)
+    for shoutout_id, user_id, name, department in rows:
+        recipients[shoutout_id].append({"id": user_id, "name": name, "department": department})
+    return recipients
+
+
+def page_items(rows: list, recipients: dict) -> List[dict]:
+    """
+    Feed items (without my_reactions) from feed_statement rows.
+    """
+    return [
+        _item(
+            row,
+            {
+                "name": row.sender_name,
+                "email": row.sender_email,
+                "department": row.sender_department,
+                "id": row.sender_id,
+                "role": row.sender_role.value,
+            },
+            recipients.get(row.id, []),
         )
+        for row in rows
+    ]
+
+
+def fetch_page_items(db: Session, rows: list) -> List[dict]:
+    if not rows:
+        return []
+    return page_items(rows, group_recipients(db.execute(recipients_statement([r.id for r in rows]))))
 
-    return result
+
+def shoutout_statement(shoutout_id: int):
+    return _with_relations(select(models.Shoutout)).where(models.Shoutout.id == shoutout_id)
+
+
+def my_reactions_statement(user: schemas.Principal, shoutout_ids: List[int]):
+    """
+    The caller's own reaction types for a page of shoutouts, in one query.
+    """
+    return (
+        select(models.Reaction.shoutout_id, models.Reaction.type)
+        .where(
+            models.Reaction.user_id == user.id,
+            models.Reaction.shoutout_id.in_(shoutout_ids),
+        )
+        .distinct()
+    )
+
+
+def group_my_reactions(rows) -> dict:
+    """
+    {shoutout_id: [type, ...]} from my_reactions_statement rows.
+    """
+    mine = defaultdict(list)
+    for sid, reaction_type in rows:
+        mine[sid].append(reaction_type)
+    return mine
+
+
+def fetch_my_reactions(db: Session, user: Optional[schemas.Principal], shoutout_ids: List[int]):
+    if user is None or not shoutout_ids:
+        return defaultdict(list)
+    return group_my_reactions(db.execute(my_reactions_statement(user, shoutout_ids)))
+
+
+def _item(s, sender: dict, recipients: List[dict], my_reactions: Optional[List[models.ReactionType]] = None) -> dict:
+    """
+    JSON-ready schemas.ShoutoutResponse dict, built without pydantic
+    (see serialization.py). `s` is a Shoutout or a feed_statement row.
+    """
+    return {
+        "message": s.message,
+        "id": s.id,
+        "sender": sender,
+        "recipients": recipients,
+        "created_at": iso(s.created_at),
+        "comments_count": s.comments_count,  # ✅ DENORMALIZED COUNT
+        "reactions": {
+            "like": s.like_count,
+            "clap": s.clap_count,
+            "star": s.star_count,
+        },
+        "my_reactions": [t.value for t in my_reactions or ()],
+    }
+
+
+def to_response(s: models.Shoutout, my_reactions: Optional[List[models.ReactionType]] = None) -> dict:
+    """
+    Item for a Shoutout loaded with _with_relations.
+    """
+    sender = s.sender
+    return _item(
+        s,
+        {
+            "name": sender.name,
+            "email": sender.email,
+            "department": sender.department,
+            "id": sender.id,
+            "role": sender.role.value,
+        },
+        [
+            {
+                "id": r.recipient.id,
+                "name": r.recipient.name,
+                "department": r.recipient.department,
+            } for r in s.recipients
+        ],
+        my_reactions,
+    )
+
+
+def cache_page(key: str, items: List[dict], response: Response,
+               previews: Optional[dict] = None, store: bool = True) -> dict:
+    """
+    Store a trimmed page of feed items (without my_reactions) in the feed
+    cache. `previews` (see fetch_comment_previews) adds each item's "comments".
+    With store=False the page is only built (replica reads, which may lag).
+    """
+    if previews is not None:
+        for item in items:
+            item["comments"] = previews.get(item["id"], [])
+    next_cursor = response.headers.get(NEXT_CURSOR_HEADER)
+    page = {
+        "items": items,
+        "next_cursor": next_cursor,
+        "digest": feed_cache.page_digest(items, next_cursor),
+    }
+    if store:
+        feed_cache.feed_cache.set(key, page)
+    return page
+
+
+# -----------------------------
+# GET ALL SHOUTOUTS (KEYSET PAGINATED)
+# -----------------------------
+@router.get("/", response_model=List[schemas.FeedItem])
+def get_all_shoutouts(
+    request: Request,
+    response: Response,
+    params: FeedParams = Depends(),
+    db: Session = Depends(get_db),
+    current_user: Optional[schemas.Principal] = Depends(security.get_current_principal_optional),
+):
+    """
+    Returns one page of the feed, newest first, ordered by (created_at, id).
+    The cursor for the next page is sent in the X-Next-Cursor header and is
+    absent on the last page.
+
+    Pages are served from the feed cache with a strong ETag over the body;
+    a matching If-None-Match gets 304 without serializing it. Only pages read
+    from the primary are cached, so a cached page never predates a write
+    the caller has already seen (read-your-writes, see database.use_replica).
+
+    With ?comments=N each item also carries its latest N comments, fetched
+    for the whole page in one query.
+    """
+    key = feed_cache.page_key(feed_cache.current_generation(), params)
+    page = feed_cache.feed_cache.get(key)
+    if page is None:
+        rows = trim_page(db.execute(feed_statement(params)).all(), params, response)
+        items = fetch_page_items(db, rows)
+        previews = fetch_comment_previews(db, params, rows)
+        page = cache_page(key, items, response, previews, store=not read_from_replica(request))
+
+    mine = fetch_my_reactions(db, current_user, [item["id"] for item in page["items"]])
+
+    etag = feed_cache.etag_for(page, mine)
+    if feed_cache.not_modified(request, etag):
+        return feed_cache.not_modified_response(etag, response)
+    return feed_cache.page_response(page, mine, etag, response)
 
 
 # -----------------------------
 # GET SINGLE SHOUTOUT
 # -----------------------------
 @router.get("/{shoutout_id}", response_model=schemas.ShoutoutResponse)
-def get_shoutout(shoutout_id: int, db: Session = Depends(get_db)):
-
-    s = (
-        db.query(models.Shoutout)
-        .options(
-            joinedload(models.Shoutout.sender),
-            joinedload(models.Shoutout.recipients)
-                .joinedload(models.ShoutoutRecipient.recipient),
-        )
-        .filter(models.Shoutout.id == shoutout_id)
-        .first()
-    )
+def get_shoutout(
+    shoutout_id: int,
+    db: Session = Depends(get_db),
+    current_user: Optional[schemas.Principal] = Depends(security.get_current_principal_optional),
+):
+
+    s = db.execute(shoutout_statement(shoutout_id)).scalars().first()
 
     if not s:
         raise HTTPException(status_code=404, detail="Shoutout not found")
 
-    # Count comments
-    comment_count = (
-        db.query(func.count(models.Comment.id))
-        .filter(models.Comment.shoutout_id == shoutout_id)
-        .scalar()
-    ) or 0
-
-    return schemas.ShoutoutResponse(
-        id=s.id,
-        message=s.message,
-        sender=s.sender,
-        created_at=s.created_at,
-        recipients=[
-            schemas.RecipientOut(
-                id=r.recipient.id,
-                name=r.recipient.name,
-                department=r.recipient.department,
-            ) for r in s.recipients
-        ],
-        comments_count=comment_count,  # ✅ WORKING COUNT
-    )
+    mine = fetch_my_reactions(db, current_user, [s.id])
+
+    return to_response(s, mine[s.id])
 
 
 # -----------------------------
@@ -133,7 +493,7 @@ def get_shoutout(shoutout_id: int, db: Session = Depends(get_db)):
 def delete_shoutout(
     shoutout_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(security.get_current_user),
+    current_user: schemas.Principal = Depends(security.get_current_principal),
 ):
 
     shoutout = db.query(models.Shoutout).filter(models.Shoutout.id == shoutout_id).first()
@@ -144,7 +504,10 @@ def delete_shoutout(
     if current_user.role != "admin" and shoutout.sender_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to delete")
 
+    aggregates.record_shoutouts(db, [shoutout_id], -1)
     db.delete(shoutout)
     db.commit()
+    feed_cache.invalidate_feed()
+    events.publish("shoutout.deleted", {"id": shoutout_id})
 
     return {"message": "Shoutout deleted successfully"}
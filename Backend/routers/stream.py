@@ -0,0 +1,82 @@
+# Backend/routers/stream.py
+import json
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+
+from .. import events, schemas, security
+from ..database import SessionLocal
+
+router = APIRouter(tags=["Stream"])
+
+STREAM_HEARTBEAT_SECONDS = float(os.getenv("STREAM_HEARTBEAT_SECONDS", 15))
+
+
+def _stream_principal(
+    ticket: Optional[str] = None,
+    header_token: Optional[str] = Depends(security.oauth2_scheme_optional),
+) -> schemas.Principal:
+    """
+    EventSource cannot send headers, so browsers open the stream with
+    ?ticket= from POST /stream/ticket: it expires within seconds and opens
+    nothing else, unlike an access token in the URL (and access logs).
+    The session is closed before streaming starts so a long-lived
+    connection does not hold a pooled DB connection.
+    """
+    if ticket:
+        return security.decode_stream_ticket(ticket)
+    if not header_token:
+        raise security.credentials_exception
+
+    db = SessionLocal()
+    try:
+        return security.get_current_principal(header_token, db)
+    finally:
+        db.close()
+
+
+@router.post("/stream/ticket")
+def create_stream_ticket(current_user: schemas.Principal = Depends(security.get_current_principal)):
+    """
+    Short-lived ticket for opening GET /stream?ticket=... Fetch a new one
+    for every (re)connect; it expires after STREAM_TICKET_SECONDS.
+    """
+    return {
+        "ticket": security.create_stream_ticket(current_user),
+        "expires_in": security.STREAM_TICKET_SECONDS,
+    }
+
+
+def _format(event: dict) -> str:
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    current_user: schemas.Principal = Depends(_stream_principal),
+):
+    """
+    Server-Sent Events feed of shoutout, comment, reaction and moderation
+    changes (see events.py for the event types). A comment line is sent
+    every STREAM_HEARTBEAT_SECONDS to keep proxies from closing the
+    connection. Clients should refetch the feed after reconnecting.
+    """
+    subscription = events.hub.subscribe()
+
+    async def event_source():
+        try:
+            yield "retry: 3000\n\n"
+            while not subscription.closed and not await request.is_disconnected():
+                event = await subscription.get(STREAM_HEARTBEAT_SECONDS)
+                yield _format(event) if event else ": keep-alive\n\n"
+        finally:
+            events.hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
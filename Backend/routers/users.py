@@ -0,0 +1,186 @@
+# Backend/routers/users.py
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import func, or_, select, tuple_
+from sqlalchemy.orm import Session
+
+from .. import models, schemas, security
+from ..serialization import render
+from ..database import get_db
+from ..pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER,
+    decode_name_cursor, encode_name_cursor,
+)
+from .shoutouts import FeedParams, fetch_my_reactions, fetch_page_items, feed_statement, trim_page
+
+router = APIRouter(prefix="/users", tags=["Users"])
+
+# Weights the dashboard's profile card uses for its reaction score
+REACTION_SCORE = {"like_count": 1, "clap_count": 2, "star_count": 3}
+
+
+# -----------------------------
+# USER DIRECTORY (TYPEAHEAD)
+# -----------------------------
+def directory_statement(columns, q: Optional[str], cursor: Optional[str], limit: int):
+    """
+    SELECT of just `columns` for one directory page (plus one look-ahead
+    row), alphabetical by (name, id). `q` matches a case-insensitive
+    prefix of name, email or department via the ix_users_lower_* indexes.
+    """
+    User = models.User
+    stmt = select(*columns)
+
+    if q and q.strip():
+        prefix = q.strip().lower()
+        stmt = stmt.where(or_(
+            func.lower(User.name).startswith(prefix, autoescape=True),
+            func.lower(User.email).startswith(prefix, autoescape=True),
+            func.lower(User.department).startswith(prefix, autoescape=True),
+        ))
+
+    if cursor:
+        name, last_id = decode_name_cursor(cursor)
+        stmt = stmt.where(tuple_(User.name, User.id) > tuple_(name, last_id))
+
+    return stmt.order_by(User.name, User.id).limit(limit + 1)
+
+
+def trim_directory(rows: list, limit: int, response: Response) -> list:
+    """
+    Drop the look-ahead row (setting X-Next-Cursor if there was one) and
+    project the rest to JSON-ready dicts.
+    """
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_name_cursor(rows[-1].name, rows[-1].id)
+    return [
+        {key: getattr(value, "value", value) for key, value in row._mapping.items()}   # enums to str
+        for row in rows
+    ]
+
+
+@router.get("/", response_model=List[schemas.UserDirectoryEntry])
+def list_users(
+    response: Response,
+    q: Optional[str] = Query(None, max_length=100),
+    department: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: schemas.Principal = Depends(security.get_current_principal),
+):
+    """
+    Active users for pickers and @mention typeahead, one page at a time
+    (X-Next-Cursor).
+    """
+    User = models.User
+    stmt = directory_statement(
+        [User.id, User.name, User.email, User.department], q, cursor, limit,
+    ).where(User.is_active.isnot(False))
+    if department:
+        stmt = stmt.where(User.department == department)
+
+    return render(trim_directory(db.execute(stmt).all(), limit, response), response)
+
+
+@router.get("/departments", response_model=List[str])
+def list_departments(
+    db: Session = Depends(get_db),
+    current_user: schemas.Principal = Depends(security.get_current_principal),
+):
+    """
+    Distinct departments of active users, alphabetical, for the feed's
+    department filter. Walks the department index instead of the directory.
+    """
+    User = models.User
+    stmt = (
+        select(User.department)
+        .where(User.department.isnot(None), User.department != "", User.is_active.isnot(False))
+        .distinct()
+        .order_by(User.department)
+    )
+    return db.execute(stmt).scalars().all()
+
+
+# -----------------------------
+# USER STATS
+# -----------------------------
+@router.get("/{user_id}/stats", response_model=schemas.UserStatsResponse)
+def get_user_stats(
+    user_id: int,
+    db: Session = Depends(get_db),
+    current_user: schemas.Principal = Depends(security.get_current_principal),
+):
+    """
+    Sent/received shoutout counts and reactions received, read from the
+    per-user rollup row (aggregates.py) in one primary-key lookup.
+    """
+    S = models.UserStats
+    row = db.execute(
+        select(
+            models.User.id, models.User.name, models.User.department,
+            S.sent_count, S.received_count,
+            S.like_received, S.clap_received, S.star_received,
+        )
+        .outerjoin(S, S.user_id == models.User.id)
+        .where(models.User.id == user_id)
+    ).first()
+
+    if not row:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    counts = {
+        "sent_count": row.sent_count or 0,
+        "received_count": row.received_count or 0,
+        "like_count": row.like_received or 0,
+        "clap_count": row.clap_received or 0,
+        "star_count": row.star_received or 0,
+    }
+    return schemas.UserStatsResponse(
+        user_id=row.id,
+        name=row.name,
+        department=row.department,
+        reaction_score=sum(counts[k] * w for k, w in REACTION_SCORE.items()),
+        **counts,
+    )
+
+
+# -----------------------------
+# USER'S SHOUTOUTS (KEYSET PAGINATED)
+# -----------------------------
+@router.get("/{user_id}/shoutouts", response_model=List[schemas.ShoutoutResponse])
+def get_user_shoutouts(
+    user_id: int,
+    response: Response,
+    direction: Literal["sent", "received"] = "sent",
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: Optional[schemas.Principal] = Depends(security.get_current_principal_optional),
+):
+    """
+    Shoutouts the user sent or received, newest first, paginated like the
+    feed (X-Next-Cursor). Served by the (sender_id, created_at, id) and
+    (recipient_id, shoutout_id) indexes.
+    """
+    params = FeedParams(
+        limit=limit,
+        cursor=cursor,
+        department=None,
+        sender_id=user_id if direction == "sent" else None,
+        recipient_id=user_id if direction == "received" else None,
+        since=None,
+        until=None,
+        q=None,
+        comments=0,
+    )
+    rows = trim_page(db.execute(feed_statement(params)).all(), params, response)
+    items = fetch_page_items(db, rows)
+
+    mine = fetch_my_reactions(db, current_user, [item["id"] for item in items])
+
+    return render([
+        {**item, "my_reactions": [t.value for t in mine[item["id"]]]} for item in items
+    ], response)
@@ -1,6 +1,6 @@
-from pydantic import BaseModel, EmailStr
-from typing import List, Optional
-from datetime import datetime
+from pydantic import BaseModel, EmailStr, Field
+from typing import List, Literal, Optional
+from datetime import date, datetime
 from .models import UserRole, ReactionType
 
 
@@ -40,6 +40,18 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     email: Optional[str] = None
+    user_id: Optional[int] = None       # "uid" claim
+    role: Optional[UserRole] = None     # "role" claim
+    token_version: Optional[int] = None  # "ver" claim
+
+
+class Principal(BaseModel):
+    """
+    The authenticated caller as described by access-token claims.
+    """
+    id: int
+    email: str
+    role: UserRole
 
 
 class RefreshTokenRequest(BaseModel):
@@ -67,12 +79,28 @@ class ShoutoutCreate(ShoutoutBase):
     recipient_ids: List[int] = []
 
 
+class ShoutoutBulkItem(ShoutoutCreate):
+    sender_id: Optional[int] = None   # Defaults to the importing admin
+
+
+class ShoutoutBulkCreate(BaseModel):
+    shoutouts: List[ShoutoutBulkItem] = Field(..., min_length=1, max_length=1000)
+
+
+class ReactionSummary(BaseModel):
+    like: int = 0
+    clap: int = 0
+    star: int = 0
+
+
 class ShoutoutResponse(ShoutoutBase):
     id: int
     sender: User
     recipients: List[RecipientOut]
     created_at: datetime
     comments_count: int   # ✅ REQUIRED & POPULATED IN ROUTER
+    reactions: ReactionSummary = ReactionSummary()
+    my_reactions: List[ReactionType] = []   # Caller's own reactions (empty if anonymous)
 
     class Config:
         from_attributes = True
@@ -106,6 +134,11 @@ class CommentResponse(BaseModel):
         from_attributes = True
 
 
+class FeedItem(ShoutoutResponse):
+    # Latest comments, oldest first; only present with GET /shoutouts/?comments=N
+    comments: Optional[List[CommentResponse]] = None
+
+
 # ================================
 # ----- REACTION SCHEMAS --------
 # ================================
@@ -114,6 +147,13 @@ class ReactionCreate(BaseModel):
     type: ReactionType
 
 
+class ReactionToggleResponse(BaseModel):
+    shoutout_id: int
+    type: ReactionType
+    active: bool    # True if the caller now has this reaction
+    count: int      # New total for this reaction type
+
+
 class ReactionResponse(BaseModel):
     id: int
     shoutout_id: int
@@ -128,6 +168,19 @@ class ReactionResponse(BaseModel):
 # ----- ADMIN SCHEMAS -------
 # ============================
 
+class UserDirectoryEntry(BaseModel):
+    """
+    Row of the user directory / typeahead (GET /users/).
+    """
+    id: int
+    name: str
+    email: EmailStr
+    department: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
 class UserAdmin(BaseModel):
     id: int
     name: str
@@ -153,3 +206,70 @@ class CommentAdmin(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# ============================
+# ---- LEADERBOARD SCHEMAS ---
+# ============================
+
+class LeaderboardUser(BaseModel):
+    user_id: int
+    name: str
+    department: Optional[str] = None
+    sent: int
+    received: int
+    points: int
+
+
+class LeaderboardDepartment(BaseModel):
+    department: Optional[str] = None
+    sent: int
+    received: int
+    points: int
+
+
+class Leaderboard(BaseModel):
+    window: str
+    since: Optional[date] = None     # None for all-time
+    top_users: List[LeaderboardUser]
+    top_senders: List[LeaderboardUser]
+    top_recipients: List[LeaderboardUser]
+    top_departments: List[LeaderboardDepartment]
+
+
+# ============================
+# ---- USER STATS SCHEMAS ----
+# ============================
+
+class UserStatsResponse(BaseModel):
+    user_id: int
+    name: str
+    department: Optional[str] = None
+    sent_count: int = 0
+    received_count: int = 0
+    like_count: int = 0     # reactions received on the user's shoutouts
+    clap_count: int = 0
+    star_count: int = 0
+    reaction_score: int = 0
+
+
+class AdminStats(BaseModel):
+    users: int
+    shoutouts: int
+    comments: int
+    reactions: int
+
+
+# ============================
+# ------ SEARCH SCHEMAS ------
+# ============================
+
+class SearchHit(BaseModel):
+    kind: Literal["shoutout", "comment"]
+    id: int                 # shoutout id or comment id, per kind
+    shoutout_id: int        # the shoutout to open for this hit
+    text: str
+    created_at: Optional[datetime] = None
+    user_id: Optional[int] = None
+    user_name: Optional[str] = None
+    rank: float
@@ -1,14 +1,18 @@
 from datetime import datetime, timedelta
 from jose import jwt, JWTError
-from passlib.hash import argon2
 from dotenv import load_dotenv
 import os
+from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 from . import models, schemas
-from .database import get_db
+from .cache import make_cache
+from .hashing import hash_password, verify_password  # re-exported for callers of security.*
+from .database import get_db, get_async_db
 
 # -----------------------------
 # Load Environment Variables
@@ -19,20 +23,13 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", 60))
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", 10000))
+TOKEN_VERSION_CACHE_TTL_SECONDS = float(os.getenv("TOKEN_VERSION_CACHE_TTL_SECONDS", 30))
+STREAM_TICKET_SECONDS = int(os.getenv("STREAM_TICKET_SECONDS", 30))
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
-
-# -----------------------------
-# 🔐 Password Hashing
-# -----------------------------
-def hash_password(password: str) -> str:
-    return argon2.hash(password)
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    try:
-        return argon2.verify(plain_password, hashed_password)
-    except Exception:
-        return False
+oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
 
 # -----------------------------
 # 🔑 JWT Token Utilities
@@ -55,45 +52,329 @@ def create_access_token(data: dict) -> str:
     return encoded_jwt
 
 
+def user_token_claims(user: models.User) -> dict:
+    """
+    Claims embedded in access tokens so callers can be authorized
+    without loading the user (see get_current_principal).
+    """
+    return {
+        "sub": user.email,
+        "uid": user.id,
+        "role": models.UserRole(user.role).value,
+        "ver": user.token_version or 0,
+    }
+
+
 def create_refresh_token(data: dict) -> str:
     """
-    Create a long-lived refresh token.
+    Create a long-lived refresh token. Marked with type=refresh so it
+    cannot be used as an access token and vice versa.
     """
     to_encode = data.copy()
     if "sub" not in to_encode and "email" in to_encode:
         to_encode["sub"] = to_encode["email"]
 
     expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "type": "refresh"})
 
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
+
+def refresh_token_claims(user: models.User) -> dict:
+    """
+    Claims of a refresh token. "ver" ties it to the user's token version,
+    so a role change or block revokes refresh tokens too.
+    """
+    return {"sub": user.email, "ver": user.token_version or 0}
+
+
+def decode_refresh_token(token: str) -> Optional[dict]:
+    """
+    Payload of a valid, unexpired refresh token, or None.
+    """
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    if payload.get("type") != "refresh" or payload.get("sub") is None:
+        return None
+    return payload
+
+
+def create_stream_ticket(principal: schemas.Principal) -> str:
+    """
+    Short-lived token that can only open GET /stream. EventSource cannot
+    send headers, so this goes in the URL instead of the access token.
+    """
+    expire = datetime.utcnow() + timedelta(seconds=STREAM_TICKET_SECONDS)
+    return jwt.encode({
+        "sub": principal.email,
+        "uid": principal.id,
+        "role": models.UserRole(principal.role).value,
+        "exp": expire,
+        "type": "stream",
+    }, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def decode_stream_ticket(ticket: str) -> schemas.Principal:
+    """
+    Principal of a valid, unexpired stream ticket; 401 otherwise.
+    """
+    try:
+        payload = jwt.decode(ticket, SECRET_KEY, algorithms=[ALGORITHM])
+        if payload.get("type") != "stream":
+            raise credentials_exception
+        return schemas.Principal(id=payload["uid"], email=payload["sub"], role=payload["role"])
+    except (JWTError, KeyError, ValueError):
+        raise credentials_exception
+
+
+def check_active(user: models.User) -> None:
+    """
+    403 for deactivated or blocked accounts. Login and refresh call this
+    before issuing tokens; outstanding tokens are revoked separately via
+    the token version.
+    """
+    if user.is_active is False or user.is_blocked:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account is inactive",
+        )
+
+# -----------------------------
+# 🗃️ Authenticated-User Cache
+# -----------------------------
+# Keyed on the token's "sub" (email). Entries hold the user's columns minus
+# the password hash; admin endpoints that change role/active/block or delete
+# a user call invalidate_cached_user().
+user_cache = make_cache(
+    "users", max_size=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS
+)
+
+_CACHED_USER_FIELDS = (
+    "id", "name", "email", "department", "role", "is_active", "is_blocked",
+    "token_version",
+)
+
+
+def _user_snapshot(user: models.User) -> dict:
+    data = {field: getattr(user, field) for field in _CACHED_USER_FIELDS}
+    data["role"] = models.UserRole(user.role).value
+    data["joined_at"] = user.joined_at.isoformat() if user.joined_at else None
+    return data
+
+
+def _detached_user(data: dict) -> models.User:
+    user = models.User(**{field: data[field] for field in _CACHED_USER_FIELDS})
+    user.role = models.UserRole(data["role"])
+    user.joined_at = datetime.fromisoformat(data["joined_at"]) if data["joined_at"] else None
+    make_transient_to_detached(user)
+    return user
+
+
+def _user_from_snapshot(data: dict, db: Session) -> models.User:
+    """
+    Rebuild a session-bound User from a cache entry without querying.
+    Unloaded columns (hashed_password) and relationships still lazy-load.
+    """
+    return db.merge(_detached_user(data), load=False)
+
+
+# Per-user token version, keyed on user id: the only lookup
+# get_current_principal needs. Invalidated together with user_cache.
+token_version_cache = make_cache(
+    "token_versions", max_size=USER_CACHE_MAX_SIZE, ttl=TOKEN_VERSION_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_cached_user(email: str, user_id: int) -> None:
+    user_cache.delete(email)
+    token_version_cache.delete(str(user_id))
+
+
+def _token_version_statement(user_id: int):
+    return select(models.User.token_version).where(models.User.id == user_id)
+
+
+def _current_token_version(user_id: int, db: Session) -> Optional[int]:
+    """
+    The user's current token version (None if the user no longer exists),
+    served from token_version_cache when possible.
+    """
+    cached = token_version_cache.get(str(user_id))
+    if cached is not None:
+        return cached
+
+    version = db.execute(_token_version_statement(user_id)).scalar()
+    if version is not None:
+        token_version_cache.set(str(user_id), version)
+    return version
+
+
+async def _current_token_version_async(user_id: int, db: AsyncSession) -> Optional[int]:
+    cached = token_version_cache.get(str(user_id))
+    if cached is not None:
+        return cached
+
+    version = (await db.execute(_token_version_statement(user_id))).scalar()
+    if version is not None:
+        token_version_cache.set(str(user_id), version)
+    return version
+
+
 # -----------------------------
 # 🧠 Decode + Fetch Current User
 # -----------------------------
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Invalid or expired credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid or expired credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
 
+def decode_access_token(token: str) -> schemas.TokenData:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         email: str = payload.get("sub")
-        if email is None:
+        # Access tokens carry no type; refresh tokens and stream tickets do
+        if email is None or payload.get("type") is not None:
             raise credentials_exception
-        token_data = schemas.TokenData(email=email)
-    except JWTError:
+        return schemas.TokenData(
+            email=email,
+            user_id=payload.get("uid"),
+            role=payload.get("role"),
+            token_version=payload.get("ver"),
+        )
+    except (JWTError, ValueError):
         raise credentials_exception
 
-    user = db.query(models.User).filter(models.User.email == token_data.email).first()
-    if user is None:
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    token_data = decode_access_token(token)
+
+    cached = user_cache.get(token_data.email)
+    if cached is not None:
+        user = _user_from_snapshot(cached, db)
+    else:
+        user = db.query(models.User).filter(models.User.email == token_data.email).first()
+        if user is None:
+            raise credentials_exception
+        user_cache.set(token_data.email, _user_snapshot(user))
+
+    _check_token_version(token_data, user)
+    return user
+
+
+def _check_token_version(token_data: schemas.TokenData, user: models.User):
+    # Tokens issued before a role change/block carry a stale version
+    if token_data.token_version is not None and token_data.token_version != user.token_version:
         raise credentials_exception
 
+
+def _has_claims(token_data: schemas.TokenData) -> bool:
+    return None not in (token_data.user_id, token_data.role, token_data.token_version)
+
+
+def _principal(token_data: schemas.TokenData) -> schemas.Principal:
+    return schemas.Principal(
+        id=token_data.user_id,
+        email=token_data.email,
+        role=token_data.role,
+    )
+
+
+def get_current_principal(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> schemas.Principal:
+    """
+    Authorize from token claims alone. The only state checked is the
+    user's token version (cached), so role changes and blocks still
+    revoke outstanding tokens. Tokens issued before claims were added
+    fall back to get_current_user.
+    """
+    token_data = decode_access_token(token)
+
+    if not _has_claims(token_data):
+        user = get_current_user(token, db)
+        return schemas.Principal(id=user.id, email=user.email, role=user.role)
+
+    if _current_token_version(token_data.user_id, db) != token_data.token_version:
+        raise credentials_exception
+
+    return _principal(token_data)
+
+
+def get_current_principal_optional(
+    token: Optional[str] = Depends(oauth2_scheme_optional),
+    db: Session = Depends(get_db),
+) -> Optional[schemas.Principal]:
+    """
+    Like get_current_principal, but returns None for anonymous requests
+    instead of raising 401.
+    """
+    if not token:
+        return None
+    try:
+        return get_current_principal(token, db)
+    except HTTPException:
+        return None
+
+
+# -----------------------------
+# ⚡ Async Variants (AsyncSession, see routers/async_*.py)
+# -----------------------------
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> models.User:
+    token_data = decode_access_token(token)
+
+    cached = user_cache.get(token_data.email)
+    if cached is not None:
+        user = await db.merge(_detached_user(cached), load=False)
+    else:
+        user = (await db.execute(
+            select(models.User).where(models.User.email == token_data.email)
+        )).scalars().first()
+        if user is None:
+            raise credentials_exception
+        user_cache.set(token_data.email, _user_snapshot(user))
+
+    _check_token_version(token_data, user)
     return user
+
+
+async def get_current_principal_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> schemas.Principal:
+    token_data = decode_access_token(token)
+
+    if not _has_claims(token_data):
+        user = await get_current_user_async(token, db)
+        return schemas.Principal(id=user.id, email=user.email, role=user.role)
+
+    if await _current_token_version_async(token_data.user_id, db) != token_data.token_version:
+        raise credentials_exception
+
+    return _principal(token_data)
+
+
+async def get_current_principal_optional_async(
+    token: Optional[str] = Depends(oauth2_scheme_optional),
+    db: AsyncSession = Depends(get_async_db),
+) -> Optional[schemas.Principal]:
+    if not token:
+        return None
+    try:
+        return await get_current_principal_async(token, db)
+    except HTTPException:
+        return None
+
+
 def get_current_admin_user(
-    current_user: models.User = Depends(get_current_user)
+    current_user: schemas.Principal = Depends(get_current_principal)
 ):
     if current_user.role != models.UserRole.admin:
         raise HTTPException(
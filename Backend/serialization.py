@@ -0,0 +1,71 @@
+# Backend/serialization.py
+"""
+Fast path for the hot read endpoints (feed, comment threads, admin lists).
+
+Those endpoints project ORM rows straight into JSON-ready dicts (the
+*_to_dict / to_response helpers next to their queries) and hand them to
+render(), which returns a response directly. That skips the second pass
+FastAPI would otherwise make: validating the return value against
+response_model and re-encoding it. response_model stays on the routes for
+the OpenAPI docs, so the projections must produce exactly those shapes.
+
+FAST_JSON=true encodes these responses with orjson (optional dependency).
+It is deliberately not the app-wide default_response_class: for routes
+that return models, FastAPI already serializes through pydantic's
+dump_json, and a custom default class would turn that off.
+
+Measure with:
+
+    python -m Backend.bench_serialization
+"""
+import os
+from datetime import datetime
+from typing import Any, Optional
+
+from dotenv import load_dotenv
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+load_dotenv()
+
+FAST_JSON = os.getenv("FAST_JSON", "false").lower() == "true"
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _response_class():
+    if not FAST_JSON:
+        return JSONResponse
+    if orjson is None:
+        raise RuntimeError("FAST_JSON=true requires the 'orjson' package")
+    return ORJSONResponse
+
+
+ResponseClass = _response_class()
+
+
+def iso(value: Optional[datetime]) -> Optional[str]:
+    """
+    Same text pydantic writes for a datetime field.
+    """
+    return value.isoformat() if value is not None else None
+
+
+def render(content: Any, response: Optional[Response] = None, **kwargs) -> Response:
+    """
+    Response for already-projected content. Headers set on the endpoint's
+    injected `response` (X-Next-Cursor, read-your-writes cookie) are
+    carried over; FastAPI drops them when a Response is returned.
+    """
+    rendered = ResponseClass(content=content, **kwargs)
+    if response is not None:
+        rendered.raw_headers.extend(response.raw_headers)
+    return rendered
@@ -0,0 +1,134 @@
+# Backend/tests/test_admin_listings.py
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from Backend import models
+from Backend.pagination import NEXT_CURSOR_HEADER
+
+
+@pytest.fixture
+def board(client, register, post_shoutout):
+    """
+    An admin, three users and two shoutouts. The first has six comments,
+    every other one flagged by Cy; Bob reports both shoutouts, Cy the first.
+    """
+    _, admin = register("Ada", "ada@example.com", role="admin")
+    ann_id, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    cy_id, cy = register("Cy", "cy@example.com")
+    shoutout_id = post_shoutout(ann, bob_id)
+    other_id = post_shoutout(bob, ann_id)
+
+    comment_ids = []
+    for n in range(6):
+        response = client.post(f"/comments/{shoutout_id}", headers=ann if n % 3 else bob,
+                               json={"content": f"c{n}"})
+        comment_ids.append(response.json()["id"])
+    for comment_id in comment_ids[::2]:
+        response = client.post(f"/comments/{comment_id}/flag", headers=cy, json={"reason": "rude"})
+        assert response.status_code == 200, response.text
+    for target in (shoutout_id, other_id):
+        assert client.post(f"/reports/{target}", headers=bob, json={"reason": "spam"}).status_code == 200
+    assert client.post(f"/reports/{shoutout_id}", headers=cy, json={"reason": "off-topic"}).status_code == 200
+
+    return {
+        "admin": admin, "ann": ann, "ann_id": ann_id, "bob_id": bob_id, "cy_id": cy_id,
+        "shoutout_id": shoutout_id, "other_id": other_id, "comment_ids": comment_ids,
+    }
+
+
+def _walk(client, path, headers, limit, **params):
+    """
+    Every page of an admin listing; returns (pages of ids, items).
+    """
+    pages, items, cursor = [], [], None
+    while True:
+        response = client.get(path, headers=headers, params={**params, "limit": limit, "cursor": cursor})
+        assert response.status_code == 200, response.text
+        pages.append([item["id"] for item in response.json()])
+        items.extend(response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return pages, items
+        assert len(pages) < 20, "cursor did not advance"
+
+
+def test_listings_are_admin_only(client, board):
+    for path in ("/admin/comments", "/admin/comments/flagged", "/admin/reports"):
+        assert client.get(path, headers=board["ann"]).status_code == 403
+        assert client.get(path).status_code == 401
+
+
+def test_comment_listing_pages_newest_first_and_filters(client, board):
+    admin, ids = board["admin"], board["comment_ids"]
+
+    pages, _ = _walk(client, "/admin/comments", admin, 4)
+    assert pages == [ids[:1:-1], ids[1::-1]]
+
+    assert _walk(client, "/admin/comments", admin, 2, flagged=True)[0] == [[ids[4], ids[2]], [ids[0]]]
+    assert sum(_walk(client, "/admin/comments", admin, 2, flagged=False)[0], []) == [ids[5], ids[3], ids[1]]
+    by_bob = sum(_walk(client, "/admin/comments", admin, 10, user_id=board["bob_id"])[0], [])
+    assert by_bob == [ids[3], ids[0]]
+    assert _walk(client, "/admin/comments", admin, 10, shoutout_id=board["other_id"])[0] == [[]]
+
+
+def test_comment_listing_filters_by_time(client, board, db):
+    admin, ids = board["admin"], board["comment_ids"]
+    earlier = datetime.utcnow() - timedelta(days=3)
+    db.execute(update(models.Comment).where(models.Comment.id.in_(ids[:2])).values(created_at=earlier))
+    db.commit()
+    cutoff = (datetime.utcnow() - timedelta(days=1)).isoformat()
+
+    assert sum(_walk(client, "/admin/comments", admin, 10, until=cutoff)[0], []) == [ids[1], ids[0]]
+    assert sum(_walk(client, "/admin/comments", admin, 10, since=cutoff)[0], []) == ids[:1:-1]
+
+
+def test_flagged_queue_lists_only_flagged_comments_with_flagger(client, board):
+    admin, ids = board["admin"], board["comment_ids"]
+
+    pages, items = _walk(client, "/admin/comments/flagged", admin, 2)
+
+    assert pages == [[ids[4], ids[2]], [ids[0]]]
+    assert {item["flagged_by"]["id"] for item in items} == {board["cy_id"]}
+    assert {item["flag_reason"] for item in items} == {"rude"}
+    assert sum(_walk(client, "/admin/comments/flagged", admin, 5, user_id=board["bob_id"])[0], []) == [ids[0]]
+
+
+def test_report_listing_pages_and_filters(client, board):
+    admin = board["admin"]
+
+    pages, items = _walk(client, "/admin/reports", admin, 2)
+    assert [len(page) for page in pages] == [2, 1]
+    assert items[0]["reported_by"]["id"] == board["cy_id"]
+    assert items[0]["shoutout"]["sender"]["id"] == board["ann_id"]
+
+    _, mine = _walk(client, "/admin/reports", admin, 10, reported_by=board["bob_id"])
+    assert {r["shoutout"]["id"] for r in mine} == {board["shoutout_id"], board["other_id"]}
+    _, other = _walk(client, "/admin/reports", admin, 10, shoutout_id=board["other_id"])
+    assert [r["reason"] for r in other] == ["spam"]
+
+
+@pytest.mark.parametrize("path", ["/admin/comments", "/admin/comments/flagged", "/admin/reports"])
+def test_listing_query_count_does_not_grow_with_the_page(client, board, queries, path):
+    def count(limit):
+        queries.clear()
+        assert client.get(path, headers=board["admin"], params={"limit": limit}).status_code == 200
+        return len(queries)
+
+    count(1)   # warm the token-version cache
+    assert count(1) == count(10) == 1
+
+
+def test_stats_total_the_whole_site(client, board):
+    for headers, reaction_type in [(board["ann"], "like"), (board["admin"], "star")]:
+        response = client.post(f"/reactions/{board['other_id']}/toggle", headers=headers,
+                               json={"type": reaction_type})
+        assert response.status_code == 200, response.text
+
+    response = client.get("/admin/stats", headers=board["admin"])
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {"users": 4, "shoutouts": 2, "comments": 6, "reactions": 2}
+    assert client.get("/admin/stats", headers=board["ann"]).status_code == 403
@@ -0,0 +1,96 @@
+# Backend/tests/test_async_routers.py
+"""
+The DB_ASYNC routers, mounted ahead of the sync ones as main.py does, on an
+async engine over the same test database.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import NullPool
+
+from Backend import database, models
+from Backend.routers import (
+    async_comments, async_reactions, async_shoutouts, auth, comments, reactions, shoutouts,
+)
+
+ASYNC_URL = database._async_url(database.DATABASE_URL)
+pytest.importorskip({"sqlite": "aiosqlite", "postgresql": "asyncpg"}[database.engine.dialect.name])
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    # NullPool: every TestClient runs its own event loop
+    async_engine = create_async_engine(ASYNC_URL, poolclass=NullPool)
+    database._enforce_foreign_keys(async_engine.sync_engine)
+    sessions = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async def get_async_db():
+        async with sessions() as db:
+            yield db
+
+    app = FastAPI()
+    for router in (async_shoutouts, async_comments, async_reactions, auth, shoutouts, comments, reactions):
+        app.include_router(router.router)
+    app.dependency_overrides[database.get_async_db] = get_async_db
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_feed_pages_and_embeds_my_reactions(client, register, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    ids = [post_shoutout(ann, bob_id, f"#{n}") for n in range(3)]
+
+    toggled = client.post(f"/reactions/{ids[0]}/toggle", headers=bob, json={"type": "like"})
+    assert toggled.json() == {"shoutout_id": ids[0], "type": "like", "active": True, "count": 1}
+
+    first = client.get("/shoutouts/", headers=bob, params={"limit": 2})
+    assert [item["id"] for item in first.json()] == ids[:0:-1]
+    rest = client.get("/shoutouts/", headers=bob, params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+    assert [item["id"] for item in rest.json()] == [ids[0]]
+    assert "X-Next-Cursor" not in rest.headers
+    assert rest.json()[0]["my_reactions"] == ["like"]
+    assert rest.json()[0]["recipients"][0]["id"] == bob_id
+
+    single = client.get(f"/shoutouts/{ids[0]}", headers=bob).json()
+    assert single["my_reactions"] == ["like"]
+    assert client.get("/shoutouts/2000000000", headers=bob).status_code == 404
+
+
+def test_comments_post_and_page(client, register, post_shoutout, db):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(ann, bob_id)
+
+    for n in range(3):
+        response = client.post(f"/comments/{shoutout_id}", headers=bob, json={"content": f" c{n} "})
+        assert response.status_code == 201, response.text
+    assert response.json()["user"]["id"] == bob_id
+
+    first = client.get(f"/comments/{shoutout_id}", headers=ann, params={"limit": 2})
+    assert [c["content"] for c in first.json()] == ["c0", "c1"]
+    rest = client.get(f"/comments/{shoutout_id}", headers=ann,
+                      params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+    assert [c["content"] for c in rest.json()] == ["c2"]
+
+    assert db.get(models.Shoutout, shoutout_id).comments_count == 3
+    assert client.get("/comments/2000000000", headers=ann).status_code == 404
+    assert client.post("/comments/2000000000", headers=ann, json={"content": "x"}).status_code == 404
+
+
+def test_reactions_are_idempotent_and_toggle_off(client, register, post_shoutout, db):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(ann, bob_id)
+
+    for _ in range(2):
+        assert client.post(f"/reactions/{shoutout_id}", headers=bob, json={"type": "clap"}).status_code == 201
+    off = client.post(f"/reactions/{shoutout_id}/toggle", headers=bob, json={"type": "clap"}).json()
+    assert off == {"shoutout_id": shoutout_id, "type": "clap", "active": False, "count": 0}
+
+    assert db.query(models.Reaction).count() == 0
+    missing = client.post("/reactions/2000000000/toggle", headers=bob, json={"type": "like"})
+    assert missing.status_code == 404
@@ -0,0 +1,90 @@
+# Backend/tests/test_auth.py
+from sqlalchemy import update
+
+from Backend import models
+
+
+def _can_post(client, headers, recipient_id):
+    response = client.post("/shoutouts/", headers=headers, json={
+        "message": "Thanks!", "recipient_ids": [recipient_id],
+    })
+    return response.status_code == 201
+
+
+def _refresh(client, refresh_token):
+    return client.post("/auth/refresh", json={"refresh_token": refresh_token})
+
+
+def test_role_change_revokes_outstanding_tokens(client, register, login):
+    ada_id, admin = register("Ada", "ada@example.com", role="admin")
+    bob_id, bob = register("Bob", "bob@example.com")
+    assert _can_post(client, bob, ada_id)
+
+    response = client.patch(f"/admin/users/{bob_id}/role", headers=admin, json={"role": "admin"})
+    assert response.status_code == 200, response.text
+
+    assert not _can_post(client, bob, ada_id)
+    assert client.get("/auth/me", headers=bob).status_code == 401
+    fresh = {"Authorization": f"Bearer {login('bob@example.com')['access_token']}"}
+    assert client.get("/auth/me", headers=fresh).json()["role"] == "admin"
+
+
+def test_blocked_user_is_locked_out(client, register):
+    ada_id, admin = register("Ada", "ada@example.com", role="admin")
+    bob_id, bob = register("Bob", "bob@example.com")
+    tokens = client.post("/auth/login", json={"email": "bob@example.com", "password": "pw"}).json()
+
+    assert client.post(f"/admin/users/{bob_id}/block", headers=admin).status_code == 200
+
+    assert not _can_post(client, bob, ada_id)
+    assert client.get("/auth/me", headers=bob).status_code == 401
+    response = client.post("/auth/login", json={"email": "bob@example.com", "password": "pw"})
+    assert response.status_code == 403
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+
+
+def test_reactivated_user_can_log_in_again(client, register, login):
+    _, admin = register("Ada", "ada@example.com", role="admin")
+    bob_id, _ = register("Bob", "bob@example.com")
+
+    client.patch(f"/admin/users/{bob_id}/active", headers=admin)
+    assert client.post("/auth/login", json={"email": "bob@example.com", "password": "pw"}).status_code == 403
+    client.patch(f"/admin/users/{bob_id}/active", headers=admin)
+
+    assert login("bob@example.com")["access_token"]
+
+
+def test_wrong_password_is_401(client, register):
+    register("Bob", "bob@example.com")
+    response = client.post("/auth/login", json={"email": "bob@example.com", "password": "nope"})
+    assert response.status_code == 401
+
+
+def test_refresh_issues_a_working_access_token(client, register, login):
+    register("Bob", "bob@example.com")
+    tokens = login("bob@example.com")
+
+    response = _refresh(client, tokens["refresh_token"])
+
+    assert response.status_code == 200, response.text
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    assert client.get("/auth/me", headers=headers).json()["email"] == "bob@example.com"
+
+
+def test_refresh_rejects_inactive_user(client, register, login, db):
+    bob_id, _ = register("Bob", "bob@example.com")
+    tokens = login("bob@example.com")
+    # Deactivated without a token version bump: check_active still refuses
+    db.execute(update(models.User).where(models.User.id == bob_id).values(is_active=False))
+    db.commit()
+
+    assert _refresh(client, tokens["refresh_token"]).status_code == 403
+
+
+def test_access_and_refresh_tokens_are_not_interchangeable(client, register, login):
+    register("Bob", "bob@example.com")
+    tokens = login("bob@example.com")
+
+    assert _refresh(client, tokens["access_token"]).status_code == 401
+    headers = {"Authorization": f"Bearer {tokens['refresh_token']}"}
+    assert client.get("/auth/me", headers=headers).status_code == 401
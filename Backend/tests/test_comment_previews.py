@@ -0,0 +1,82 @@
+# Backend/tests/test_comment_previews.py
+import pytest
+
+from Backend import feed_cache
+from Backend.routers.shoutouts import MAX_COMMENT_PREVIEWS
+
+
+@pytest.fixture
+def feed(client, register, post_shoutout):
+    """
+    Three shoutouts, oldest first: four comments on the first, none on the
+    second, one on the third.
+    """
+    ann_id, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    ids = [post_shoutout(ann, bob_id, f"Post {n}") for n in range(3)]
+
+    def comment(shoutout_id, headers, content):
+        response = client.post(f"/comments/{shoutout_id}", headers=headers, json={"content": content})
+        assert response.status_code == 201, response.text
+
+    for n in range(4):
+        comment(ids[0], bob if n % 2 else ann, f"first {n}")
+    comment(ids[2], bob, "third 0")
+
+    return {"ann": ann, "bob_id": bob_id, "ids": ids, "comment": comment}
+
+
+def _previews(client, headers, **params):
+    response = client.get("/shoutouts/", headers=headers, params=params)
+    assert response.status_code == 200, response.text
+    return {item["id"]: [c["content"] for c in item["comments"]] for item in response.json()}
+
+
+def test_feed_embeds_the_latest_comments_oldest_first(client, feed):
+    first, second, third = feed["ids"]
+
+    assert _previews(client, feed["ann"], comments=2) == {
+        first: ["first 2", "first 3"],
+        second: [],
+        third: ["third 0"],
+    }
+    assert _previews(client, feed["ann"], comments=MAX_COMMENT_PREVIEWS)[first] == [
+        "first 0", "first 1", "first 2", "first 3",
+    ]
+
+
+def test_previews_carry_authors_and_are_opt_in(client, feed):
+    response = client.get("/shoutouts/", headers=feed["ann"], params={"comments": 1})
+    [latest] = {item["id"]: item for item in response.json()}[feed["ids"][0]]["comments"]
+    assert (latest["user"]["id"], latest["user"]["name"]) == (feed["bob_id"], "Bob")
+
+    plain = client.get("/shoutouts/", headers=feed["ann"]).json()
+    assert all(item.get("comments") is None for item in plain)
+
+
+def test_preview_count_is_bounded(client, feed):
+    for comments in (-1, MAX_COMMENT_PREVIEWS + 1):
+        response = client.get("/shoutouts/", headers=feed["ann"], params={"comments": comments})
+        assert response.status_code == 422
+
+
+def test_new_comments_show_up_in_cached_previews(client, feed):
+    third = feed["ids"][2]
+    assert _previews(client, feed["ann"], comments=1)[third] == ["third 0"]
+
+    feed["comment"](third, feed["ann"], "third 1")
+
+    assert _previews(client, feed["ann"], comments=1)[third] == ["third 1"]
+
+
+def test_previews_cost_one_query_whatever_the_page_size(client, feed, queries):
+    def count(limit, comments):
+        feed_cache.feed_cache.clear()
+        queries.clear()
+        assert client.get("/shoutouts/", headers=feed["ann"],
+                          params={"limit": limit, "comments": comments}).status_code == 200
+        return len(queries)
+
+    count(1, 0)   # warm the token-version cache
+    without = count(1, 0)
+    assert count(1, 3) == count(3, 3) == without + 1
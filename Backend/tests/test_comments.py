@@ -0,0 +1,90 @@
+# Backend/tests/test_comments.py
+from datetime import datetime
+
+import pytest
+from sqlalchemy import update
+
+from Backend import models
+from Backend.pagination import NEXT_CURSOR_HEADER
+
+
+@pytest.fixture
+def thread(client, register, post_shoutout, db):
+    """
+    A shoutout with five comments by alternating authors, all sharing one
+    timestamp so ordering falls back to the id tie-breaker.
+    """
+    ann_id, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com", department="Sales")
+    shoutout_id = post_shoutout(ann, bob_id)
+
+    ids = []
+    for n in range(5):
+        response = client.post(f"/comments/{shoutout_id}", headers=bob if n % 2 else ann,
+                               json={"content": f"c{n}"})
+        assert response.status_code == 201, response.text
+        ids.append(response.json()["id"])
+    db.execute(update(models.Comment).where(models.Comment.id.in_(ids))
+               .values(created_at=datetime(2024, 1, 1)))
+    db.commit()
+
+    return {"ann": ann, "ann_id": ann_id, "bob_id": bob_id, "shoutout_id": shoutout_id, "ids": ids}
+
+
+def _pages(client, thread, **params):
+    pages, cursor = [], None
+    while True:
+        response = client.get(f"/comments/{thread['shoutout_id']}", headers=thread["ann"],
+                              params={**params, "cursor": cursor})
+        assert response.status_code == 200, response.text
+        pages.append([c["id"] for c in response.json()])
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return pages
+        assert len(pages) < 10, "cursor did not advance"
+
+
+@pytest.mark.parametrize("order", ["oldest", "newest"])
+def test_thread_pages_in_either_order(client, thread, order):
+    ids = thread["ids"] if order == "oldest" else thread["ids"][::-1]
+
+    assert _pages(client, thread, order=order, limit=2) == [ids[:2], ids[2:4], ids[4:]]
+    assert _pages(client, thread, order=order, limit=5) == [ids]
+
+
+def test_thread_defaults_to_oldest_first(client, thread):
+    assert _pages(client, thread) == [thread["ids"]]
+
+
+def test_thread_items_carry_their_authors(client, thread):
+    response = client.get(f"/comments/{thread['shoutout_id']}", headers=thread["ann"],
+                          params={"limit": 2})
+
+    first, second = response.json()
+    assert first["user"] == {"id": thread["ann_id"], "name": "Ann",
+                             "email": "ann@example.com", "department": "Engineering"}
+    assert (second["user"]["id"], second["user"]["department"]) == (thread["bob_id"], "Sales")
+    assert first["content"] == "c0"
+
+
+def test_thread_tells_empty_from_missing(client, register, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(ann, bob_id)
+
+    empty = client.get(f"/comments/{shoutout_id}", headers=ann)
+    assert (empty.status_code, empty.json()) == (200, [])
+    assert NEXT_CURSOR_HEADER not in empty.headers
+    assert client.get("/comments/2000000000", headers=ann).status_code == 404
+    assert client.get(f"/comments/{shoutout_id}").status_code == 401
+
+
+def test_thread_page_is_one_query(client, thread, queries):
+    def count(**params):
+        queries.clear()
+        response = client.get(f"/comments/{thread['shoutout_id']}", headers=thread["ann"], params=params)
+        assert response.status_code == 200
+        return len(queries)
+
+    count(limit=1)   # warm the token-version cache
+    assert count(limit=1) == count(limit=5) == count(order="newest", limit=3) == 1
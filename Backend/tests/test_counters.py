@@ -0,0 +1,64 @@
+# Backend/tests/test_counters.py
+from sqlalchemy import update
+
+from Backend import counters, models
+
+
+def _counts(db, shoutout_id):
+    db.expire_all()
+    s = db.get(models.Shoutout, shoutout_id)
+    return {
+        "comments": s.comments_count, "reports": s.reports_count,
+        "like": s.like_count, "clap": s.clap_count, "star": s.star_count,
+    }
+
+
+def test_write_paths_bump_counters(client, register, db, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(ann, bob_id)
+
+    for headers in (ann, bob):
+        response = client.post(f"/comments/{shoutout_id}", headers=headers, json={"content": "Nice"})
+        assert response.status_code == 201, response.text
+    assert client.post(f"/reports/{shoutout_id}", headers=bob, json={"reason": "spam"}).status_code == 200
+    assert client.post(f"/reactions/{shoutout_id}", headers=bob, json={"type": "clap"}).status_code == 201
+
+    assert _counts(db, shoutout_id) == {"comments": 2, "reports": 1, "like": 0, "clap": 1, "star": 0}
+    feed = client.get("/shoutouts/", headers=ann).json()
+    assert feed[0]["comments_count"] == 2
+    assert feed[0]["reactions"] == {"like": 0, "clap": 1, "star": 0}
+
+
+def test_admin_deletes_decrement_counters(client, register, db, post_shoutout):
+    _, admin = register("Ada", "ada@example.com", role="admin")
+    bob_id, bob = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(bob, bob_id)
+    comment_id = client.post(f"/comments/{shoutout_id}", headers=bob, json={"content": "Nice"}).json()["id"]
+    client.post(f"/reports/{shoutout_id}", headers=bob, json={"reason": "spam"})
+    report_id = db.query(models.Report.id).scalar()
+
+    assert client.delete(f"/admin/comments/{comment_id}", headers=admin).status_code == 200
+    assert client.delete(f"/admin/reports/{report_id}", headers=admin).status_code == 200
+
+    assert _counts(db, shoutout_id)["comments"] == 0
+    assert _counts(db, shoutout_id)["reports"] == 0
+
+
+def test_recompute_repairs_drift(client, register, db, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(ann, bob_id)
+    client.post(f"/comments/{shoutout_id}", headers=bob, json={"content": "Nice"})
+    client.post(f"/reactions/{shoutout_id}", headers=bob, json={"type": "star"})
+    db.execute(
+        update(models.Shoutout)
+        .where(models.Shoutout.id == shoutout_id)
+        .values(comments_count=7, star_count=0, like_count=3)
+    )
+    db.commit()
+
+    assert counters.recompute(db, [shoutout_id]) == 1
+    db.commit()
+
+    assert _counts(db, shoutout_id) == {"comments": 1, "reports": 0, "like": 0, "clap": 0, "star": 1}
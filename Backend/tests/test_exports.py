@@ -0,0 +1,81 @@
+# Backend/tests/test_exports.py
+import csv
+import io
+import json
+
+from Backend.routers import exports
+
+
+def _ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_export_requires_admin(client, register):
+    _, bob = register("Bob", "bob@example.com")
+
+    assert client.get("/admin/export/shoutouts").status_code == 401
+    assert client.get("/admin/export/shoutouts", headers=bob).status_code == 403
+
+
+def test_ndjson_streams_every_row_across_batches(client, register, monkeypatch, post_shoutout):
+    monkeypatch.setattr(exports, "EXPORT_BATCH_SIZE", 2)
+    ada_id, admin = register("Ada", "ada@example.com", role="admin")
+    bob_id, _ = register("Bob", "bob@example.com")
+    cat_id, _ = register("Cat", "cat@example.com")
+    ids = [post_shoutout(admin, [bob_id, cat_id], f"Thanks #{i}") for i in range(5)]
+
+    response = client.get("/admin/export/shoutouts", headers=admin)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = _ndjson(response)
+    assert [row["id"] for row in rows] == ids
+    assert rows[0]["sender_id"] == ada_id and rows[0]["sender_name"] == "Ada"
+    assert all(row["recipient_ids"] == [bob_id, cat_id] for row in rows)
+
+
+def test_csv_has_a_header_and_joins_recipient_ids(client, register, post_shoutout):
+    _, admin = register("Ada", "ada@example.com", role="admin")
+    bob_id, _ = register("Bob", "bob@example.com")
+    cat_id, _ = register("Cat", "cat@example.com")
+    post_shoutout(admin, [bob_id, cat_id], "Hello, world")
+
+    response = client.get("/admin/export/shoutouts", headers=admin, params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert 'filename="shoutouts.csv"' in response.headers["content-disposition"]
+    [row] = list(csv.DictReader(io.StringIO(response.text)))
+    assert row["message"] == "Hello, world"
+    assert row["recipient_ids"] == f"{bob_id};{cat_id}"
+
+
+def test_since_id_returns_only_newer_rows(client, register, post_shoutout):
+    _, admin = register("Ada", "ada@example.com", role="admin")
+    bob_id, _ = register("Bob", "bob@example.com")
+    ids = [post_shoutout(admin, [bob_id]) for _ in range(3)]
+
+    response = client.get("/admin/export/shoutouts", headers=admin, params={"since_id": ids[0]})
+
+    assert [row["id"] for row in _ndjson(response)] == ids[1:]
+
+
+def test_reactions_and_comments_export(client, register, post_shoutout):
+    _, admin = register("Ada", "ada@example.com", role="admin")
+    bob_id, bob = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(admin, [bob_id])
+    client.post(f"/reactions/{shoutout_id}/toggle", headers=bob, json={"type": "star"})
+    client.post(f"/comments/{shoutout_id}", headers=bob, json={"content": "Thanks back"})
+
+    reactions = _ndjson(client.get("/admin/export/reactions", headers=admin))
+    comments = _ndjson(client.get("/admin/export/comments", headers=admin))
+
+    assert [(r["shoutout_id"], r["user_id"], r["type"]) for r in reactions] == [(shoutout_id, bob_id, "star")]
+    assert [(c["shoutout_id"], c["user_name"], c["content"]) for c in comments] == [(shoutout_id, "Bob", "Thanks back")]
+
+
+def test_time_filters_are_rejected_for_reactions(client, register):
+    _, admin = register("Ada", "ada@example.com", role="admin")
+
+    response = client.get("/admin/export/reactions", headers=admin, params={"since": "2026-01-01T00:00:00"})
+
+    assert response.status_code == 400
@@ -0,0 +1,104 @@
+# Backend/tests/test_feed_cache.py
+import pytest
+from fastapi import Response
+
+from Backend import feed_cache
+from Backend.cache import MemoryCache
+from Backend.database import STICKY_PRIMARY_COOKIE
+from Backend.pagination import NEXT_CURSOR_HEADER
+
+
+def test_matching_if_none_match_is_304_without_the_feed_query(client, register, queries, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    post_shoutout(ann, bob_id)
+    first = client.get("/shoutouts/", headers=ann)
+    etag = first.headers["ETag"]
+
+    queries.clear()
+    response = client.get("/shoutouts/", headers={**ann, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+    assert not [q for q in queries if "shoutouts" in q]
+
+
+def test_cached_page_is_served_without_the_feed_query(client, register, queries, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    for i in range(3):
+        post_shoutout(ann, bob_id, f"Thanks #{i}")
+    first = client.get("/shoutouts/", headers=ann, params={"limit": 2})
+
+    queries.clear()
+    second = client.get("/shoutouts/", headers=ann, params={"limit": 2})
+
+    assert second.json() == first.json()
+    assert second.headers[NEXT_CURSOR_HEADER] == first.headers[NEXT_CURSOR_HEADER]
+    assert not [q for q in queries if "shoutout_recipients" in q]
+
+
+def test_writes_change_the_etag(client, register, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    post_shoutout(ann, bob_id)
+    first = client.get("/shoutouts/", headers=ann)
+    etag, shoutout_id = first.headers["ETag"], first.json()[0]["id"]
+
+    client.post(f"/reactions/{shoutout_id}/toggle", headers=bob, json={"type": "like"})
+    response = client.get("/shoutouts/", headers={**ann, "If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()[0]["reactions"]["like"] == 1
+
+
+def test_etag_follows_the_callers_reactions(client, register, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(ann, bob_id)
+    client.post(f"/reactions/{shoutout_id}/toggle", headers=bob, json={"type": "like"})
+    ann_etag = client.get("/shoutouts/", headers=ann).headers["ETag"]
+
+    response = client.get("/shoutouts/", headers={**bob, "If-None-Match": ann_etag})
+
+    assert response.status_code == 200
+    assert response.json()[0]["my_reactions"] == ["like"]
+    assert response.headers["ETag"] != ann_etag
+
+
+def test_etag_is_derived_from_the_page_content(client, register, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    post_shoutout(ann, bob_id)
+    etag = client.get("/shoutouts/", headers=ann).headers["ETag"]
+
+    # A new generation with the same content still revalidates
+    feed_cache.invalidate_feed()
+    response = client.get("/shoutouts/", headers={**ann, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    # A stale cached page does not match the current content
+    post_shoutout(ann, bob_id, "Again")
+    assert client.get("/shoutouts/", headers={**ann, "If-None-Match": etag}).status_code == 200
+
+
+def test_page_response_keeps_headers_set_on_the_endpoint_response():
+    response = Response()
+    del response.headers["content-length"]
+    response.set_cookie(STICKY_PRIMARY_COOKIE, "1")
+    page = {"items": [], "next_cursor": "abc", "digest": "0"}
+    etag = feed_cache.etag_for(page, {})
+
+    for rendered in (feed_cache.page_response(page, {}, etag, response),
+                     feed_cache.not_modified_response(etag, response)):
+        assert STICKY_PRIMARY_COOKIE in rendered.headers["set-cookie"]
+        assert rendered.headers["ETag"] == etag
+        assert rendered.headers.getlist(NEXT_CURSOR_HEADER) == ["abc"]
+
+
+def test_memory_generation_store_refuses_several_workers():
+    feed_cache._check_shared_generation(MemoryCache("generation"), 1)
+    with pytest.raises(RuntimeError, match="WEB_CONCURRENCY=4"):
+        feed_cache._check_shared_generation(MemoryCache("generation"), 4)
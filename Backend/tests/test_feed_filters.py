@@ -0,0 +1,29 @@
+# Backend/tests/test_feed_filters.py
+
+
+def _search(client, headers, q):
+    response = client.get("/shoutouts/", headers=headers, params={"q": q})
+    assert response.status_code == 200, response.text
+    return [item["id"] for item in response.json()]
+
+
+def test_q_matches_substring_case_insensitively(client, register, post_shoutout):
+    _, headers = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    release = post_shoutout(headers, bob_id, "Shipped the Release early")
+    post_shoutout(headers, bob_id, "Great demo")
+
+    assert _search(client, headers, "release") == [release]
+
+
+def test_q_treats_like_wildcards_literally(client, register, post_shoutout):
+    _, headers = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    percent = post_shoutout(headers, bob_id, "Cut build time by 50% this sprint")
+    underscore = post_shoutout(headers, bob_id, "Renamed user_id everywhere")
+    post_shoutout(headers, bob_id, "Cut build time by 50 minutes")
+    post_shoutout(headers, bob_id, "Renamed userXid nowhere")
+
+    assert _search(client, headers, "50%") == [percent]
+    assert _search(client, headers, "user_id") == [underscore]
+    assert _search(client, headers, "%") == [percent]
@@ -0,0 +1,102 @@
+# Backend/tests/test_feed_projection.py
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from Backend import feed_cache, models
+
+
+@pytest.fixture
+def feed(client, register, post_shoutout):
+    """
+    Ann thanks Bob and Cy (in that order), Bob thanks Ann; Bob claps and
+    Cy stars Ann's post.
+    """
+    ann_id, ann = register("Ann", "ann@example.com", role="admin", department="People")
+    bob_id, bob = register("Bob", "bob@example.com")
+    cy_id, cy = register("Cy", "cy@example.com", department="Sales")
+    first = post_shoutout(ann, [cy_id, bob_id], "Great launch")
+    second = post_shoutout(bob, ann_id, "Thanks for the review")
+    for headers, reaction_type in [(bob, "clap"), (cy, "star")]:
+        response = client.post(f"/reactions/{first}/toggle", headers=headers, json={"type": reaction_type})
+        assert response.status_code == 200, response.text
+    assert client.post(f"/comments/{first}", headers=cy, json={"content": "Agreed"}).status_code == 201
+
+    return {"ann_id": ann_id, "bob": bob, "bob_id": bob_id, "cy_id": cy_id, "ids": [first, second]}
+
+
+@pytest.fixture
+def entity_loads():
+    """
+    Shoutout and User instances the ORM builds while the test runs.
+    """
+    loaded = []
+
+    def record(target, context):
+        loaded.append(type(target).__name__)
+
+    for model in (models.Shoutout, models.User):
+        event.listen(model, "load", record)
+    yield loaded
+    for model in (models.Shoutout, models.User):
+        event.remove(model, "load", record)
+
+
+def _parse(timestamp: str) -> datetime:
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+
+def test_feed_item_shape(client, feed):
+    items = client.get("/shoutouts/", headers=feed["bob"]).json()
+
+    assert [item["id"] for item in items] == feed["ids"][::-1]
+    item = items[1]
+    assert isinstance(_parse(item.pop("created_at")), datetime)
+    assert item == {
+        "id": feed["ids"][0],
+        "message": "Great launch",
+        "sender": {"id": feed["ann_id"], "name": "Ann", "email": "ann@example.com",
+                   "department": "People", "role": "admin"},
+        "recipients": [
+            {"id": feed["cy_id"], "name": "Cy", "department": "Sales"},
+            {"id": feed["bob_id"], "name": "Bob", "department": "Engineering"},
+        ],
+        "comments_count": 1,
+        "reactions": {"like": 0, "clap": 1, "star": 1},
+        "my_reactions": ["clap"],
+    }
+
+
+def test_feed_items_match_the_single_shoutout_endpoint(client, feed):
+    items = client.get("/shoutouts/", headers=feed["bob"]).json()
+
+    for item in items:
+        single = client.get(f"/shoutouts/{item['id']}", headers=feed["bob"]).json()
+        assert item == single   # created_at included: iso() writes what pydantic does
+
+
+def test_feed_page_builds_no_orm_entities(client, feed, entity_loads):
+    feed_cache.feed_cache.clear()
+
+    assert len(client.get("/shoutouts/", headers=feed["bob"]).json()) == 2
+
+    assert "Shoutout" not in entity_loads
+    assert entity_loads.count("User") <= 1   # at most the caller, for auth
+
+
+def test_feed_query_count_does_not_grow_with_the_page(client, register, post_shoutout, queries):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    cy_id, _ = register("Cy", "cy@example.com")
+    for n in range(6):
+        post_shoutout(ann, [bob_id, cy_id][: 1 + n % 2], f"Post {n}")
+
+    def count(limit):
+        feed_cache.feed_cache.clear()
+        queries.clear()
+        assert len(client.get("/shoutouts/", headers=ann, params={"limit": limit}).json()) == limit
+        return len(queries)
+
+    count(1)   # warm the token-version cache
+    assert count(1) == count(6) == 3   # page, recipients, my_reactions
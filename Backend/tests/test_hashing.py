@@ -0,0 +1,72 @@
+# Backend/tests/test_hashing.py
+import threading
+
+from passlib.hash import argon2
+
+from Backend import hashing, models
+
+
+def test_saturated_pool_returns_503_with_retry_after(client, register, monkeypatch):
+    register("Bob", "bob@example.com")
+    rejected = hashing.metrics.rejected
+    monkeypatch.setattr(hashing, "_slots", threading.BoundedSemaphore(1))
+    hashing._slots.acquire()  # every slot taken
+
+    response = client.post("/auth/login", json={"email": "bob@example.com", "password": "pw"})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert hashing.metrics.rejected == rejected + 1
+
+    response = client.post("/auth/register", json={
+        "name": "Cy", "email": "cy@example.com", "password": "pw",
+        "department": "Engineering", "role": "employee",
+    })
+    assert response.status_code == 503
+
+
+def test_slots_are_released_after_each_hash(client, register):
+    completed = hashing.metrics.completed
+    register("Bob", "bob@example.com")  # one hash, one verify
+
+    snapshot = hashing.metrics.snapshot()
+    assert snapshot["completed"] == completed + 2
+    assert snapshot["in_flight"] == 0
+    assert snapshot["params"]["time_cost"] == 1
+    # all slots are free again
+    total = hashing.PASSWORD_HASH_WORKERS + hashing.PASSWORD_HASH_MAX_QUEUE
+    taken = [hashing._slots.acquire(blocking=False) for _ in range(total)]
+    for _ in range(sum(taken)):
+        hashing._slots.release()
+    assert all(taken)
+
+
+def test_wrong_password_is_401_not_an_error(client, register):
+    register("Bob", "bob@example.com")
+    response = client.post("/auth/login", json={"email": "bob@example.com", "password": "nope"})
+    assert response.status_code == 401
+    response = client.post("/auth/login", json={"email": "nobody@example.com", "password": "pw"})
+    assert response.status_code == 401
+
+
+def test_login_upgrades_outdated_hashes(client, register, login, db):
+    user_id, _ = register("Bob", "bob@example.com")
+    user = db.get(models.User, user_id)
+    user.hashed_password = argon2.using(time_cost=2, memory_cost=8, parallelism=1).hash("pw")
+    db.commit()
+    assert hashing.hasher.needs_update(user.hashed_password)
+
+    login("bob@example.com")
+    db.expire_all()
+    upgraded = db.get(models.User, user_id).hashed_password
+    assert not hashing.hasher.needs_update(upgraded)
+    assert hashing.verify_password("pw", upgraded)
+
+    login("bob@example.com")  # current hashes are left alone
+    db.expire_all()
+    assert db.get(models.User, user_id).hashed_password == upgraded
+
+
+def test_verify_helpers_reject_malformed_hashes():
+    assert hashing.verify_password("pw", "not-a-hash") is False
+    assert hashing.verify_and_update("pw", "not-a-hash") == (False, None)
+    assert hashing.verify_and_update("pw", hashing.hash_password("pw")) == (True, None)
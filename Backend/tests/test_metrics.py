@@ -0,0 +1,13 @@
+# Backend/tests/test_metrics.py
+
+
+def test_metrics_requires_admin(client, register):
+    _, admin = register("Ada", "ada@example.com", role="admin")
+    _, bob = register("Bob", "bob@example.com")
+
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers=bob).status_code == 403
+
+    response = client.get("/metrics", headers=admin)
+    assert response.status_code == 200
+    assert {"db_pool", "caches", "password_hashing", "stream"} <= response.json().keys()
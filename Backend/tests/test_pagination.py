@@ -0,0 +1,93 @@
+# Backend/tests/test_pagination.py
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert, text, update
+
+from Backend import counters, models
+from Backend.database import engine
+from Backend.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+
+
+def _walk_feed(client, headers, limit, max_pages=10):
+    pages, cursor = [], None
+    while len(pages) < max_pages:   # a cursor that never advances fails instead of hanging
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/shoutouts/", headers=headers, params=params)
+        assert response.status_code == 200, response.text
+        pages.append([item["id"] for item in response.json()])
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return pages
+    pytest.fail(f"cursor did not advance: {pages}")
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 10, 18, 2, 9, 59, 123456)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+
+def test_tampered_cursor_is_rejected(client, register):
+    _, headers = register("Ann", "ann@example.com")
+    response = client.get("/shoutouts/", headers=headers, params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_feed_pages_through_rows_created_in_one_burst(client, register, post_shoutout):
+    _, headers = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    ids = [post_shoutout(headers, bob_id, f"Thanks #{i}") for i in range(5)]
+
+    pages = _walk_feed(client, headers, limit=2)
+
+    assert pages == [ids[4:2:-1], ids[2:0:-1], ids[:1]]
+
+
+@pytest.mark.parametrize("microsecond", [0, 500000])
+def test_feed_pages_through_rows_with_identical_timestamps(client, register, db, post_shoutout, microsecond):
+    _, headers = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    ids = [post_shoutout(headers, bob_id, f"Thanks #{i}") for i in range(5)]
+    db.execute(
+        update(models.Shoutout)
+        .where(models.Shoutout.id.in_(ids))
+        .values(created_at=datetime(2026, 10, 18, 2, 9, 59, microsecond))
+    )
+    db.commit()
+
+    pages = _walk_feed(client, headers, limit=2)
+
+    # Ties on created_at fall back to id, so every row is seen exactly once
+    assert sum(pages, []) == sorted(ids, reverse=True)
+    assert [len(page) for page in pages] == [2, 2, 1]
+
+
+def test_feed_pages_through_rows_inserted_outside_the_orm(client, register, db):
+    ann_id, headers = register("Ann", "ann@example.com")
+    # Core INSERT without created_at: the server default (utc_now) fills it
+    ids = [
+        db.execute(insert(models.Shoutout).values(sender_id=ann_id, message=f"Raw #{i}")).inserted_primary_key[0]
+        for i in range(5)
+    ]
+    db.commit()
+
+    pages = _walk_feed(client, headers, limit=2)
+
+    assert sum(pages, []) == sorted(ids, reverse=True)
+
+
+@pytest.mark.skipif(engine.dialect.name != "sqlite", reason="SQLite text timestamps")
+def test_repair_rewrites_whole_second_sqlite_timestamps(client, register, db):
+    ann_id, headers = register("Ann", "ann@example.com")
+    with engine.begin() as conn:
+        for i in range(5):
+            conn.execute(text(
+                "INSERT INTO shoutouts (sender_id, message, created_at) "
+                "VALUES (:sender_id, :message, '2026-10-18 02:09:59')"
+            ), {"sender_id": ann_id, "message": f"Legacy #{i}"})
+
+    counters.ensure_utc_timestamps()
+
+    assert [len(page) for page in _walk_feed(client, headers, limit=2)] == [2, 2, 1]
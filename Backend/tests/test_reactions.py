@@ -0,0 +1,61 @@
+# Backend/tests/test_reactions.py
+from Backend import models
+
+
+def _toggle(client, headers, shoutout_id, reaction_type):
+    response = client.post(f"/reactions/{shoutout_id}/toggle", headers=headers, json={"type": reaction_type})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_toggle_adds_then_removes(client, register, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(ann, bob_id)
+
+    assert _toggle(client, bob, shoutout_id, "like") == {
+        "shoutout_id": shoutout_id, "type": "like", "active": True, "count": 1,
+    }
+    assert _toggle(client, ann, shoutout_id, "like")["count"] == 2
+    assert _toggle(client, bob, shoutout_id, "like") == {
+        "shoutout_id": shoutout_id, "type": "like", "active": False, "count": 1,
+    }
+
+    item = client.get("/shoutouts/", headers=bob).json()[0]
+    assert item["reactions"]["like"] == 1
+    assert item["my_reactions"] == []
+
+
+def test_toggle_is_per_type(client, register, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(ann, bob_id)
+
+    _toggle(client, bob, shoutout_id, "like")
+    _toggle(client, bob, shoutout_id, "star")
+
+    item = client.get("/shoutouts/", headers=bob).json()[0]
+    assert item["reactions"] == {"like": 1, "clap": 0, "star": 1}
+    assert sorted(item["my_reactions"]) == ["like", "star"]
+
+
+def test_add_reaction_is_idempotent(client, register, db, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(ann, bob_id)
+
+    for _ in range(2):
+        response = client.post(f"/reactions/{shoutout_id}", headers=bob, json={"type": "clap"})
+        assert response.status_code == 201, response.text
+
+    assert db.query(models.Reaction).count() == 1
+    assert client.get("/shoutouts/", headers=bob).json()[0]["reactions"]["clap"] == 1
+
+
+def test_toggle_unknown_shoutout_is_404(client, register, db):
+    _, ann = register("Ann", "ann@example.com")
+
+    response = client.post("/reactions/2000000000/toggle", headers=ann, json={"type": "like"})
+
+    assert response.status_code == 404
+    assert db.query(models.Reaction).count() == 0
@@ -0,0 +1,69 @@
+# Backend/tests/test_replica.py
+"""
+Read routing with a replica configured. The "replica" is a second, empty
+database, so anything read from it is visibly stale.
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from Backend import database, feed_cache, models
+
+
+@pytest.fixture
+def replica(tmp_path, monkeypatch):
+    replica_engine = create_engine(f"sqlite:///{tmp_path}/replica.db")
+    models.Base.metadata.create_all(bind=replica_engine)
+    monkeypatch.setattr(database, "ReplicaSessionLocal", sessionmaker(bind=replica_engine))
+    yield replica_engine
+    replica_engine.dispose()
+
+
+def test_reads_go_to_the_replica_until_the_client_writes(client, register, post_shoutout, replica):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    client.cookies.clear()
+    assert client.get("/shoutouts/").json() == []
+
+    response = client.post("/shoutouts/", headers=ann, json={"message": "Hi", "recipient_ids": [bob_id]})
+    assert response.headers[database.STICKY_PRIMARY_HEADER] == str(database.READ_YOUR_WRITES_SECONDS)
+    assert database.STICKY_PRIMARY_COOKIE in response.cookies
+
+    # The cookie pins this client's reads to the primary
+    assert [item["message"] for item in client.get("/shoutouts/").json()] == ["Hi"]
+
+    client.cookies.clear()
+    feed_cache.feed_cache.clear()  # that read cached the primary's page
+    assert client.get("/shoutouts/").json() == []
+    # Clients without cookies echo the header instead
+    sticky = {database.STICKY_PRIMARY_HEADER: str(database.READ_YOUR_WRITES_SECONDS)}
+    assert len(client.get("/shoutouts/", headers=sticky).json()) == 1
+
+
+def test_expired_or_garbled_cookie_reads_the_replica(client, register, post_shoutout, replica):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    post_shoutout(ann, bob_id)
+
+    for value in ("1.0", "not-a-time"):
+        client.cookies.clear()
+        client.cookies.set(database.STICKY_PRIMARY_COOKIE, value)
+        assert client.get("/shoutouts/").json() == []
+
+
+def test_replica_pages_are_not_cached(client, register, post_shoutout, replica):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    post_shoutout(ann, bob_id)
+    sticky = {database.STICKY_PRIMARY_HEADER: "5"}
+
+    client.cookies.clear()
+    stale = client.get("/shoutouts/")
+    assert stale.json() == []
+    assert feed_cache.feed_cache.stats()["size"] == 0
+
+    # The write above must be visible to a client pinned to the primary,
+    # and the page it reads is the one that gets cached
+    assert len(client.get("/shoutouts/", headers=sticky).json()) == 1
+    assert feed_cache.feed_cache.stats()["size"] == 1
+    assert len(client.get("/shoutouts/").json()) == 1
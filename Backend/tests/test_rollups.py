@@ -0,0 +1,110 @@
+# Backend/tests/test_rollups.py
+from sqlalchemy import select
+
+from Backend import aggregates, models
+from Backend.pagination import NEXT_CURSOR_HEADER
+
+STAT_COLUMNS = ("sent_count", "received_count", "like_received", "clap_received", "star_received")
+
+
+def _rollups(db):
+    """
+    Both rollup tables, without rows that are all zeros: decrements leave
+    those behind, a rebuild does not create them.
+    """
+    db.expire_all()
+
+    def rows(model, *keys):
+        columns = [getattr(model, c) for c in (*keys, *STAT_COLUMNS)]
+        return {
+            tuple(row[:len(keys)]): tuple(row[len(keys):])
+            for row in db.execute(select(*columns)).all()
+            if any(row[len(keys):])
+        }
+
+    return {
+        "daily": rows(models.UserDailyStats, "user_id", "day"),
+        "totals": rows(models.UserStats, "user_id"),
+    }
+
+
+def _toggle(client, headers, shoutout_id, reaction_type):
+    response = client.post(f"/reactions/{shoutout_id}/toggle", headers=headers, json={"type": reaction_type})
+    assert response.status_code == 200, response.text
+
+
+def test_incremental_rollups_match_a_rebuild(client, register, post_shoutout, db):
+    _, admin = register("Ada", "ada@example.com", role="admin")
+    ann_id, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    cy_id, cy = register("Cy", "cy@example.com")
+
+    first = post_shoutout(ann, [bob_id, cy_id])
+    second = post_shoutout(bob, ann_id)
+    doomed = post_shoutout(cy, [ann_id, bob_id])
+    bulk = client.post("/shoutouts/bulk", headers=admin, json={"shoutouts": [
+        {"message": "Imported", "recipient_ids": [cy_id], "sender_id": ann_id},
+        {"message": "Imported", "recipient_ids": [ann_id, bob_id], "sender_id": cy_id},
+        {"message": "From HR", "recipient_ids": [bob_id]},
+    ]})
+    assert bulk.status_code == 201, bulk.text
+
+    for headers, shoutout_id, reaction_type in [
+        (bob, first, "like"), (cy, first, "star"), (ann, second, "clap"),
+        (cy, second, "like"), (bob, doomed, "star"), (cy, bulk.json()["ids"][0], "clap"),
+    ]:
+        _toggle(client, headers, shoutout_id, reaction_type)
+    _toggle(client, bob, first, "like")                      # toggled back off
+    assert client.post(f"/reactions/{second}", headers=bob, json={"type": "star"}).status_code == 201
+
+    assert client.delete(f"/shoutouts/{doomed}", headers=cy).status_code == 200
+    assert client.delete(f"/admin/users/{cy_id}", headers=admin).status_code == 200
+
+    incremental = _rollups(db)
+    assert incremental["totals"]                             # something left to compare
+    aggregates.rebuild(db)
+    db.commit()
+    assert _rollups(db) == incremental
+
+
+def test_user_stats_come_from_the_rollups(client, register, post_shoutout):
+    ann_id, ann = register("Ann", "ann@example.com", department="Sales")
+    bob_id, bob = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(ann, bob_id)
+    post_shoutout(bob, ann_id)
+    _toggle(client, bob, shoutout_id, "like")
+    _toggle(client, bob, shoutout_id, "star")
+
+    assert client.get(f"/users/{ann_id}/stats", headers=bob).json() == {
+        "user_id": ann_id, "name": "Ann", "department": "Sales",
+        "sent_count": 1, "received_count": 1,
+        "like_count": 1, "clap_count": 0, "star_count": 1, "reaction_score": 4,
+    }
+
+    _, cy = register("Cy", "cy@example.com")
+    fresh = client.get(f"/users/{bob_id}/stats", headers=cy).json()
+    assert (fresh["sent_count"], fresh["received_count"], fresh["reaction_score"]) == (1, 1, 0)
+
+    assert client.get("/users/2000000000/stats", headers=ann).status_code == 404
+    assert client.get(f"/users/{ann_id}/stats").status_code == 401
+
+
+def test_user_shoutouts_page_by_direction(client, register, post_shoutout):
+    ann_id, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    _, cy = register("Cy", "cy@example.com")
+    sent = [post_shoutout(ann, bob_id, f"Sent {n}") for n in range(3)]
+    received = post_shoutout(bob, ann_id)
+    post_shoutout(cy, bob_id)                                # neither
+    _toggle(client, bob, sent[0], "clap")
+
+    first = client.get(f"/users/{ann_id}/shoutouts", headers=bob, params={"limit": 2})
+    rest = client.get(f"/users/{ann_id}/shoutouts", headers=bob,
+                      params={"limit": 2, "cursor": first.headers[NEXT_CURSOR_HEADER]})
+    assert [s["id"] for s in first.json() + rest.json()] == sent[::-1]
+    assert NEXT_CURSOR_HEADER not in rest.headers
+    assert rest.json()[0]["my_reactions"] == ["clap"]
+
+    inbox = client.get(f"/users/{ann_id}/shoutouts", params={"direction": "received"}).json()
+    assert [s["id"] for s in inbox] == [received]
+    assert inbox[0]["my_reactions"] == []
@@ -0,0 +1,75 @@
+# Backend/tests/test_search.py
+from Backend.pagination import NEXT_CURSOR_HEADER
+
+
+def _search(client, headers, q, **params):
+    response = client.get("/search", headers=headers, params={"q": q, **params})
+    assert response.status_code == 200, response.text
+    return response
+
+
+def _hits(client, headers, q):
+    return {(hit["kind"], hit["id"]) for hit in _search(client, headers, q).json()}
+
+
+def test_search_finds_shoutouts_and_comments(client, register, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, bob = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(ann, bob_id, "Thanks for fixing the deployment pipeline")
+    post_shoutout(ann, bob_id, "Great demo today")
+    comment = client.post(f"/comments/{shoutout_id}", headers=bob, json={"content": "The pipeline is green again"})
+
+    assert _hits(client, ann, "pipeline") == {("shoutout", shoutout_id), ("comment", comment.json()["id"])}
+    hit = _search(client, ann, "demo").json()[0]
+    assert hit["user_name"] == "Ann" and hit["text"] == "Great demo today"
+
+
+def test_every_term_must_match_and_the_last_may_be_a_prefix(client, register, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    both = post_shoutout(ann, bob_id, "Migrated the billing database")
+    post_shoutout(ann, bob_id, "Migrated the search cluster")
+
+    assert _hits(client, ann, "migrated billing") == {("shoutout", both)}
+    assert _hits(client, ann, "migrated datab") == {("shoutout", both)}
+    assert _hits(client, ann, "billing cluster") == set()
+
+
+def test_query_operators_are_not_syntax_errors(client, register, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    post_shoutout(ann, bob_id, "Shipped it")
+
+    for q in ['"shipped', "shipped OR (", "a & | !b:*", "*", "NEAR(x y)"]:
+        _search(client, ann, q)
+
+
+def test_search_pages_with_a_cursor(client, register, post_shoutout):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    ids = {post_shoutout(ann, bob_id, f"Kudos number {i}") for i in range(5)}
+
+    seen, cursor = [], None
+    for _ in range(5):
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = _search(client, ann, "kudos", **params)
+        seen += [hit["id"] for hit in response.json()]
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            break
+
+    assert sorted(seen) == sorted(ids)
+
+
+def test_deleted_shoutouts_leave_the_index(client, register, post_shoutout):
+    _, admin = register("Ada", "ada@example.com", role="admin")
+    bob_id, _ = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(admin, bob_id, "Temporary announcement")
+
+    assert client.delete(f"/admin/shoutouts/{shoutout_id}", headers=admin).status_code == 200
+
+    assert _hits(client, admin, "announcement") == set()
+
+
+def test_search_requires_login(client):
+    assert client.get("/search", params={"q": "x"}).status_code == 401
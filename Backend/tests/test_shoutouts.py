@@ -0,0 +1,49 @@
+# Backend/tests/test_shoutouts.py
+from Backend import models
+
+# Ids no test run allocates, even on a reused Postgres database
+UNKNOWN_ID, OTHER_UNKNOWN_ID = 2_000_000_000, 2_000_000_001
+
+
+def test_create_with_unknown_recipient_is_400(client, register, db):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+
+    response = client.post("/shoutouts/", headers=ann, json={
+        "message": "Thanks!", "recipient_ids": [bob_id, UNKNOWN_ID],
+    })
+
+    assert response.status_code == 400
+    assert str(UNKNOWN_ID) in response.json()["detail"]
+    assert db.query(models.Shoutout).count() == 0
+    assert db.query(models.ShoutoutRecipient).count() == 0
+
+
+def test_bulk_import_is_all_or_nothing_on_unknown_ids(client, register, db):
+    _, admin = register("Ada", "ada@example.com", role="admin")
+    bob_id, _ = register("Bob", "bob@example.com")
+
+    response = client.post("/shoutouts/bulk", headers=admin, json={"shoutouts": [
+        {"message": "Welcome", "recipient_ids": [bob_id]},
+        {"message": "On behalf", "recipient_ids": [bob_id], "sender_id": OTHER_UNKNOWN_ID},
+        {"message": "Typo", "recipient_ids": [UNKNOWN_ID]},
+    ]})
+
+    assert response.status_code == 400
+    assert f"{UNKNOWN_ID}, {OTHER_UNKNOWN_ID}" in response.json()["detail"]
+    assert db.query(models.Shoutout).count() == 0
+
+
+def test_bulk_import_creates_every_item(client, register):
+    ada_id, admin = register("Ada", "ada@example.com", role="admin")
+    bob_id, bob = register("Bob", "bob@example.com")
+
+    response = client.post("/shoutouts/bulk", headers=admin, json={"shoutouts": [
+        {"message": "Welcome", "recipient_ids": [bob_id]},
+        {"message": "On behalf", "recipient_ids": [ada_id], "sender_id": bob_id},
+    ]})
+
+    assert response.status_code == 201, response.text
+    ids = response.json()["ids"]
+    for shoutout_id in ids:
+        assert client.get(f"/shoutouts/{shoutout_id}", headers=bob).status_code == 200
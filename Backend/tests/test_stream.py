@@ -0,0 +1,145 @@
+# Backend/tests/test_stream.py
+import asyncio
+import json
+import threading
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from Backend import events, security
+
+
+class _DrainingSubscription(events.Subscription):
+    """
+    Hands out what is queued, then closes instead of waiting for more.
+    """
+
+    async def get(self, timeout):
+        if self.queue.empty():
+            self.closed = True
+            return None
+        return self.queue.get_nowait()
+
+
+class _ReplayHub(events.InProcessHub):
+    """
+    Records published events and replays them to each new subscriber,
+    whose stream then ends: lets a TestClient read /stream to the end.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.log = []
+
+    def has_subscribers(self):
+        return True   # record every event
+
+    def publish(self, event_type, data):
+        self.log.append({"id": len(self.log) + 1, "type": event_type, "data": jsonable_encoder(data)})
+
+    def subscribe(self):
+        subscription = _DrainingSubscription(asyncio.get_running_loop(), self.queue_size)
+        for event in self.log:
+            subscription.offer(event)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    replay = _ReplayHub()
+    monkeypatch.setattr(events, "hub", replay)
+    return replay
+
+
+def _events(body: str):
+    parsed = []
+    for block in body.split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if "event" in fields:
+            parsed.append((fields["event"], json.loads(fields["data"])))
+    return parsed
+
+
+def test_stream_with_a_ticket_delivers_events(client, register, post_shoutout, hub):
+    _, ann = register("Ann", "ann@example.com")
+    bob_id, _ = register("Bob", "bob@example.com")
+    shoutout_id = post_shoutout(ann, bob_id, "Live")
+
+    ticket = client.post("/stream/ticket", headers=ann).json()
+    assert ticket["expires_in"] == security.STREAM_TICKET_SECONDS
+    response = client.get("/stream", params={"ticket": ticket["ticket"]})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text.startswith("retry: 3000\n\n")
+    [(event_type, data)] = _events(response.text)
+    assert event_type == "shoutout.created"
+    assert (data["id"], data["message"]) == (shoutout_id, "Live")
+    assert not hub._subscribers   # unsubscribed once the stream ended
+
+
+def test_stream_accepts_a_bearer_header(client, register, hub):
+    _, ann = register("Ann", "ann@example.com")
+    assert client.get("/stream", headers=ann).status_code == 200
+
+
+def test_stream_refuses_missing_and_misused_credentials(client, register, hub, monkeypatch):
+    _, ann = register("Ann", "ann@example.com")
+    access = ann["Authorization"].removeprefix("Bearer ")
+    ticket = client.post("/stream/ticket", headers=ann).json()["ticket"]
+
+    assert client.get("/stream").status_code == 401
+    assert client.post("/stream/ticket").status_code == 401
+    # An access token is not a ticket, and a ticket is not an access token
+    assert client.get("/stream", params={"ticket": access}).status_code == 401
+    assert client.get("/auth/me", headers={"Authorization": f"Bearer {ticket}"}).status_code == 401
+
+    monkeypatch.setattr(security, "STREAM_TICKET_SECONDS", -1)
+    expired = client.post("/stream/ticket", headers=ann).json()["ticket"]
+    assert client.get("/stream", params={"ticket": expired}).status_code == 401
+
+
+def test_hub_delivers_events_published_from_other_threads():
+    async def scenario():
+        hub = events.InProcessHub()
+        subscription = hub.subscribe()
+        publisher = threading.Thread(target=hub.publish, args=("shoutout.deleted", {"id": 7}))
+        publisher.start()
+        event = await subscription.get(timeout=5)
+        publisher.join()
+        hub.unsubscribe(subscription)
+        hub.publish("shoutout.deleted", {"id": 8})
+        await asyncio.sleep(0)
+        return hub, subscription, event
+
+    hub, subscription, event = asyncio.run(scenario())
+
+    assert event == {"id": 1, "type": "shoutout.deleted", "data": {"id": 7}}
+    assert subscription.queue.empty()
+    assert not hub.has_subscribers()
+    assert hub.stats()["published"] == 2
+
+
+def test_hub_closes_subscribers_that_fall_behind():
+    async def scenario():
+        hub = events.InProcessHub(queue_size=1)
+        subscription = hub.subscribe()
+        hub.publish("feed.invalidated", {})
+        hub.publish("feed.invalidated", {})
+        await asyncio.sleep(0)   # run the queued deliveries
+        return hub, subscription, await subscription.get(timeout=5)
+
+    hub, subscription, after_close = asyncio.run(scenario())
+
+    assert subscription.closed
+    assert after_close is None
+    assert hub.stats()["dropped_subscribers"] == 1
+
+
+def test_subscription_get_times_out_with_none():
+    async def scenario():
+        return await events.InProcessHub().subscribe().get(timeout=0.01)
+
+    assert asyncio.run(scenario()) is None
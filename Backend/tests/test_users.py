@@ -0,0 +1,77 @@
+# Backend/tests/test_users.py
+import pytest
+
+from Backend.pagination import NEXT_CURSOR_HEADER
+
+
+@pytest.fixture
+def people(register):
+    """
+    Five users across three departments; Ada is an admin.
+    """
+    ids = {}
+    for name, email, department in [
+        ("Ada", "ada@example.com", "People"),
+        ("Cy", "cy@example.com", "Sales"),
+        ("Ann", "zed@example.com", "Engineering"),
+        ("Bob", "bob@example.com", "Sales"),
+        ("Bea", "bea@example.com", "Engineering"),
+    ]:
+        ids[name], headers = register(name, email, role="admin" if name == "Ada" else "employee",
+                                      department=department)
+        ids[f"{name}_headers"] = headers
+    return ids
+
+
+def _names(response):
+    assert response.status_code == 200, response.text
+    return [user["name"] for user in response.json()]
+
+
+def test_directory_pages_alphabetically(client, people):
+    headers = people["Ann_headers"]
+
+    first = client.get("/users/", headers=headers, params={"limit": 3})
+    rest = client.get("/users/", headers=headers,
+                      params={"limit": 3, "cursor": first.headers[NEXT_CURSOR_HEADER]})
+
+    assert _names(first) + _names(rest) == ["Ada", "Ann", "Bea", "Bob", "Cy"]
+    assert NEXT_CURSOR_HEADER not in rest.headers
+    assert set(first.json()[0]) == {"id", "name", "email", "department"}
+    assert client.get("/users/").status_code == 401
+
+
+def test_search_matches_a_prefix_of_name_email_or_department(client, people):
+    headers = people["Ann_headers"]
+
+    def search(q, **params):
+        return _names(client.get("/users/", headers=headers, params={"q": q, **params}))
+
+    assert search("b") == ["Bea", "Bob"]
+    assert search("ZED") == ["Ann"]                       # email
+    assert search("sal") == ["Bob", "Cy"]                 # department
+    assert search("e") == ["Ann", "Bea"]                  # "Engineering", not "bEa"
+    assert search("b", department="Sales") == ["Bob"]
+    assert search("%") == []                              # LIKE wildcards are escaped
+    assert search("b", limit=1) == ["Bea"]
+
+
+def test_directory_and_departments_skip_inactive_users(client, people, register):
+    lee_id, _ = register("Lee", "lee@example.com", department="Legal")
+    admin = people["Ada_headers"]
+    assert client.post(f"/admin/users/{lee_id}/block", headers=admin).status_code == 200
+
+    headers = people["Bob_headers"]
+    assert "Lee" not in _names(client.get("/users/", headers=headers))
+    assert "Legal" not in client.get("/users/departments", headers=headers).json()
+
+
+def test_departments_are_distinct_and_sorted(client, people, register):
+    register("Dee", "dee@example.com", department="")
+    headers = people["Cy_headers"]
+
+    response = client.get("/users/departments", headers=headers)
+
+    assert response.status_code == 200, response.text
+    assert response.json() == ["Engineering", "People", "Sales"]
+    assert client.get("/users/departments").status_code == 401
@@ -1,14 +1,18 @@
 // src/AdminDashboard.js
-import React, { useState, useEffect, useMemo } from "react";
+import React, { useState, useEffect, useMemo, useRef } from "react";
 import dayjs from "dayjs";
 import relativeTime from "dayjs/plugin/relativeTime";
 import {
-  getAllShoutouts,
+  getShoutoutsPage,
+  getLeaderboard,
+  getDepartments,
+  searchUsers,
   addReaction,
   addComment,
   getComments,
 } from "./services/shoutoutService";
 import {
+  getAdminStats,
   getReports,
   deleteShoutoutAdmin,
   deleteReportAdmin,
@@ -24,6 +28,9 @@ import { Heart, PartyPopper, Sparkles, MessageCircle } from "lucide-react";
 
 dayjs.extend(relativeTime);
 
+// Comments per thread page; "Load older comments" fetches the next one
+const COMMENT_PAGE_SIZE = 20;
+
 /* ---------- SMALL UI PIECES ---------- */
 
 function BragboardLogo({ size = 40 }) {
@@ -120,9 +127,85 @@ function Leaderboard({ title, data }) {
   );
 }
 
+function LoadMoreButton({ list }) {
+  if (!list.nextCursor) return null;
+  return (
+    <div className="flex justify-center mt-4">
+      <button
+        onClick={list.loadMore}
+        disabled={list.loadingMore}
+        className="px-4 py-2 bg-white border rounded-lg shadow-sm text-sm hover:bg-gray-50 disabled:opacity-50"
+      >
+        {list.loadingMore ? "Loading..." : "Load more"}
+      </button>
+    </div>
+  );
+}
+
+/* ---------- PAGED LISTS ---------- */
+
+// One cursor-paginated listing. fetchPage(params) returns
+// { items, nextCursor }; reload() fetches the first page again and
+// loadMore() appends the next one.
+function usePagedList(fetchPage, normalize = (item) => item) {
+  const [items, setItems] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  const reload = async (params = {}) => {
+    const page = await fetchPage(params);
+    setItems((page.items || []).map(normalize));
+    setNextCursor(page.nextCursor);
+  };
+
+  const loadMore = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const page = await fetchPage({ cursor: nextCursor });
+      setItems((prev) => {
+        const seen = new Set(prev.map((item) => item.id));
+        return [
+          ...prev,
+          ...(page.items || [])
+            .map(normalize)
+            .filter((item) => !seen.has(item.id)),
+        ];
+      });
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      console.error("Failed to load more:", err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  return { items, setItems, nextCursor, loadingMore, reload, loadMore };
+}
+
+const normalizeShoutout = (d) => ({
+  ...d,
+  reactions: {
+    like: 0,
+    clap: 0,
+    star: 0,
+    ...(d.reactions || {}),
+  },
+  myReactions: d.my_reactions || d.user_reactions || d.myReactions || [],
+  comments: d.comments || [],
+  comments_count:
+    d.comments_count ?? (Array.isArray(d.comments) ? d.comments.length : 0),
+});
+
 /* ---------- TABLES ---------- */
 
-function ModerationTable({ reports, loading, onResolve, onDeleteShoutout }) {
+function ModerationTable({
+  reports,
+  hasMore,
+  loading,
+  onResolve,
+  onDeleteShoutout,
+}) {
   return (
     <>
       <div className="flex items-center justify-between mb-3">
@@ -130,7 +213,9 @@ function ModerationTable({ reports, loading, onResolve, onDeleteShoutout }) {
           Reported Shout-outs
         </h2>
         <div className="text-xs text-gray-500">
-          {loading ? "Updating..." : `${reports.length} reports`}
+          {loading
+            ? "Updating..."
+            : `${reports.length}${hasMore ? "+" : ""} reports`}
         </div>
       </div>
 
@@ -332,11 +417,9 @@ export default function AdminDashboard({
   token = localStorage.getItem("token"),
   onLogout = () => {},
 }) {
-  const [shoutouts, setShoutouts] = useState([]);
-  const [reports, setReports] = useState([]);
-  const [users, setUsers] = useState([]);
-  const [comments, setComments] = useState([]);
-  const [flaggedComments, setFlaggedComments] = useState([]);
+  const [stats, setStats] = useState(null);
+  const [leaderboard, setLeaderboard] = useState(null);
+  const [departmentOptions, setDepartmentOptions] = useState([]);
 
   const [loading, setLoading] = useState(false);
   const [moderationLoading, setModerationLoading] = useState(false);
@@ -348,11 +431,46 @@ export default function AdminDashboard({
   const [taggedUsers, setTaggedUsers] = useState([]);
   const [showSuggestions, setShowSuggestions] = useState(false);
   const [filteredUsers, setFilteredUsers] = useState([]);
+  const latestMention = useRef("");
 
   const [filterDept, setFilterDept] = useState("all");
   const [filterSender, setFilterSender] = useState("all");
   const [filterDate, setFilterDate] = useState("all");
 
+  // Feed filters are applied by the API, so every page is already filtered
+  const feedParams = useMemo(() => {
+    const params = {};
+    if (filterDept !== "all") params.department = filterDept;
+    if (filterSender !== "all") params.sender_id = filterSender;
+    if (filterDate !== "all") {
+      params.since = dayjs()
+        .startOf(filterDate === "today" ? "day" : filterDate)
+        .toISOString();
+    }
+    return params;
+  }, [filterDept, filterSender, filterDate]);
+
+  // Every listing is loaded one page at a time ("Load more")
+  const feedList = usePagedList(
+    (params) => getShoutoutsPage(token, { ...feedParams, ...params }),
+    normalizeShoutout
+  );
+  const reportList = usePagedList((params) => getReports(token, params));
+  const userList = usePagedList((params) => getAllUsersAdmin(token, params));
+  const commentList = usePagedList((params) =>
+    getAllCommentsAdmin(token, params)
+  );
+  const flaggedList = usePagedList((params) =>
+    getFlaggedCommentsAdmin(token, params)
+  );
+
+  const shoutouts = feedList.items;
+  const setShoutouts = feedList.setItems;
+  const reports = reportList.items;
+  const users = userList.items;
+  const comments = commentList.items;
+  const flaggedComments = flaggedList.items;
+
   useEffect(() => {
     setCommentText("");
     setTaggedUsers([]);
@@ -365,23 +483,7 @@ export default function AdminDashboard({
   const loadShoutouts = async () => {
     setLoading(true);
     try {
-      const data = await getAllShoutouts(token);
-      const normalized = (Array.isArray(data) ? data : []).map((d) => ({
-        ...d,
-        reactions: {
-          like: 0,
-          clap: 0,
-          star: 0,
-          ...(d.reactions || {}),
-        },
-        myReactions:
-          d.my_reactions || d.user_reactions || d.myReactions || [],
-        comments: d.comments || [],
-        comments_count:
-          d.comments_count ??
-          (Array.isArray(d.comments) ? d.comments.length : 0),
-      }));
-      setShoutouts(normalized);
+      await feedList.reload();
     } catch (err) {
       console.error("Failed to load shoutouts:", err);
     }
@@ -390,8 +492,7 @@ export default function AdminDashboard({
 
   const loadReports = async () => {
     try {
-      const data = await getReports(token);
-      setReports(Array.isArray(data) ? data : []);
+      await reportList.reload();
     } catch (err) {
       console.error("Failed to load reports:", err);
     }
@@ -399,136 +500,103 @@ export default function AdminDashboard({
 
   const loadUsers = async () => {
     try {
-      const data = await getAllUsersAdmin(token);
-      setUsers(Array.isArray(data) ? data : []);
+      await userList.reload();
     } catch (err) {
       console.error("Failed to load users:", err);
     }
   };
 
-// -------- FETCH COMMENTS --------
-const loadCommentsAdmin = async () => {
-  try {
-    const data = await getAllCommentsAdmin(token);
-    setComments(data || []);          // no Array.isArray check needed
-  } catch (err) {
-    console.error("Failed to load comments:", err);
-  }
-};
-
-// -------- FETCH FLAGGED COMMENTS --------
-const loadFlagged = async () => {
-  try {
-    const data = await getFlaggedCommentsAdmin(token);
-    setFlaggedComments(data || []);
-  } catch (err) {
-    console.error("Failed to load flagged comments:", err);
-  }
-};
+  const loadCommentsAdmin = async () => {
+    try {
+      await commentList.reload();
+    } catch (err) {
+      console.error("Failed to load comments:", err);
+    }
+  };
+
+  const loadFlagged = async () => {
+    try {
+      await flaggedList.reload();
+    } catch (err) {
+      console.error("Failed to load flagged comments:", err);
+    }
+  };
+
+  // Totals and leaderboards come from the server, not the loaded pages
+  const loadStats = async () => {
+    try {
+      const [totals, board] = await Promise.all([
+        getAdminStats(token),
+        getLeaderboard(token, "all", 5),
+      ]);
+      setStats(totals);
+      setLeaderboard(board);
+    } catch (err) {
+      console.error("Failed to load stats:", err);
+    }
+  };
 
   useEffect(() => {
     if (!token) return;
-    loadShoutouts();
+    getDepartments(token)
+      .then(setDepartmentOptions)
+      .catch((err) => console.error("Failed to load departments:", err));
+    loadStats();
     loadReports();
     loadUsers();
     loadCommentsAdmin();
     loadFlagged();
   }, [token]);
 
-  /* ---------- STATS ---------- */
-
-  const { totalUsers, totalShoutouts, totalComments, totalReactions } =
-    useMemo(() => {
-      const userIds = new Set();
-      let reactionCount = 0;
-
-      shoutouts.forEach((s) => {
-        if (s.sender?.id) userIds.add(s.sender.id);
-        (s.recipients || []).forEach((r) => r.id && userIds.add(r.id));
+  useEffect(() => {
+    if (token) loadShoutouts();
+  }, [token, feedParams]);
 
-        reactionCount +=
-          (s.reactions?.like || 0) +
-          (s.reactions?.clap || 0) +
-          (s.reactions?.star || 0);
-      });
+  /* ---------- STATS ---------- */
 
-      return {
-        totalUsers: userIds.size,
-        totalShoutouts: shoutouts.length,
-        totalComments: comments.length,
-        totalReactions: reactionCount,
-      };
-    }, [shoutouts, comments]);
+  const totalUsers = stats?.users ?? "—";
+  const totalShoutouts = stats?.shoutouts ?? "—";
+  const totalComments = stats?.comments ?? "—";
+  const totalReactions = stats?.reactions ?? "—";
 
-  const topContributors = useMemo(() => {
-    const map = {};
-    shoutouts.forEach((s) => {
-      if (s.sender?.id) {
-        if (!map[s.sender.id]) {
-          map[s.sender.id] = {
-            id: s.sender.id,
-            name: s.sender.name,
-            department: s.sender.department,
-            sent: 0,
-            received: 0,
-            points: 0,
-          };
-        }
-        map[s.sender.id].sent += 1;
-        map[s.sender.id].points += 5;
-      }
-      (s.recipients || []).forEach((r) => {
-        if (!map[r.id]) {
-          map[r.id] = {
-            id: r.id,
-            name: r.name,
-            department: r.department,
-            sent: 0,
-            received: 0,
-            points: 0,
-          };
-        }
-        map[r.id].received += 1;
-        map[r.id].points += 2;
-      });
-    });
-    return Object.values(map)
-      .sort((a, b) => b.points - a.points)
-      .slice(0, 5);
-  }, [shoutouts]);
+  const topContributors = useMemo(
+    () =>
+      (leaderboard?.top_users || []).map((u) => ({
+        id: u.user_id,
+        name: u.name,
+        department: u.department,
+        points: u.points,
+      })),
+    [leaderboard]
+  );
 
-  const mostTagged = useMemo(() => {
-    const map = {};
-    shoutouts.forEach((s) =>
-      (s.recipients || []).forEach((r) => {
-        if (!map[r.id]) {
-          map[r.id] = {
-            id: r.id,
-            name: r.name,
-            department: r.department,
-            taggedCount: 0,
-          };
-        }
-        map[r.id].taggedCount += 1;
-      })
-    );
-    return Object.values(map)
-      .sort((a, b) => b.taggedCount - a.taggedCount)
-      .slice(0, 5);
-  }, [shoutouts]);
+  const mostTagged = useMemo(
+    () =>
+      (leaderboard?.top_recipients || []).map((u) => ({
+        id: u.user_id,
+        name: u.name,
+        department: u.department,
+        taggedCount: u.received,
+      })),
+    [leaderboard]
+  );
 
   /* ---------- FEED HELPERS ---------- */
 
+  // Threads are read newest page first and shown oldest first
   const loadCommentsForPost = async (postId) => {
     try {
-      const postComments = await getComments(postId, token);
+      const page = await getComments(postId, token, {
+        order: "newest",
+        limit: COMMENT_PAGE_SIZE,
+      });
       setShoutouts((prev) =>
         prev.map((s) =>
           s.id === postId
             ? {
                 ...s,
-                comments: postComments,
-                comments_count: postComments.length,
+                comments: [...page.items].reverse(),
+                commentsCursor: page.nextCursor,
               }
             : s
         )
@@ -538,6 +606,33 @@ const loadFlagged = async () => {
     }
   };
 
+  const loadOlderComments = async (post) => {
+    if (!post.commentsCursor) return;
+    try {
+      const page = await getComments(post.id, token, {
+        order: "newest",
+        limit: COMMENT_PAGE_SIZE,
+        cursor: post.commentsCursor,
+      });
+      setShoutouts((prev) =>
+        prev.map((s) => {
+          if (s.id !== post.id) return s;
+          const seen = new Set(s.comments.map((c) => c.id));
+          const older = [...page.items]
+            .reverse()
+            .filter((c) => !seen.has(c.id));
+          return {
+            ...s,
+            comments: [...older, ...s.comments],
+            commentsCursor: page.nextCursor,
+          };
+        })
+      );
+    } catch (err) {
+      console.error("Failed to fetch older comments:", err);
+    }
+  };
+
   const toggleReaction = async (postId, type) => {
     let snapshot = null;
     try {
@@ -601,7 +696,7 @@ const loadFlagged = async () => {
   const handleAddComment = async (postId) => {
     if (!commentText.trim()) return;
     try {
-      await addComment(
+      const created = await addComment(
         postId,
         {
           content: commentText.trim(),
@@ -609,6 +704,13 @@ const loadFlagged = async () => {
         },
         token
       );
+      setShoutouts((prev) =>
+        prev.map((s) =>
+          s.id === postId
+            ? { ...s, comments_count: created.comment_count ?? s.comments_count }
+            : s
+        )
+      );
       await loadCommentsForPost(postId);
       setCommentText("");
       setTaggedUsers([]);
@@ -626,17 +728,22 @@ const loadFlagged = async () => {
     const atIndex = value.lastIndexOf("@");
     if (atIndex >= 0) {
       const query = value.slice(atIndex + 1).toLowerCase();
+      latestMention.current = query;
       if (query.length > 0) {
-        const matches = users.filter((u) =>
-          (u.name || "").toLowerCase().includes(query)
-        );
-        setFilteredUsers(matches);
-        setShowSuggestions(matches.length > 0);
+        // Prefix search over the whole directory; drop stale responses
+        searchUsers(query, token, { limit: 8 })
+          .then((matches) => {
+            if (latestMention.current !== query) return;
+            setFilteredUsers(matches);
+            setShowSuggestions(matches.length > 0);
+          })
+          .catch((err) => console.error("User search failed:", err));
       } else {
         setShowSuggestions(false);
         setFilteredUsers([]);
       }
     } else {
+      latestMention.current = "";
       setShowSuggestions(false);
       setFilteredUsers([]);
     }
@@ -678,7 +785,7 @@ const loadFlagged = async () => {
     setModerationLoading(true);
     try {
       await deleteShoutoutAdmin(id, token);
-      await Promise.all([loadShoutouts(), loadReports()]);
+      await Promise.all([loadShoutouts(), loadReports(), loadStats()]);
     } catch (err) {
       console.error("Failed to delete shoutout:", err);
     }
@@ -707,7 +814,7 @@ const loadFlagged = async () => {
     if (!window.confirm("Delete user?")) return;
     try {
       await deleteUserAdmin(id, token);
-      await loadUsers();
+      await Promise.all([loadUsers(), loadStats()]);
     } catch (err) {
       console.error("Failed:", err);
     }
@@ -717,59 +824,21 @@ const loadFlagged = async () => {
     if (!window.confirm("Delete this comment?")) return;
     try {
       await deleteCommentAdmin(id, token);
-      await Promise.all([loadCommentsAdmin(), loadFlagged()]);
+      await Promise.all([loadCommentsAdmin(), loadFlagged(), loadStats()]);
     } catch (err) {
       console.error("Failed:", err);
     }
   };
 
-  /* ---------- FILTERED FEED ---------- */
+  /* ---------- FEED FILTERS ---------- */
 
-  const filteredShoutouts = useMemo(() => {
-    return shoutouts.filter((post) => {
-      if (
-        filterDept !== "all" &&
-        post.sender?.department !== filterDept
-      )
-        return false;
-      if (filterSender !== "all" && post.sender?.name !== filterSender)
-        return false;
-
-      const created = dayjs(post.created_at);
-      if (filterDate === "today" && !created.isSame(dayjs(), "day"))
-        return false;
-      if (filterDate === "week" && !created.isSame(dayjs(), "week"))
-        return false;
-      if (filterDate === "month" && !created.isSame(dayjs(), "month"))
-        return false;
-
-      return true;
+  const senderOptions = useMemo(() => {
+    const byId = new Map();
+    shoutouts.forEach((s) => {
+      if (s.sender?.id && s.sender.name) byId.set(s.sender.id, s.sender.name);
     });
-  }, [shoutouts, filterDept, filterSender, filterDate]);
-
-  const departmentOptions = useMemo(
-    () =>
-      Array.from(
-        new Set(
-          shoutouts
-            .map((s) => s.sender?.department)
-            .filter((d) => d && d !== "")
-        )
-      ),
-    [shoutouts]
-  );
-
-  const senderOptions = useMemo(
-    () =>
-      Array.from(
-        new Set(
-          shoutouts
-            .map((s) => s.sender?.name)
-            .filter((n) => n && n !== "")
-        )
-      ),
-    [shoutouts]
-  );
+    return Array.from(byId, ([id, name]) => ({ id, name }));
+  }, [shoutouts]);
 
   /* ---------- RENDER ---------- */
 
@@ -861,9 +930,9 @@ const loadFlagged = async () => {
                     className="border p-2 rounded w-44"
                   >
                     <option value="all">All</option>
-                    {senderOptions.map((name) => (
-                      <option key={name} value={name}>
-                        {name}
+                    {senderOptions.map((sender) => (
+                      <option key={sender.id} value={sender.id}>
+                        {sender.name}
                       </option>
                     ))}
                   </select>
@@ -887,12 +956,14 @@ const loadFlagged = async () => {
               <div className="flex items-center justify-between mb-4 mt-1">
                 <h2 className="text-lg font-semibold">Recognition Feed</h2>
                 <div className="text-sm text-gray-500">
-                  {loading ? "Loading..." : `${filteredShoutouts.length} posts`}
+                  {loading
+                    ? "Loading..."
+                    : `${shoutouts.length}${feedList.nextCursor ? "+" : ""} posts`}
                 </div>
               </div>
 
               <div className="space-y-4">
-                {filteredShoutouts.map((post) => {
+                {shoutouts.map((post) => {
                   const commentsCount =
                     post.comments_count ??
                     (post.comments ? post.comments.length : 0);
@@ -979,6 +1050,14 @@ const loadFlagged = async () => {
 
                           {activePostId === post.id && (
                             <div className="mt-3 border-t pt-3 space-y-2">
+                              {post.commentsCursor && (
+                                <button
+                                  onClick={() => loadOlderComments(post)}
+                                  className="text-xs text-blue-600 hover:underline"
+                                >
+                                  Load older comments
+                                </button>
+                              )}
                               {(!post.comments || post.comments.length === 0) ? (
                                 <div className="text-xs text-gray-500">
                                   No comments yet — add one!
@@ -1044,41 +1123,55 @@ const loadFlagged = async () => {
                   );
                 })}
               </div>
+              <LoadMoreButton list={feedList} />
             </>
           )}
 
           {activeTab === "reports" && (
-            <ModerationTable
-              reports={reports}
-              loading={moderationLoading}
-              onResolve={handleResolveReport}
-              onDeleteShoutout={handleDeleteShoutout}
-            />
+            <>
+              <ModerationTable
+                reports={reports}
+                hasMore={Boolean(reportList.nextCursor)}
+                loading={moderationLoading}
+                onResolve={handleResolveReport}
+                onDeleteShoutout={handleDeleteShoutout}
+              />
+              <LoadMoreButton list={reportList} />
+            </>
           )}
 
           {activeTab === "users" && (
-            <UsersTable
-              users={users}
-              onRole={handleRoleChange}
-              onToggle={handleToggleActive}
-              onDelete={handleDeleteUser}
-            />
+            <>
+              <UsersTable
+                users={users}
+                onRole={handleRoleChange}
+                onToggle={handleToggleActive}
+                onDelete={handleDeleteUser}
+              />
+              <LoadMoreButton list={userList} />
+            </>
           )}
 
           {activeTab === "comments" && (
-            <CommentsTable
-              comments={comments}
-              onDelete={handleDeleteComment}
-              flaggedMode={false}
-            />
+            <>
+              <CommentsTable
+                comments={comments}
+                onDelete={handleDeleteComment}
+                flaggedMode={false}
+              />
+              <LoadMoreButton list={commentList} />
+            </>
           )}
 
           {activeTab === "flagged" && (
-            <CommentsTable
-              comments={flaggedComments}
-              onDelete={handleDeleteComment}
-              flaggedMode={true}
-            />
+            <>
+              <CommentsTable
+                comments={flaggedComments}
+                onDelete={handleDeleteComment}
+                flaggedMode={true}
+              />
+              <LoadMoreButton list={flaggedList} />
+            </>
           )}
         </section>
       </div>
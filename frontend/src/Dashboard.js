@@ -1,15 +1,21 @@
 // src/Dashboard.js
-import React, { useState, useMemo, useEffect } from "react";
+import React, { useState, useMemo, useEffect, useCallback, useRef } from "react";
 import dayjs from "dayjs";
 import relativeTime from "dayjs/plugin/relativeTime";
 
 import {
-  getAllShoutouts,
+  getShoutoutsPage,
   createShoutout,
-  addReaction,
+  toggleReaction as toggleReactionApi,
   addComment,
   getComments,
   flagComment, // ⭐ New
+  subscribeToFeed,
+  getLeaderboard,
+  getUserStats,
+  getUserShoutouts,
+  searchUsers,
+  getDepartments,
 } from "./services/shoutoutService";
 
 import { createReport } from "./services/reportService";
@@ -24,6 +30,43 @@ import {
 
 dayjs.extend(relativeTime);
 
+// Latest comments embedded in each feed item (GET /shoutouts/?comments=N)
+const COMMENT_PREVIEWS = 3;
+
+// Comments per thread page; "Load older comments" fetches the next one
+const COMMENT_PAGE_SIZE = 20;
+
+const EMPTY_PROFILE_STATS = {
+  sent: [],
+  received: [],
+  sentCount: 0,
+  receivedCount: 0,
+  likeCount: 0,
+  clapCount: 0,
+  starCount: 0,
+  reactionScore: 0,
+};
+
+// ---------- NORMALIZE API SHOUTOUT ----------
+const normalizeShoutout = (d) => ({
+  ...d,
+  reactions: {
+    like: d.reactions?.like || 0,
+    clap: d.reactions?.clap || 0,
+    star: d.reactions?.star || 0,
+  },
+  myReactions: d.my_reactions || d.user_reactions || d.myReactions || [],
+});
+
+// Would the feed API, given these params (see feedParams), return this
+// shoutout? Used for live posts; a new post is always inside "since".
+const matchesFeedParams = (s, params) =>
+  (!params.department || s.sender?.department === params.department) &&
+  (params.sender_id == null || String(s.sender?.id) === String(params.sender_id)) &&
+  (params.recipient_id == null ||
+    (s.recipients || []).some((r) => String(r.id) === String(params.recipient_id))) &&
+  (!params.q || (s.message || "").toLowerCase().includes(params.q.trim().toLowerCase()));
+
 // ---------- BRAGBOARD LOGO ----------
 function BragboardLogo({ size = 40 }) {
   return (
@@ -78,22 +121,81 @@ function Avatar({ name, size = 40 }) {
   );
 }
 
+// ---------- USER PICKER ----------
+// Typeahead over the user directory (GET /users/?q=): only the few
+// matches for what has been typed are ever fetched.
+function UserPicker({ token, placeholder, onPick, excludeIds = [] }) {
+  const [query, setQuery] = useState("");
+  const [matches, setMatches] = useState([]);
+  const latestQuery = useRef("");
+
+  useEffect(() => {
+    const q = query.trim();
+    latestQuery.current = q;
+    if (!q) {
+      setMatches([]);
+      return undefined;
+    }
+    const timer = setTimeout(() => {
+      searchUsers(q, token, { limit: 8 })
+        .then((found) => {
+          if (latestQuery.current === q) setMatches(found);
+        })
+        .catch((err) => console.error("User search failed:", err));
+    }, 200);
+    return () => clearTimeout(timer);
+  }, [query, token]);
+
+  const visible = matches.filter((u) => !excludeIds.includes(u.id));
+
+  return (
+    <div className="relative">
+      <input
+        value={query}
+        onChange={(e) => setQuery(e.target.value)}
+        placeholder={placeholder}
+        className="w-full border rounded p-2 text-sm"
+      />
+      {visible.length > 0 && (
+        <ul className="absolute z-10 bg-white border rounded shadow mt-1 w-full max-h-40 overflow-y-auto">
+          {visible.map((u) => (
+            <li
+              key={u.id}
+              onClick={() => {
+                onPick(u);
+                setQuery("");
+                setMatches([]);
+              }}
+              className="px-3 py-1 hover:bg-blue-100 cursor-pointer text-sm"
+            >
+              {u.name}{" "}
+              <span className="text-xs text-gray-500">({u.department})</span>
+            </li>
+          ))}
+        </ul>
+      )}
+    </div>
+  );
+}
+
 // ---------- MAIN COMPONENT ----------
 export default function Dashboard({
   user = { name: "You", department: "General", role: "employee" },
   token = localStorage.getItem("token"),
   onLogout = () => {},
 }) {
-  const [users, setUsers] = useState([]);
+  const [departments, setDepartments] = useState([]);
   const [shoutouts, setShoutouts] = useState([]);
   const [loading, setLoading] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   const [activePostId, setActivePostId] = useState(null);
   const [commentText, setCommentText] = useState("");
 
   const [showNewModal, setShowNewModal] = useState(false);
   const [newMessage, setNewMessage] = useState("");
-  const [newRecipients, setNewRecipients] = useState([]);
+  const [newRecipients, setNewRecipients] = useState([]); // picked users
 
   // --- REPORT SHOUTOUT STATE ---
   const [reportModal, setReportModal] = useState(false);
@@ -111,10 +213,12 @@ export default function Dashboard({
   const [showSuggestions, setShowSuggestions] = useState(false);
   const [filteredUsers, setFilteredUsers] = useState([]);
   const [mentionQuery, setMentionQuery] = useState("");
+  const latestMention = useRef("");
 
   // Filters
   const [filterDept, setFilterDept] = useState("all");
   const [filterSender, setFilterSender] = useState("all");
+  const [filterSenderName, setFilterSenderName] = useState("");
   const [filterDate, setFilterDate] = useState("all");
 
   // PROFILE OVERLAY
@@ -130,57 +234,191 @@ export default function Dashboard({
   }, [activePostId]);
 
   // =============== FETCH SHOUTOUTS ===============
-  useEffect(() => {
-    const fetchShoutouts = async () => {
-      try {
-        setLoading(true);
-        const data = await getAllShoutouts(token);
-
-        const normalized = Array.isArray(data)
-          ? data.map((d) => ({
-              ...d,
-              reactions: {
-                like: d.reactions?.like || 0,
-                clap: d.reactions?.clap || 0,
-                star: d.reactions?.star || 0,
-              },
-              myReactions:
-                d.my_reactions || d.user_reactions || d.myReactions || [],
-            }))
-          : [];
-
-        setShoutouts(normalized);
-
-        // Build user list
-        const userMap = new Map();
-        normalized.forEach((s) => {
-          if (s.sender) userMap.set(s.sender.id, s.sender);
-          (s.recipients || []).forEach((r) => userMap.set(r.id, r));
-        });
+  // Filters are applied by the API, so every page is already filtered
+  const feedParams = useMemo(() => {
+    const params = { comments: COMMENT_PREVIEWS };
+    if (filterDept !== "all") params.department = filterDept;
+    if (filterSender !== "all") params.sender_id = filterSender;
+    if (filterDate !== "all") {
+      params.since = dayjs()
+        .startOf(filterDate === "today" ? "day" : filterDate)
+        .toISOString();
+    }
+    return params;
+  }, [filterDept, filterSender, filterDate]);
 
-        setUsers(Array.from(userMap.values()));
-      } catch (err) {
-        console.error("Failed to load shoutouts:", err);
-      } finally {
-        setLoading(false);
-      }
-    };
+  // Read through a ref so filter changes don't reconnect /stream
+  const feedParamsRef = useRef(feedParams);
+  feedParamsRef.current = feedParams;
 
+  const fetchShoutouts = useCallback(async () => {
+    try {
+      setLoading(true);
+      const page = await getShoutoutsPage(token, feedParamsRef.current);
+      setShoutouts((page.items || []).map(normalizeShoutout));
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      console.error("Failed to load shoutouts:", err);
+    } finally {
+      setLoading(false);
+    }
+  }, [token]);
+
+  useEffect(() => {
     if (token) fetchShoutouts();
+  }, [token, fetchShoutouts, feedParams]);
+
+  const loadMoreShoutouts = async () => {
+    if (!nextCursor || loadingMore) return;
+    try {
+      setLoadingMore(true);
+      const page = await getShoutoutsPage(token, {
+        ...feedParamsRef.current,
+        cursor: nextCursor,
+      });
+      setShoutouts((prev) => {
+        const seen = new Set(prev.map((s) => s.id));
+        return [
+          ...prev,
+          ...(page.items || [])
+            .map(normalizeShoutout)
+            .filter((s) => !seen.has(s.id)),
+        ];
+      });
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      console.error("Failed to load more shoutouts:", err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  // =============== USER DIRECTORY ===============
+  // The department filter lists every department, not just those on
+  // the loaded feed pages; people are found with UserPicker instead
+  useEffect(() => {
+    if (!token) return;
+    getDepartments(token)
+      .then(setDepartments)
+      .catch((err) => console.error("Failed to load departments:", err));
   }, [token]);
 
+  // =============== LIVE UPDATES (/stream) ===============
+  // Apply small server events instead of refetching the whole feed.
+  const streamOpen = useRef(false);
+
+  useEffect(() => {
+    if (!token || typeof EventSource === "undefined") return undefined;
+
+    const updatePost = (id, fn) =>
+      setShoutouts((prev) => prev.map((s) => (s.id === id ? fn(s) : s)));
+
+    let connectedBefore = false;
+    const subscription = subscribeToFeed(token, {
+      // Only posts the current filters would return belong on this feed
+      "shoutout.created": (data) => {
+        if (!matchesFeedParams(data, feedParamsRef.current)) return;
+        setShoutouts((prev) =>
+          prev.some((s) => s.id === data.id)
+            ? prev
+            : [normalizeShoutout(data), ...prev]
+        );
+      },
+      "shoutout.deleted": ({ id }) =>
+        setShoutouts((prev) => prev.filter((s) => s.id !== id)),
+      "comment.created": ({ shoutout_id, comments_count, comment }) =>
+        updatePost(shoutout_id, (s) => ({
+          ...s,
+          comments_count,
+          comments:
+            s.comments && !s.comments.some((c) => c.id === comment.id)
+              ? [...s.comments, comment]
+              : s.comments,
+        })),
+      "comment.deleted": ({ id, shoutout_id }) =>
+        updatePost(shoutout_id, (s) => ({
+          ...s,
+          comments_count: Math.max(0, (s.comments_count || 0) - 1),
+          comments: s.comments && s.comments.filter((c) => c.id !== id),
+        })),
+      "reaction.updated": ({ shoutout_id, type, count }) =>
+        updatePost(shoutout_id, (s) => ({
+          ...s,
+          reactions: { ...s.reactions, [type]: count },
+        })),
+      "feed.invalidated": () => fetchShoutouts(),
+    }, {
+      onOpen: () => {
+        streamOpen.current = true;
+        // Events may have been missed while disconnected
+        if (connectedBefore) fetchShoutouts();
+        connectedBefore = true;
+      },
+      onDrop: () => {
+        streamOpen.current = false;
+      },
+    });
+
+    return () => {
+      streamOpen.current = false;
+      subscription.close();
+    };
+  }, [token, fetchShoutouts]);
+
   // =============== LOAD COMMENTS ===============
+  // Threads are read newest page first and shown oldest first; older
+  // pages are prepended as the reader asks for them.
   const loadComments = async (postId) => {
     try {
-      const comments = await getComments(postId, token);
+      const page = await getComments(postId, token, {
+        order: "newest",
+        limit: COMMENT_PAGE_SIZE,
+      });
       setShoutouts((prev) =>
-        prev.map((s) => (s.id === postId ? { ...s, comments } : s))
+        prev.map((s) =>
+          s.id === postId
+            ? {
+                ...s,
+                comments: [...page.items].reverse(),
+                commentsCursor: page.nextCursor,
+              }
+            : s
+        )
       );
     } catch (err) {
       console.error("Failed to fetch comments:", err);
     }
   };
 
+  const loadOlderComments = async (post) => {
+    // Only the feed's previews are loaded so far: fetch the first page
+    if (!post.commentsCursor) return loadComments(post.id);
+    try {
+      const page = await getComments(post.id, token, {
+        order: "newest",
+        limit: COMMENT_PAGE_SIZE,
+        cursor: post.commentsCursor,
+      });
+      setShoutouts((prev) =>
+        prev.map((s) => {
+          if (s.id !== post.id) return s;
+          const loaded = s.comments || [];
+          const seen = new Set(loaded.map((c) => c.id));
+          const older = [...page.items]
+            .reverse()
+            .filter((c) => !seen.has(c.id));
+          return {
+            ...s,
+            comments: [...older, ...loaded],
+            commentsCursor: page.nextCursor,
+          };
+        })
+      );
+    } catch (err) {
+      console.error("Failed to fetch older comments:", err);
+    }
+  };
+
   // =============== REPORT SHOUTOUT ===============
   const submitReport = async () => {
     if (!reportReason.trim()) return;
@@ -253,7 +491,20 @@ export default function Dashboard({
         });
       });
 
-      await addReaction(postId, { type }, token);
+      const { active, count } = await toggleReactionApi(postId, { type }, token);
+
+      // Reconcile the optimistic update with the server's state
+      setShoutouts((prev) =>
+        prev.map((s) => {
+          if (s.id !== postId) return s;
+          const my = (s.myReactions || []).filter((t) => t !== type);
+          return {
+            ...s,
+            reactions: { ...s.reactions, [type]: count },
+            myReactions: active ? [...my, type] : my,
+          };
+        })
+      );
     } catch (err) {
       console.error("Failed to toggle reaction:", err);
       if (snapshot) setShoutouts(snapshot);
@@ -282,7 +533,7 @@ export default function Dashboard({
     if (!commentText.trim()) return;
 
     try {
-      await addComment(
+      const created = await addComment(
         postId,
         {
           content: commentText.trim(),
@@ -290,6 +541,13 @@ export default function Dashboard({
         },
         token
       );
+      setShoutouts((prev) =>
+        prev.map((s) =>
+          s.id === postId
+            ? { ...s, comments_count: created.comment_count ?? s.comments_count }
+            : s
+        )
+      );
 
       await loadComments(postId);
 
@@ -310,16 +568,22 @@ export default function Dashboard({
       const query = value.slice(atIndex + 1).toLowerCase();
       setMentionQuery(query);
 
+      latestMention.current = query;
+
       if (query.length > 0) {
-        const matches = users.filter((u) =>
-          u.name.toLowerCase().includes(query)
-        );
-        setFilteredUsers(matches);
-        setShowSuggestions(matches.length > 0);
+        // Prefix search over the whole directory; drop stale responses
+        searchUsers(query, token, { limit: 8 })
+          .then((matches) => {
+            if (latestMention.current !== query) return;
+            setFilteredUsers(matches);
+            setShowSuggestions(matches.length > 0);
+          })
+          .catch((err) => console.error("User search failed:", err));
       } else {
         setShowSuggestions(false);
       }
     } else {
+      latestMention.current = "";
       setShowSuggestions(false);
       setFilteredUsers([]);
       setMentionQuery("");
@@ -351,13 +615,13 @@ export default function Dashboard({
       await createShoutout(
         {
           message: newMessage.trim(),
-          recipient_ids: newRecipients,
+          recipient_ids: newRecipients.map((u) => u.id),
         },
         token
       );
 
-      const updated = await getAllShoutouts(token);
-      setShoutouts(updated);
+      // The new post arrives via /stream; refetch only if it's down
+      if (!streamOpen.current) await fetchShoutouts();
     } catch (err) {
       console.error("Failed to post shoutout:", err);
     }
@@ -368,23 +632,19 @@ export default function Dashboard({
   };
 
   // =============== LEADERBOARD ===============
-  const leaderboard = useMemo(() => {
-    const points = {};
-
-    shoutouts.forEach((s) => {
-      const sender = s.sender?.name || "Unknown";
-      points[sender] = (points[sender] || 0) + 5;
+  // Served from server-side rollups; refreshed when the feed size changes
+  const [leaderboard, setLeaderboard] = useState([]);
 
-      (s.recipients || []).forEach(
-        (r) => (points[r.name] = (points[r.name] || 0) + 2)
-      );
-    });
-
-    return Object.entries(points)
-      .map(([name, pts]) => ({ name, pts }))
-      .sort((a, b) => b.pts - a.pts)
-      .slice(0, 5);
-  }, [shoutouts]);
+  useEffect(() => {
+    if (!token) return;
+    getLeaderboard(token, "all", 5)
+      .then((data) =>
+        setLeaderboard(
+          data.top_users.map((u) => ({ name: u.name, pts: u.points }))
+        )
+      )
+      .catch((err) => console.error("Failed to load leaderboard:", err));
+  }, [token, shoutouts.length]);
 
   // =============== DEPT COUNTS ===============
   const deptCounts = useMemo(() => {
@@ -404,51 +664,41 @@ export default function Dashboard({
 
   const closeProfile = () => setProfileUser(null);
 
-  const getProfileStats = (profileUserObj) => {
-    if (!profileUserObj || !profileUserObj.id) {
-      return {
-        sent: [],
-        received: [],
-        sentCount: 0,
-        receivedCount: 0,
-        likeCount: 0,
-        clapCount: 0,
-        starCount: 0,
-        reactionScore: 0,
-      };
-    }
+  // Counts come from the server's per-user rollups, lists are paginated
+  // per user; nothing is derived from the loaded feed
+  const [profileStats, setProfileStats] = useState(EMPTY_PROFILE_STATS);
 
-    const sent = shoutouts.filter((s) => s.sender?.id === profileUserObj.id);
-    const received = shoutouts.filter((s) =>
-      (s.recipients || []).some((r) => r.id === profileUserObj.id)
-    );
-
-    const sentCount = sent.length;
-    const receivedCount = received.length;
-
-    let likeCount = 0;
-    let clapCount = 0;
-    let starCount = 0;
+  useEffect(() => {
+    if (!token || !profileUser?.id) {
+      setProfileStats(EMPTY_PROFILE_STATS);
+      return undefined;
+    }
 
-    sent.forEach((s) => {
-      likeCount += s.reactions?.like || 0;
-      clapCount += s.reactions?.clap || 0;
-      starCount += s.reactions?.star || 0;
-    });
+    let cancelled = false;
+    Promise.all([
+      getUserStats(profileUser.id, token),
+      getUserShoutouts(profileUser.id, "sent", token),
+      getUserShoutouts(profileUser.id, "received", token),
+    ])
+      .then(([stats, sent, received]) => {
+        if (cancelled) return;
+        setProfileStats({
+          sent: sent.map(normalizeShoutout),
+          received: received.map(normalizeShoutout),
+          sentCount: stats.sent_count,
+          receivedCount: stats.received_count,
+          likeCount: stats.like_count,
+          clapCount: stats.clap_count,
+          starCount: stats.star_count,
+          reactionScore: stats.reaction_score,
+        });
+      })
+      .catch((err) => console.error("Failed to load profile stats:", err));
 
-    const reactionScore = likeCount * 1 + clapCount * 2 + starCount * 3;
-
-    return {
-      sent,
-      received,
-      sentCount,
-      receivedCount,
-      likeCount,
-      clapCount,
-      starCount,
-      reactionScore,
+    return () => {
+      cancelled = true;
     };
-  };
+  }, [profileUser, token]);
 
   // ============================================
   //                RENDER UI
@@ -498,7 +748,7 @@ export default function Dashboard({
             </div>
 
             {(() => {
-              const stats = getProfileStats(profileUser);
+              const stats = profileStats;
 
               return (
                 <div className="p-6 pt-4 space-y-6">
@@ -659,11 +909,7 @@ export default function Dashboard({
                 className="border p-2 rounded w-44"
               >
                 <option value="all">All</option>
-                {[
-                  ...new Set(
-                    users.map((u) => u.department).filter(Boolean)
-                  ),
-                ].map((dept) => (
+                {departments.map((dept) => (
                   <option key={dept} value={dept}>
                     {dept}
                   </option>
@@ -674,22 +920,26 @@ export default function Dashboard({
             {/* SENDER */}
             <div className="flex flex-col">
               <label className="text-xs text-gray-500 mb-1">Sender</label>
-              <select
-                value={filterSender}
-                onChange={(e) => setFilterSender(e.target.value)}
-                className="border p-2 rounded w-44"
-              >
-                <option value="all">All</option>
-                {[
-                  ...new Set(
-                    shoutouts.map((s) => s.sender?.name).filter(Boolean)
-                  ),
-                ].map((name) => (
-                  <option key={name} value={name}>
-                    {name}
-                  </option>
-                ))}
-              </select>
+              {filterSender === "all" ? (
+                <div className="w-44">
+                  <UserPicker
+                    token={token}
+                    placeholder="All"
+                    onPick={(u) => {
+                      setFilterSender(String(u.id));
+                      setFilterSenderName(u.name);
+                    }}
+                  />
+                </div>
+              ) : (
+                <button
+                  onClick={() => setFilterSender("all")}
+                  className="border p-2 rounded w-44 text-left text-sm bg-blue-50"
+                  title="Clear sender filter"
+                >
+                  {filterSenderName} ✕
+                </button>
+              )}
             </div>
 
             {/* DATE */}
@@ -712,12 +962,15 @@ export default function Dashboard({
           <div className="flex items-center justify-between mb-4 mt-2">
             <h2 className="text-xl font-semibold">Recognition Feed</h2>
             <span className="text-sm text-gray-500">
-              {loading ? "Loading..." : `${shoutouts.length} posts`}
+              {loading
+                ? "Loading..."
+                : `${shoutouts.length}${nextCursor ? "+" : ""} posts`}
             </span>
           </div>
 
           {/* FEED LIST */}
           <div className="space-y-4">
+            {/* Pages arrive filtered; this also screens posts pushed by /stream */}
             {shoutouts
               .filter((post) => {
                 if (
@@ -728,7 +981,7 @@ export default function Dashboard({
 
                 if (
                   filterSender !== "all" &&
-                  post.sender?.name !== filterSender
+                  String(post.sender?.id) !== filterSender
                 )
                   return false;
 
@@ -857,18 +1110,36 @@ export default function Dashboard({
                             setActivePostId(
                               post.id === activePostId ? null : post.id
                             );
-                            if (post.id !== activePostId) loadComments(post.id);
+                            // The feed embeds the latest comments; only fetch
+                            // the thread when there are more than that
+                            if (
+                              post.id !== activePostId &&
+                              (post.comments || []).length < (post.comments_count || 0)
+                            )
+                              loadComments(post.id);
                           }}
                           className="flex items-center gap-2 px-2 py-1 rounded hover:bg-gray-100 text-gray-500"
                         >
                           <MessageCircle size={18} />
-                          <span>{(post.comments || []).length}</span>
+                          <span>
+                            {post.comments_count ?? (post.comments || []).length}
+                          </span>
                         </button>
                       </div>
 
                       {/* COMMENTS */}
                       {activePostId === post.id && (
                         <div className="mt-3 border-t pt-3 space-y-2">
+                          {(post.commentsCursor ||
+                            (post.comments || []).length <
+                              (post.comments_count || 0)) && (
+                            <button
+                              onClick={() => loadOlderComments(post)}
+                              className="text-xs text-blue-600 hover:underline"
+                            >
+                              Load older comments
+                            </button>
+                          )}
                           {(post.comments || []).length === 0 ? (
                             <div className="text-xs text-gray-500">
                               No comments yet — add one!
@@ -958,6 +1229,18 @@ export default function Dashboard({
                 </article>
               ))}
           </div>
+
+          {nextCursor && (
+            <div className="flex justify-center mt-6">
+              <button
+                onClick={loadMoreShoutouts}
+                disabled={loadingMore}
+                className="px-4 py-2 bg-white border rounded-lg shadow-sm text-sm hover:bg-gray-50 disabled:opacity-50"
+              >
+                {loadingMore ? "Loading..." : "Load more"}
+              </button>
+            </div>
+          )}
         </main>
 
         {/* RIGHT PANEL */}
@@ -1113,22 +1396,34 @@ export default function Dashboard({
             />
 
             <label className="text-sm font-medium">Select Recipients:</label>
-            <select
-              multiple
-              value={newRecipients}
-              onChange={(e) =>
-                setNewRecipients(
-                  Array.from(e.target.selectedOptions, (opt) => opt.value)
-                )
-              }
-              className="w-full mt-1 border rounded p-2 mb-4"
-            >
-              {users.map((u) => (
-                <option key={u.id} value={u.id}>
-                  {u.name} ({u.department})
-                </option>
+            <div className="flex flex-wrap gap-2 mt-1 mb-2">
+              {newRecipients.map((u) => (
+                <span
+                  key={u.id}
+                  className="bg-blue-50 text-blue-700 text-xs px-2 py-1 rounded-full"
+                >
+                  {u.name}{" "}
+                  <button
+                    onClick={() =>
+                      setNewRecipients((prev) =>
+                        prev.filter((p) => p.id !== u.id)
+                      )
+                    }
+                    className="ml-1"
+                  >
+                    ✕
+                  </button>
+                </span>
               ))}
-            </select>
+            </div>
+            <div className="mb-4">
+              <UserPicker
+                token={token}
+                placeholder="Search by name, email or department"
+                excludeIds={newRecipients.map((u) => u.id)}
+                onPick={(u) => setNewRecipients((prev) => [...prev, u])}
+              />
+            </div>
 
             <div className="flex justify-end gap-3">
               <button
@@ -6,8 +6,8 @@ const authHeaders = (token) => ({
   ...(token ? { Authorization: `Bearer ${token}` } : {}),
 });
 
-// Generic fetch helper
-async function request(path, { method = "GET", token, body } = {}) {
+// Fetch and throw on error status; returns the Response
+async function send(path, { method = "GET", token, body } = {}) {
   const res = await fetch(`${API_BASE_URL}${path}`, {
     method,
     headers: authHeaders(token),
@@ -22,27 +22,49 @@ async function request(path, { method = "GET", token, body } = {}) {
     } catch (_) {}
     throw new Error(msg);
   }
+  return res;
+}
+
+// Generic fetch helper
+async function request(path, options) {
+  const res = await send(path, options);
 
   // 204 No Content
   if (res.status === 204) return null;
   return res.json();
 }
 
-// Normalise different shapes of "comments" responses
-function normalizeComments(data) {
-  if (Array.isArray(data)) return data;
-  if (Array.isArray(data?.comments)) return data.comments;
-  if (Array.isArray(data?.items)) return data.items;
-  if (Array.isArray(data?.results)) return data.results;
-  return [];
+// Admin listings are cursor-paginated: fetch one page and hand back the
+// X-Next-Cursor to pass as `cursor` for the next ("Load more")
+const LIST_PAGE_SIZE = 50;
+
+async function requestPage(path, { token, params = {} } = {}) {
+  const query = new URLSearchParams({ limit: LIST_PAGE_SIZE });
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value !== null) query.set(key, value);
+  });
+  const res = await send(`${path}?${query}`, { token });
+  const page = await res.json();
+  return {
+    items: Array.isArray(page) ? page : [],
+    nextCursor: res.headers.get("X-Next-Cursor"),
+  };
+}
+
+/* -----------------------------------------------------
+   STATS
+----------------------------------------------------- */
+
+export async function getAdminStats(token) {
+  return request("/admin/stats", { token });
 }
 
 /* -----------------------------------------------------
    REPORTS
 ----------------------------------------------------- */
 
-export async function getReports(token) {
-  return request("/admin/reports", { token });
+export async function getReports(token, params) {
+  return requestPage("/admin/reports", { token, params });
 }
 
 export async function deleteReportAdmin(reportId, token) {
@@ -67,8 +89,8 @@ export async function deleteShoutoutAdmin(shoutoutId, token) {
    USERS
 ----------------------------------------------------- */
 
-export async function getAllUsersAdmin(token) {
-  return request("/admin/users", { token });
+export async function getAllUsersAdmin(token, params) {
+  return requestPage("/admin/users", { token, params });
 }
 
 export async function updateUserRoleAdmin(userId, role, token) {
@@ -97,14 +119,12 @@ export async function deleteUserAdmin(userId, token) {
    COMMENTS
 ----------------------------------------------------- */
 
-export async function getAllCommentsAdmin(token) {
-  const data = await request("/admin/comments", { token });
-  return normalizeComments(data);
+export async function getAllCommentsAdmin(token, params) {
+  return requestPage("/admin/comments", { token, params });
 }
 
-export async function getFlaggedCommentsAdmin(token) {
-  const data = await request("/admin/comments/flagged", { token });
-  return normalizeComments(data);
+export async function getFlaggedCommentsAdmin(token, params) {
+  return requestPage("/admin/comments/flagged", { token, params });
 }
 
 export async function deleteCommentAdmin(commentId, token) {
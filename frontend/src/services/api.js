@@ -10,6 +10,11 @@ const api = axios.create({
   },
 });
 
+// Read-your-writes: after a write the backend answers with X-Read-Primary
+// (window in seconds); echo it on requests inside that window so reads
+// are served by the primary database rather than a lagging replica
+let readPrimaryUntil = 0;
+
 // Automatically attach Authorization header if access token exists
 api.interceptors.request.use(
   (config) => {
@@ -17,9 +22,23 @@ api.interceptors.request.use(
     if (token) {
       config.headers.Authorization = `Bearer ${token}`;
     }
+    if (Date.now() < readPrimaryUntil) {
+      config.headers["X-Read-Primary"] = "1";
+    }
     return config;
   },
   (error) => Promise.reject(error)
 );
 
+api.interceptors.response.use(
+  (response) => {
+    const windowSeconds = Number(response.headers["x-read-primary"]);
+    if (windowSeconds > 0) {
+      readPrimaryUntil = Date.now() + windowSeconds * 1000;
+    }
+    return response;
+  },
+  (error) => Promise.reject(error)
+);
+
 export default api;
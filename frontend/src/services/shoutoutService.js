@@ -13,12 +13,18 @@ const getConfig = (token) => {
   };
 };
 
-// --- Fetch all shoutouts ---
-export const getAllShoutouts = async (token) => {
-  const res = await api.get("/shoutouts/", getConfig(token));
+// --- Fetch shoutouts (optional filters: department, sender_id, recipient_id, since, until, q, limit, cursor) ---
+export const getAllShoutouts = async (token, params = {}) => {
+  const res = await api.get("/shoutouts/", { ...getConfig(token), params });
   return res.data;
 };
 
+// --- One feed page: returns { items, nextCursor }; pass nextCursor back as params.cursor ---
+export const getShoutoutsPage = async (token, params = {}) => {
+  const res = await api.get("/shoutouts/", { ...getConfig(token), params });
+  return { items: res.data, nextCursor: res.headers["x-next-cursor"] || null };
+};
+
 // --- Create a new shoutout ---
 export const createShoutout = async (payload, token) => {
   const res = await api.post("/shoutouts/", payload, getConfig(token));
@@ -31,6 +37,127 @@ export const addReaction = async (shoutoutId, payload, token) => {
   return res.data;
 };
 
+// --- Toggle reaction (returns { active, count }) ---
+export const toggleReaction = async (shoutoutId, payload, token) => {
+  const res = await api.post(`/reactions/${shoutoutId}/toggle`, payload, getConfig(token));
+  return res.data;
+};
+
+// --- Leaderboard (window: "week" | "month" | "all") ---
+export const getLeaderboard = async (token, window = "week", limit = 5) => {
+  const res = await api.get("/leaderboard/", {
+    ...getConfig(token),
+    params: { window, limit },
+  });
+  return res.data;
+};
+
+// --- Profile: rollup counters for one user ---
+export const getUserStats = async (userId, token) => {
+  const res = await api.get(`/users/${userId}/stats`, getConfig(token));
+  return res.data;
+};
+
+// --- Profile: shoutouts a user sent or received (direction: "sent" | "received") ---
+export const getUserShoutouts = async (userId, direction, token, params = {}) => {
+  const res = await api.get(`/users/${userId}/shoutouts`, {
+    ...getConfig(token),
+    params: { direction, ...params },
+  });
+  return res.data;
+};
+
+// --- User directory / typeahead (name, email or department prefix) ---
+export const searchUsers = async (q, token, params = {}) => {
+  const res = await api.get(`/users/`, {
+    ...getConfig(token),
+    params: { q, ...params },
+  });
+  return res.data;
+};
+
+// --- Distinct departments of active users (feed filter) ---
+export const getDepartments = async (token) => {
+  const res = await api.get(`/users/departments`, getConfig(token));
+  return res.data;
+};
+
+// --- Full-text search over shoutouts and comments ---
+// Returns { hits, nextCursor }; pass nextCursor back as params.cursor.
+export const searchAll = async (q, token, params = {}) => {
+  const res = await api.get(`/search`, {
+    ...getConfig(token),
+    params: { q, ...params },
+  });
+  return { hits: res.data, nextCursor: res.headers["x-next-cursor"] || null };
+};
+
+// --- Live feed events (Server-Sent Events) ---
+// handlers: { "shoutout.created": fn(data), ... }; options: { onOpen, onDrop }.
+// EventSource can't send headers, so each (re)connect first trades the
+// access token for a short-lived stream ticket and puts that in the URL,
+// never the access token itself. On an error the source is closed and a
+// new ticket is fetched after a backoff; a 401 for the ticket (expired
+// session) stops reconnecting. Returns { close }.
+const STREAM_RETRY_MS = 3000;
+const STREAM_MAX_RETRY_MS = 60000;
+
+export const subscribeToFeed = (token, handlers, { onOpen, onDrop } = {}) => {
+  let source = null;
+  let timer = null;
+  let closed = false;
+  let delay = STREAM_RETRY_MS;
+
+  const retry = () => {
+    if (onDrop) onDrop();
+    if (closed) return;
+    timer = setTimeout(connect, delay);
+    delay = Math.min(delay * 2, STREAM_MAX_RETRY_MS);
+  };
+
+  const connect = async () => {
+    let ticket;
+    try {
+      const res = await api.post("/stream/ticket", null, getConfig(token));
+      ticket = res.data.ticket;
+    } catch (err) {
+      if (err.response?.status === 401) {
+        if (onDrop) onDrop();
+        return;
+      }
+      retry();
+      return;
+    }
+    if (closed) return;
+
+    source = new EventSource(
+      `${api.defaults.baseURL}/stream?ticket=${encodeURIComponent(ticket)}`
+    );
+    Object.entries(handlers).forEach(([type, handler]) =>
+      source.addEventListener(type, (e) => handler(JSON.parse(e.data)))
+    );
+    source.onopen = () => {
+      delay = STREAM_RETRY_MS;
+      if (onOpen) onOpen();
+    };
+    // The browser would retry with the same (soon expired) ticket
+    source.onerror = () => {
+      source.close();
+      retry();
+    };
+  };
+
+  connect();
+
+  return {
+    close: () => {
+      closed = true;
+      clearTimeout(timer);
+      if (source) source.close();
+    },
+  };
+};
+
 // --- Add comment ---
 export const addComment = async (shoutoutId, payload, token) => {
   const res = await api.post(`/comments/${shoutoutId}`, payload, getConfig(token));
@@ -38,9 +165,14 @@ export const addComment = async (shoutoutId, payload, token) => {
 };
 
 // --- Get comments for a shoutout ---
-export const getComments = async (shoutoutId, token) => {
-  const res = await api.get(`/comments/${shoutoutId}`, getConfig(token));
-  return res.data;
+// Paginated: params { order: "oldest" | "newest", limit, cursor }.
+// Returns { items, nextCursor }; pass nextCursor back as params.cursor.
+export const getComments = async (shoutoutId, token, params = {}) => {
+  const res = await api.get(`/comments/${shoutoutId}`, {
+    ...getConfig(token),
+    params,
+  });
+  return { items: res.data, nextCursor: res.headers["x-next-cursor"] || null };
 };
 
 // --- ⭐ FLAG A COMMENT ⭐ ---